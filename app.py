@@ -5,20 +5,35 @@ import os
 import uuid
 import time
 import json
+import hashlib
+import click
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file, jsonify, abort
+from flask import (Flask, Request, Response, render_template, request, redirect, url_for, flash,
+                   send_file, jsonify, abort, stream_with_context)
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from flask_bcrypt import Bcrypt
+from sqlalchemy import or_
 from sqlalchemy.orm import DeclarativeBase
 from werkzeug.utils import secure_filename
 from werkzeug.middleware.proxy_fix import ProxyFix
 from resume_modifier.resume_parser import ResumeParser
+from resume_modifier.parse_cache import ParseCache
+from resume_modifier.parse_pool import ParsePool
+from resume_modifier.parse_revisions import RevisionStore
+from resume_modifier.keyword_cache import KeywordCache
+from resume_modifier.tfidf_extractor import TfidfExtractor
 from resume_modifier.resume_formatter import ResumeFormatter
 from resume_modifier.llm_model import LLMModel
-from resume_scoring import ResumeScorer
-from models import (db, User, ResumeTemplate, UserResume, JobApplication, 
-                   BatchProcessing, ResumeSession, ResumeAnalytics, 
+from resume_modifier.llm_registry import LLM_CLIENTS
+from resume_modifier.scoring_context import ScoringContextCache
+from resume_modifier.resume_data import ResumeData
+from resume_modifier.resume_index import ResumeIndex
+from resume_modifier.bm25 import BM25Relevance, CorpusStats
+from resume_scoring import FEATURES_VERSION, ResumeFeatures, ResumeScorer
+from models import (db, User, ResumeTemplate, UserResume, ResumeContent, ResumeScore, ResumeFeatureSet,
+                   JobApplication, BatchProcessing, ResumeSession, ResumeAnalytics, 
                    PopularKeywords, UserFeedback)
 from forms import (LoginForm, RegistrationForm, ResumeUploadForm, BatchUploadForm,
                   JobApplicationForm, ProfileForm, AdminUserForm, TemplateForm)
@@ -30,8 +45,16 @@ class Base(DeclarativeBase):
     pass
 
 
+class SpooledUploadRequest(Request):
+    """Keep uploaded files in memory unless they exceed the spill threshold"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=app.config['UPLOAD_SPILL_THRESHOLD'], mode='rb+')
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.request_class = SpooledUploadRequest
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")  # Add fallback for development
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
@@ -62,11 +85,21 @@ OUTPUT_FOLDER = os.environ.get('OUTPUT_FOLDER', tempfile.gettempdir())
 TEMPLATE_FOLDER = 'templates/resume_templates'
 ALLOWED_EXTENSIONS = {'pdf', 'docx'}
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
+UPLOAD_SPILL_THRESHOLD = int(os.environ.get('UPLOAD_SPILL_THRESHOLD', 8 * 1024 * 1024))  # 8MB
+PARSER_MAX_PAGES = int(os.environ.get('PARSER_MAX_PAGES', ResumeParser.DEFAULT_MAX_PAGES))
+PARSER_MAX_CHARS = int(os.environ.get('PARSER_MAX_CHARS', ResumeParser.DEFAULT_MAX_CHARS))
+LLM_BATCH_MODE = os.environ.get('LLM_BATCH_MODE', 'sync')  # 'sync' or 'batch' (OpenAI Batch API)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['OUTPUT_FOLDER'] = OUTPUT_FOLDER
 app.config['TEMPLATE_FOLDER'] = TEMPLATE_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
+app.config['UPLOAD_SPILL_THRESHOLD'] = UPLOAD_SPILL_THRESHOLD
+app.config['PARSER_MAX_PAGES'] = PARSER_MAX_PAGES
+app.config['PARSER_MAX_CHARS'] = PARSER_MAX_CHARS
+app.config['LLM_BATCH_MODE'] = LLM_BATCH_MODE
+
+DEFAULT_JOB_DESCRIPTION = "General professional role requiring relevant skills and experience."
 
 # Only create directories if we're not in a serverless environment
 if not os.environ.get('VERCEL'):
@@ -74,10 +107,86 @@ if not os.environ.get('VERCEL'):
     os.makedirs(OUTPUT_FOLDER, exist_ok=True)
     os.makedirs(TEMPLATE_FOLDER, exist_ok=True)
 
+# Content-addressed parse cache shared by every worker on this host
+parse_cache = ParseCache(
+    directory=os.environ.get('PARSE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'resume_parse_cache')),
+    memory_entries=int(os.environ.get('PARSE_CACHE_MEMORY_ENTRIES', 256)),
+    max_disk_bytes=int(os.environ.get('PARSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+)
+
+# Last parse of each user's resume, so a revised upload only re-parses changed lines
+revision_store = RevisionStore(
+    directory=os.environ.get('PARSE_REVISION_DIR', os.path.join(tempfile.gettempdir(), 'resume_parse_revisions')),
+    memory_entries=int(os.environ.get('PARSE_REVISION_MEMORY_ENTRIES', 512)),
+    max_disk_bytes=int(os.environ.get('PARSE_REVISION_MAX_BYTES', 64 * 1024 * 1024))
+)
+
+# Parsing runs in a bounded process pool so slow PDFs never block the worker
+parse_pool = ParsePool(
+    max_workers=int(os.environ.get('PARSE_POOL_WORKERS', 2)),
+    task_timeout=float(os.environ.get('PARSE_TASK_TIMEOUT', 30)),
+    max_tasks_per_worker=int(os.environ.get('PARSE_WORKER_MAX_TASKS', 50)),
+    parser_options={
+        'max_pages': app.config['PARSER_MAX_PAGES'],
+        'max_chars': app.config['PARSER_MAX_CHARS']
+    },
+    cache=parse_cache,
+    revisions=revision_store
+)
+
+# Job-description keywords are shared by every worker, so identical JDs
+# (e.g. every file of a batch) cost one extraction
+keyword_cache = KeywordCache(
+    path=os.environ.get('KEYWORD_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'resume_keyword_cache.sqlite3')),
+    memory_entries=int(os.environ.get('KEYWORD_CACHE_MEMORY_ENTRIES', 256)),
+    ttl=float(os.environ.get('KEYWORD_CACHE_TTL', 24 * 3600)),
+    max_entries=int(os.environ.get('KEYWORD_CACHE_MAX_ENTRIES', 10000))
+)
+
+# Corpus-wide IDF statistics for offline keyword extraction, built from the
+# stored job descriptions with `flask build-keyword-index`
+app.config['TFIDF_INDEX_DIR'] = os.environ.get(
+    'TFIDF_INDEX_DIR', os.path.join(tempfile.gettempdir(), 'resume_tfidf_index')
+)
+tfidf_extractor = TfidfExtractor.load(app.config['TFIDF_INDEX_DIR'])
+
+# Resume-side scoring text and token sets, reused when a resume is scored
+# against several job descriptions
+scoring_contexts = ScoringContextCache(max_entries=int(os.environ.get('SCORING_CONTEXT_CACHE_ENTRIES', 256)))
+
+# Inverted index of stored resume content for /api/rank; each process
+# builds it at startup and catches up from the database before answering
+# a query
+app.config['RANK_MAX_RESULTS'] = int(os.environ.get('RANK_MAX_RESULTS', 200))
+resume_index = ResumeIndex()
+
+# Stored content rows are read incrementally by id; rows this many ids
+# below the last one read are checked again, since a worker may commit a
+# row after others have committed higher ids
+app.config['CONTENT_SYNC_OVERLAP'] = int(os.environ.get('CONTENT_SYNC_OVERLAP', 1000))
+
+# Most job descriptions one /api/resume-score/<id>/rescore call may score against
+app.config['RESCORE_MAX_JOBS'] = int(os.environ.get('RESCORE_MAX_JOBS', 10))
+
+# BM25 document frequencies of the stored resume corpus for relevance
+# scoring; caught up from the database after each upload and rebuilt from
+# scratch with `flask build-relevance-stats`
+app.config['RELEVANCE_STATS_PATH'] = os.environ.get(
+    'RELEVANCE_STATS_PATH', os.path.join(tempfile.gettempdir(), 'resume_relevance_stats.npz')
+)
+app.config['RELEVANCE_STATS_SAVE_INTERVAL'] = float(os.environ.get('RELEVANCE_STATS_SAVE_INTERVAL', 60))
+relevance_model = BM25Relevance(CorpusStats.load(app.config['RELEVANCE_STATS_PATH']))
+
+# Runs keyword extraction alongside resume parsing in the upload pipeline
+pipeline_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('PIPELINE_WORKERS', 4)), thread_name_prefix='upload-pipeline'
+)
+
 # Initialize AI models with error handling
 try:
-    llm_model = LLMModel()
-    resume_scorer = ResumeScorer()
+    llm_model = LLMModel(keyword_cache=keyword_cache, tfidf_extractor=tfidf_extractor)
+    resume_scorer = ResumeScorer(llm_model=llm_model, context_cache=scoring_contexts,
+                                 relevance_model=relevance_model)
 except Exception as e:
     app.logger.error(f"Failed to initialize AI models: {str(e)}")
     llm_model = None
@@ -93,6 +202,254 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def load_upload(file, prefix):
+    """
+    Return an uploaded resume in a form the parser accepts.
+
+    Uploads up to UPLOAD_SPILL_THRESHOLD are parsed straight from memory;
+    larger ones are spilled to UPLOAD_FOLDER and the caller must remove the
+    returned spill path once parsing is done.
+
+    Returns:
+        tuple: (bytes or file path, spill path or None)
+    """
+    stream = file.stream
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+
+    if size <= app.config['UPLOAD_SPILL_THRESHOLD']:
+        return stream.read(), None
+
+    unique_filename = f"{prefix}_{secure_filename(file.filename)}"
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
+    file.save(file_path)
+    return file_path, file_path
+
+
+def parse_loaded(source, spill_path, revision_key=None):
+    """Parse a resume returned by load_upload, cleaning up any spill file afterwards"""
+    try:
+        return parse_pool.parse(source, revision_key=revision_key)
+    finally:
+        if spill_path and os.path.exists(spill_path):
+            os.remove(spill_path)
+
+
+def parse_upload(file, prefix, revision_key=None):
+    """Parse an uploaded resume, cleaning up any spill file afterwards"""
+    source, spill_path = load_upload(file, prefix)
+    return parse_loaded(source, spill_path, revision_key=revision_key)
+
+
+def save_resume_content(user_resume, resume_data):
+    """Store a saved resume's parsed content for candidate search"""
+    db.session.add(ResumeContent(resume=user_resume, content=ResumeData.coerce(resume_data).to_bytes()))
+
+
+def save_resume_score(user_resume, score_data):
+    """Store a saved resume's full score breakdown, with the ETag it is served under"""
+    breakdown = json.dumps(score_data, sort_keys=True)
+    db.session.add(ResumeScore(resume=user_resume, breakdown=breakdown,
+                               etag=hashlib.sha256(breakdown.encode('utf-8')).hexdigest()))
+
+
+def save_resume_features(user_resume, resume_data):
+    """
+    Store the job-independent scoring features of a saved resume's content.
+    
+    Like resume_contents, these describe the upload as parsed, before it
+    was tailored to its job description; the score saved with the resume
+    is of the tailored version.
+    """
+    context = resume_scorer.scoring_context(resume_data)
+    db.session.add(ResumeFeatureSet(resume=user_resume, fingerprint=context.fingerprint, version=FEATURES_VERSION,
+                                    features=resume_scorer.resume_features(context).to_json()))
+
+
+def load_resume_features(resume_id, context, feature_set):
+    """
+    Return a stored resume's features, computing and storing them when missing or outdated.
+    
+    Args:
+        resume_id (int): UserResume id
+        context (ScoringContext): Context of the resume's stored content
+        feature_set (ResumeFeatureSet): Its stored row, or None
+        
+    Returns:
+        tuple: (ResumeFeatures, whether the stored row was used)
+    """
+    if feature_set is not None and feature_set.version == FEATURES_VERSION:
+        return ResumeFeatures.from_json(feature_set.features), True
+    
+    features = resume_scorer.resume_features(context)
+    if feature_set is None:
+        feature_set = ResumeFeatureSet(resume_id=resume_id)
+        db.session.add(feature_set)
+    feature_set.fingerprint = context.fingerprint
+    feature_set.version = FEATURES_VERSION
+    feature_set.features = features.to_json()
+    db.session.commit()
+    return features, False
+
+
+def score_payload(score_data):
+    """Public fields of a score breakdown, as the score APIs serve them"""
+    payload = {
+        'overall_score': score_data.get('overall_score', 0.0),
+        'breakdown': {
+            'keyword_match': score_data.get('keyword_score', 0.0),
+            'format_quality': score_data.get('format_score', 0.0),
+            'content_depth': score_data.get('content_score', 0.0),
+            'relevance': score_data.get('relevance_score', 0.0),
+            'ats_compatibility': score_data.get('ats_score', 0.0)
+        },
+        'recommendations': score_data.get('recommendations', []),
+        'strengths': score_data.get('strengths', []),
+        'improvements': score_data.get('improvements', [])
+    }
+    if 'error' in score_data:
+        payload['error'] = score_data['error']
+    return payload
+
+
+def unsynced_content(synced_through, is_synced, chunk_size=1000):
+    """
+    Yield stored resume content rows a reader has not handled yet.
+
+    Rows above synced_through are new. Rows in the CONTENT_SYNC_OVERLAP
+    window below it are looked up by id first and returned only if
+    is_synced rejects their resume, so a row that committed after higher
+    ids were read is still picked up without re-reading the others.
+
+    Args:
+        synced_through (int): Highest content row id the reader has seen
+        is_synced (callable): resume_id -> whether the reader already has it
+        chunk_size (int): Rows fetched per round trip
+
+    Yields:
+        tuple: (content_id, resume_id, user_id, content), in content id order
+    """
+    window = db.session.query(ResumeContent.id, ResumeContent.resume_id)\
+                       .filter(ResumeContent.id > max(synced_through - app.config['CONTENT_SYNC_OVERLAP'], 0),
+                               ResumeContent.id <= synced_through)
+    late = [content_id for content_id, resume_id in window if not is_synced(resume_id)]
+    condition = ResumeContent.id > synced_through
+    if late:
+        condition = or_(condition, ResumeContent.id.in_(late))
+    query = db.session.query(ResumeContent.id, ResumeContent.resume_id, UserResume.user_id, ResumeContent.content)\
+                      .join(UserResume, UserResume.id == ResumeContent.resume_id)\
+                      .filter(condition)\
+                      .order_by(ResumeContent.id)
+    yield from query.yield_per(chunk_size)
+
+
+def sync_resume_index(chunk_size=1000):
+    """Index stored resume content this process has not seen yet, e.g. saved by another worker"""
+    chunk = []
+    for content_id, resume_id, user_id, content in unsynced_content(resume_index.synced_through,
+                                                                    resume_index.__contains__, chunk_size):
+        chunk.append((resume_id, content, user_id))
+        if len(chunk) >= chunk_size:
+            resume_index.add_many(chunk)
+            resume_index.synced_through = max(resume_index.synced_through, content_id)
+            chunk = []
+    if chunk:
+        resume_index.add_many(chunk)
+        resume_index.synced_through = max(resume_index.synced_through, content_id)
+
+
+def sync_relevance_stats(chunk_size=1000):
+    """Count stored resume content the relevance statistics have not seen, saving them periodically"""
+    corpus_stats = relevance_model.corpus_stats
+    try:
+        for content_id, resume_id, _, content in unsynced_content(corpus_stats.synced_through,
+                                                                  corpus_stats.__contains__, chunk_size):
+            corpus_stats.add(content, content_id, resume_id)
+        if corpus_stats.dirty and time.time() - corpus_stats.saved_at >= app.config['RELEVANCE_STATS_SAVE_INTERVAL']:
+            corpus_stats.save(app.config['RELEVANCE_STATS_PATH'])
+    except Exception as e:
+        app.logger.warning(f"Could not update relevance statistics: {str(e)}")
+
+
+def upload_pipeline(filename, upload, job_description, template_id, user):
+    """
+    Run the single-resume pipeline, yielding (event, payload) as each stage completes.
+
+    Stages are parsed, keywords, modified, scored and document_ready. Keyword
+    extraction only needs the job description, so it runs alongside parsing
+    and parsed and keywords are yielded in whichever order they finish.
+
+    Args:
+        filename (str): Secure name of the uploaded file
+        upload (tuple): (source, spill path) as returned by load_upload
+    """
+    started = time.time()
+    pending = {
+        pipeline_executor.submit(parse_loaded, *upload, revision_key=user.id): 'parsed',
+        pipeline_executor.submit(llm_model.parse_job_description, job_description): 'keywords'
+    }
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in [future for future in pending if future in done]:
+            if pending.pop(future) == 'parsed':
+                resume_data = future.result()
+                yield 'parsed', {
+                    'filename': filename,
+                    'name': resume_data.get('name', ''),
+                    'sections': {section: len(resume_data.get(section) or [])
+                                 for section in ('skills', 'experience', 'projects', 'education')}
+                }
+            else:
+                keywords = future.result()
+                yield 'keywords', {'keywords': keywords}
+
+    formatter = ResumeFormatter()
+    modified_resume = formatter.modify_resume(resume_data, keywords)
+    # The page never shows the extracted text, which can run to PARSER_MAX_CHARS
+    yield 'modified', {'resume': {field: value for field, value in modified_resume.items() if field != 'raw_text'}}
+
+    score_data = resume_scorer.calculate_comprehensive_score(modified_resume, job_description, json.dumps(keywords))
+    yield 'scored', score_data
+
+    output_filename = f"{uuid.uuid4().hex}_{os.path.splitext(filename)[0]}_enhanced.docx"
+    if not formatter.create_enhanced_document(modified_resume,
+                                              os.path.join(app.config['OUTPUT_FOLDER'], output_filename),
+                                              template_id):
+        raise RuntimeError("Could not generate the tailored resume document")
+
+    user_resume = UserResume(
+        user_id=user.id,
+        title=os.path.splitext(filename)[0],
+        original_filename=filename,
+        processed_filename=output_filename,
+        template_id=template_id,
+        job_description=job_description,
+        keywords_matched=json.dumps(keywords),
+        ai_score=score_data.get('overall_score', 0)
+    )
+    db.session.add(user_resume)
+    save_resume_content(user_resume, resume_data)
+    save_resume_features(user_resume, resume_data)
+    save_resume_score(user_resume, score_data)
+    user.resumes_processed += 1
+    db.session.commit()
+    resume_index.add(user_resume.id, resume_data, owner_id=user.id)
+    sync_relevance_stats()
+
+    yield 'document_ready', {
+        'resume_id': user_resume.id,
+        'output_filename': output_filename,
+        'download_url': url_for('download_file', filename=output_filename),
+        'processing_time': round(time.time() - started, 2)
+    }
+
+
+def sse_event(event, payload):
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
 # ============================================================================
 # AUTHENTICATION ROUTES
 # ============================================================================
@@ -217,31 +574,59 @@ def upload_resume():
         if not file or not allowed_file(file.filename):
              flash("Please upload a valid PDF or DOCX file.", "error")
              return redirect(url_for("upload_resume"))
-        job_description = form.job_description.data or "General professional role requiring relevant skills and experience."
+        job_description = form.job_description.data or DEFAULT_JOB_DESCRIPTION
         template_id = form.template_id.data
         try:
-             # Save uploaded file
              filename = secure_filename(file.filename)
-             unique_filename = f"{uuid.uuid4()}_{filename}"
-             file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-             file.save(file_path)
-             # Process resume (parsing, scoring, etc.) (simplified for brevity)
-             parser = ResumeParser(file_path)
-             resume_data = parser.parse_resume()
-             keywords = llm_model.parse_job_description(job_description)
-             formatter = ResumeFormatter()
-             modified_resume = formatter.modify_resume(resume_data, keywords)
-             score_data = resume_scorer.calculate_comprehensive_score(modified_resume, job_description, json.dumps(keywords))
-             # (Assume that a user resume is saved and an output file is generated, etc.)
-             # (Assume that the uploaded file is removed (cleanup) and a flash success is shown.)
+             upload = load_upload(file, uuid.uuid4())
+             results = dict(upload_pipeline(filename, upload, job_description, template_id, current_user))
+             modified_resume = results['modified']['resume']
              flash('Resume processed successfully!', 'success')
-             return render_template('result.html', resume_data=modified_resume, score_data=score_data, download_filename=output_filename, processing_time=processing_time)
+             return render_template('result.html',
+                                    modified_data=modified_resume,
+                                    job_requirements=results['keywords']['keywords'],
+                                    score_data=results['scored'],
+                                    output_filename=results['document_ready']['output_filename'],
+                                    processing_time=results['document_ready']['processing_time'])
         except Exception as e:
              flash(f"Error processing resume (or generating tailored resume): {str(e)}", "error")
              return redirect(url_for("upload_resume"))
     return render_template('upload.html', form=form, templates=templates)
 
 
+@app.route('/upload/stream', methods=['POST'])
+@login_required
+def upload_resume_stream():
+    """Run the upload pipeline, streaming each stage as a Server-Sent Event"""
+    form = ResumeUploadForm()
+    form.template_id.choices = [(t.id, t.name) for t in ResumeTemplate.query.all()]
+    
+    if not form.validate_on_submit() or not allowed_file(form.resume_file.data.filename):
+        return jsonify({'error': 'Please upload a valid PDF or DOCX file.', 'fields': form.errors}), 400
+    
+    file = form.resume_file.data
+    job_description = form.job_description.data or DEFAULT_JOB_DESCRIPTION
+    template_id = form.template_id.data
+    user = current_user._get_current_object()
+    # Read the upload now: request files are closed once this view returns
+    filename = secure_filename(file.filename)
+    upload = load_upload(file, uuid.uuid4())
+    
+    def generate():
+        # Sent at once so the response headers flush before the first stage runs
+        yield ": pipeline started\n\n"
+        try:
+            for event, payload in upload_pipeline(filename, upload, job_description, template_id, user):
+                yield sse_event(event, payload)
+        except Exception as e:
+            app.logger.error(f"Streaming upload failed: {str(e)}")
+            db.session.rollback()
+            yield sse_event('error', {'message': f"Error processing resume: {str(e)}"})
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 @app.route('/batch-upload', methods=['GET', 'POST'])
 @login_required
 @subscription_required(['premium', 'enterprise'])
@@ -269,28 +654,51 @@ def batch_upload():
             db.session.add(batch_job)
             db.session.commit()
             
-            # Process files asynchronously (simplified for demo)
+            # Parse every file straight from the request first
+            parsed_files = []
             for file in files:
                 try:
-                    # Save and process each file
                     filename = secure_filename(file.filename)
-                    unique_filename = f"{batch_id}_{filename}"
-                    file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-                    file.save(file_path)
-                    
-                    # Process resume (simplified)
-                    parser = ResumeParser(file_path)
-                    resume_data = parser.parse_resume()
-                    
-                    keywords = llm_model.parse_job_description(job_description)
+                    parsed_files.append((filename, parse_upload(file, batch_id)))
+                except Exception as e:
+                    batch_job.failed_files += 1
+            
+            # Then run the LLM work for the whole job, as one Batch API
+            # submission when batch mode is enabled
+            job_descriptions = [job_description] * len(parsed_files)
+            if app.config['LLM_BATCH_MODE'] == 'batch':
+                keyword_lists = llm_model.parse_job_descriptions(
+                    job_descriptions, metadata={'batch_id': batch_id}
+                )
+            else:
+                keyword_lists = [llm_model.parse_job_description(jd) for jd in job_descriptions]
+            
+            # Fan the results back into the per-file pipeline
+            enhanced = []
+            for (filename, resume_data), keywords in zip(parsed_files, keyword_lists):
+                try:
                     formatter = ResumeFormatter()
-                    modified_resume = formatter.modify_resume(resume_data, keywords)
-                    
-                    # Calculate score
-                    score_data = resume_scorer.calculate_comprehensive_score(
-                        modified_resume, job_description, json.dumps(keywords)
-                    )
-                    
+                    enhanced.append((filename, resume_data, keywords,
+                                     formatter.modify_resume(resume_data, keywords)))
+                except Exception as e:
+                    batch_job.failed_files += 1
+            
+            # Score the enhanced resumes together, one matrix pass per
+            # distinct keyword list (normally the whole batch)
+            score_results = [None] * len(enhanced)
+            groups = {}
+            for position, (_, _, keywords, _) in enumerate(enhanced):
+                groups.setdefault(json.dumps(keywords), []).append(position)
+            for keywords_json, positions in groups.items():
+                scores = resume_scorer.calculate_batch_scores(
+                    [enhanced[position][3] for position in positions], job_description, keywords_json
+                )
+                for position, score_data in zip(positions, scores):
+                    score_results[position] = score_data
+            
+            saved_resumes = []
+            for (filename, resume_data, keywords, _), score_data in zip(enhanced, score_results):
+                try:
                     # Save user resume
                     user_resume = UserResume(
                         user_id=current_user.id,
@@ -302,9 +710,12 @@ def batch_upload():
                         ai_score=score_data.get('overall_score', 0)
                     )
                     db.session.add(user_resume)
+                    save_resume_content(user_resume, resume_data)
+                    save_resume_features(user_resume, resume_data)
+                    save_resume_score(user_resume, score_data)
+                    saved_resumes.append((user_resume, resume_data))
                     
                     batch_job.processed_files += 1
-                    os.remove(file_path)
                     
                 except Exception as e:
                     batch_job.failed_files += 1
@@ -314,6 +725,9 @@ def batch_upload():
             batch_job.completed_at = datetime.utcnow()
             current_user.resumes_processed += batch_job.processed_files
             db.session.commit()
+            resume_index.add_many([(user_resume.id, resume_data, current_user.id)
+                                   for user_resume, resume_data in saved_resumes])
+            sync_relevance_stats()
             
             flash(f'Batch processing completed! {batch_job.processed_files} resumes processed successfully.', 'success')
             return redirect(url_for('my_resumes'))
@@ -560,24 +974,168 @@ def batch_status(batch_id):
 @app.route('/api/resume-score/<int:resume_id>')
 @login_required
 def get_resume_score(resume_id):
-    resume = UserResume.query.filter_by(id=resume_id, user_id=current_user.id).first_or_404()
-    
-    # Get detailed score breakdown
-    if resume.keywords_matched:
-        keywords = json.loads(resume.keywords_matched)
-        # Recalculate detailed score
-        # This would typically be cached
-        return jsonify({
-            'overall_score': resume.ai_score,
-            'breakdown': {
-                'keyword_match': 85,
-                'format_quality': 90,
-                'content_depth': 80,
-                'ats_compatibility': 95
-            }
-        })
-    
-    return jsonify({'error': 'Score not available'}), 404
+    """Serve the stored score breakdown; a matching If-None-Match gets a bodyless 304"""
+    stored = db.session.query(ResumeScore.etag, ResumeScore.breakdown, ResumeScore.created_at)\
+                       .join(UserResume, UserResume.id == ResumeScore.resume_id)\
+                       .filter(ResumeScore.resume_id == resume_id, UserResume.user_id == current_user.id)\
+                       .first()
+    if stored is None:
+        return legacy_resume_score(resume_id)
+    
+    if request.if_none_match.contains(stored.etag):
+        response = Response(status=304)
+    else:
+        payload = {'resume_id': resume_id, **score_payload(json.loads(stored.breakdown))}
+        payload['scored_at'] = stored.created_at.isoformat() if stored.created_at else None
+        response = jsonify(payload)
+    # Scores never change once stored, but clients must still revalidate
+    # so a deleted or reassigned resume stops being served from cache
+    response.set_etag(stored.etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def legacy_resume_score(resume_id):
+    """Answer for a resume saved before breakdowns were stored: its overall score only"""
+    resume = UserResume.query.filter_by(id=resume_id, user_id=current_user.id).first()
+    if resume is None or not resume.keywords_matched:
+        return jsonify({'error': 'Score not available'}), 404
+    
+    # The component values are the fixed ones this endpoint always served
+    # for these resumes; only the overall score was ever computed
+    response = jsonify({
+        'resume_id': resume_id,
+        'overall_score': resume.ai_score,
+        'breakdown': {
+            'keyword_match': 85,
+            'format_quality': 90,
+            'content_depth': 80,
+            'ats_compatibility': 95
+        },
+        'breakdown_stored': False
+    })
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+@app.route('/api/resume-score/<int:resume_id>/rescore', methods=['POST'])
+@login_required
+@subscription_required(['premium', 'enterprise'])
+def rescore_resume(resume_id):
+    """
+    Score one stored resume against several job descriptions in one call.
+    
+    Every job is scored against the original upload as parsed (the stored
+    resume content), not the version tailored to the resume's own job
+    description that /api/resume-score/<id> reports on, so the two can
+    differ even for the original job description. The response says so in
+    'scored_content'.
+    """
+    payload = request.get_json(silent=True) or {}
+    job_descriptions = payload.get('job_descriptions')
+    if not isinstance(job_descriptions, list) or not job_descriptions:
+        return jsonify({'error': 'job_descriptions must be a non-empty list'}), 400
+    if len(job_descriptions) > app.config['RESCORE_MAX_JOBS']:
+        return jsonify({'error': f"At most {app.config['RESCORE_MAX_JOBS']} job descriptions per call"}), 400
+    if not all(isinstance(jd, str) and jd.strip() for jd in job_descriptions):
+        return jsonify({'error': 'Every job description must be non-empty text'}), 400
+    job_descriptions = [jd.strip() for jd in job_descriptions]
+    
+    stored = db.session.query(ResumeContent.content, ResumeFeatureSet)\
+                       .join(UserResume, UserResume.id == ResumeContent.resume_id)\
+                       .outerjoin(ResumeFeatureSet, ResumeFeatureSet.resume_id == ResumeContent.resume_id)\
+                       .filter(ResumeContent.resume_id == resume_id, UserResume.user_id == current_user.id)\
+                       .first()
+    if stored is None:
+        return jsonify({'error': 'Resume content not available'}), 404
+    
+    started = time.perf_counter()
+    # Keyword extraction is the only slow step; the job descriptions share the pipeline workers
+    keyword_lists = list(pipeline_executor.map(llm_model.parse_job_description, job_descriptions))
+    
+    # The resume side is scored once (or not at all when stored); each job
+    # only adds its keyword and relevance scores
+    resume_data = ResumeData.from_bytes(stored.content)
+    context = resume_scorer.scoring_context(resume_data)
+    features, reused = load_resume_features(resume_id, context, stored.ResumeFeatureSet)
+    scores = resume_scorer.calculate_job_scores(
+        resume_data, [(jd, keywords) for jd, keywords in zip(job_descriptions, keyword_lists)],
+        context=context, features=features
+    )
+    
+    return jsonify({
+        'resume_id': resume_id,
+        'scored_content': 'original_upload',
+        'results': [{'job_index': index, 'keywords': keywords, **score_payload(score_data)}
+                    for index, (keywords, score_data) in enumerate(zip(keyword_lists, scores))],
+        'features_reused': reused,
+        'took_ms': round((time.perf_counter() - started) * 1000, 2)
+    })
+
+
+@app.route('/api/rank', methods=['POST'])
+@login_required
+@subscription_required(['enterprise'])
+def rank_resumes():
+    """Rank stored resumes against a job description (admins rank every user's resumes)"""
+    payload = request.get_json(silent=True) or {}
+    job_description = (payload.get('job_description') or '').strip()
+    if not job_description:
+        return jsonify({'error': 'job_description is required'}), 400
+    try:
+        k = min(max(int(payload.get('k', 50)), 1), app.config['RANK_MAX_RESULTS'])
+    except (TypeError, ValueError):
+        return jsonify({'error': 'k must be an integer'}), 400
+    
+    started = time.perf_counter()
+    sync_resume_index()
+    owner_id = None if current_user.is_admin else current_user.id
+    while True:
+        ranked = resume_index.search(job_description, k=k, owner_id=owner_id)
+        resumes = {resume.id: resume for resume in
+                   UserResume.query.filter(UserResume.id.in_([resume_id for resume_id, _ in ranked])).all()}
+        # Resumes deleted since they were indexed leave the index and the
+        # search is repeated, so they do not take the place of live results
+        stale = [resume_id for resume_id, _ in ranked if resume_id not in resumes]
+        if not stale:
+            break
+        resume_index.remove(stale)
+    
+    return jsonify({
+        'results': [{
+            'resume_id': resume_id,
+            'score': round(score, 4),
+            'title': resumes[resume_id].title,
+            'original_filename': resumes[resume_id].original_filename,
+            'user_id': resumes[resume_id].user_id,
+            'ai_score': resumes[resume_id].ai_score,
+            'created_at': resumes[resume_id].created_at.isoformat() if resumes[resume_id].created_at else None
+        } for resume_id, score in ranked],
+        'indexed': len(resume_index),
+        'took_ms': round((time.perf_counter() - started) * 1000, 2)
+    })
+
+
+@app.route('/api/admin/metrics')
+@login_required
+@admin_required
+def admin_metrics():
+    return jsonify({
+        'parse_cache': parse_cache.stats(),
+        'parse_pool': parse_pool.stats(),
+        'parse_revisions': revision_store.stats(),
+        'keyword_cache': keyword_cache.stats(),
+        'scoring_contexts': scoring_contexts.stats(),
+        'resume_index': resume_index.stats(),
+        'relevance': relevance_model.stats(),
+        'tfidf_index': {
+            'version': tfidf_extractor.version,
+            'documents': tfidf_extractor.document_count,
+            'terms': len(tfidf_extractor.vocabulary)
+        } if tfidf_extractor else None,
+        'llm': llm_model.stats() if llm_model else None,
+        'llm_clients': LLM_CLIENTS.stats()
+    })
 
 
 @app.route('/api/health')
@@ -657,6 +1215,50 @@ def internal_error(error):
     return render_template('errors/500.html'), 500
 
 
+# ============================================================================
+# CLI COMMANDS
+# ============================================================================
+
+def iter_stored_job_descriptions():
+    """Yield each distinct job description stored by sessions, batches and resumes"""
+    seen = set()
+    for model in (ResumeSession, BatchProcessing, UserResume):
+        query = db.session.query(model.job_description).filter(model.job_description.isnot(None))
+        for (job_description,) in query.yield_per(500):
+            # A batch's job description is also stored on each of its resumes
+            digest = hashlib.sha256(' '.join(job_description.lower().split()).encode('utf-8')).digest()
+            if job_description.strip() and digest not in seen:
+                seen.add(digest)
+                yield job_description
+
+
+@app.cli.command('build-keyword-index')
+@click.option('--min-df', default=2, show_default=True, help='Minimum documents a term must occur in')
+@click.option('--max-features', default=50000, show_default=True, help='Largest vocabulary kept')
+def build_keyword_index(min_df, max_features):
+    """Rebuild the TF-IDF keyword index from the stored job descriptions"""
+    started = time.time()
+    extractor = TfidfExtractor.build(iter_stored_job_descriptions(), min_df=min_df, max_features=max_features)
+    extractor.save(app.config['TFIDF_INDEX_DIR'])
+    print(f"Keyword index {extractor.version}: {len(extractor.vocabulary)} terms from "
+          f"{extractor.document_count} job descriptions in {time.time() - started:.2f}s "
+          f"({app.config['TFIDF_INDEX_DIR']})")
+
+
+@app.cli.command('build-relevance-stats')
+def build_relevance_stats():
+    """Recount the BM25 relevance statistics from every stored resume"""
+    started = time.time()
+    corpus_stats = CorpusStats()
+    query = db.session.query(ResumeContent.id, ResumeContent.resume_id, ResumeContent.content)\
+                      .order_by(ResumeContent.id)
+    for content_id, resume_id, content in query.yield_per(1000):
+        corpus_stats.add(content, content_id, resume_id)
+    corpus_stats.save(app.config['RELEVANCE_STATS_PATH'])
+    print(f"Relevance statistics: {len(corpus_stats.terms)} terms from {corpus_stats.document_count} "
+          f"resumes in {time.time() - started:.2f}s ({app.config['RELEVANCE_STATS_PATH']})")
+
+
 # ============================================================================
 # DATABASE INITIALIZATION
 # ============================================================================
@@ -728,6 +1330,11 @@ with app.app_context():
     db.create_all()
     create_admin_user()
     create_default_templates()
+    try:
+        # Index the stored resumes now rather than in the first /api/rank request
+        sync_resume_index()
+    except Exception as e:
+        app.logger.warning(f"Could not build the resume index at startup: {str(e)}")
 
 
 if __name__ == '__main__':
@@ -62,6 +62,9 @@ from models import ResumeSession, ResumeAnalytics, PopularKeywords, UserFeedback
 with app.app_context():
     db.create_all()
 
+# One model per worker; its OpenAI client comes from the process-wide registry
+llm = LLMModel()
+
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -107,8 +110,6 @@ def index():
                 flash('Invalid file name.', 'error')
                 return render_template('index.html')
 
-            # Initialize LLM Model
-            llm = LLMModel()
             ai_model_used = 'openai' if llm.client else 'rule-based'
 
             # Parse Job Description
@@ -0,0 +1,218 @@
+"""
+Deterministic synthetic resume corpus generator.
+
+Produces DOCX (python-docx) and PDF (minimal built-in writer) resumes with a
+configurable number of entries per section, section layout and noise, so
+parser benchmarks run on the same documents every time.
+
+Usage:
+    python benchmarks/corpus.py OUTPUT_DIR [--count 50] [--formats pdf docx]
+        [--entries 8] [--noise 0.2] [--layout summary,skills,experience,...]
+        [--seed 42]
+"""
+import argparse
+import os
+import random
+
+from docx import Document
+
+DEFAULT_LAYOUT = ("contact", "summary", "skills", "experience", "projects", "education")
+
+SECTION_HEADINGS = {
+    "contact": ("Contact", "Contact Details", "Personal Information"),
+    "summary": ("Summary", "Professional Summary", "Profile", "Objective"),
+    "skills": ("Skills", "Technical Skills", "Core Competencies"),
+    "experience": ("Experience", "Work Experience", "Professional Experience", "Employment"),
+    "projects": ("Projects", "Notable Projects", "Project Experience"),
+    "education": ("Education", "Academic Background", "Qualifications"),
+}
+
+SKILLS = (
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "SQL", "PostgreSQL",
+    "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Terraform",
+    "React", "Angular", "Node.js", "Django", "Flask", "Spark", "Kafka", "Airflow",
+    "Machine Learning", "Data Analysis", "CI/CD", "Agile", "Scrum", "GraphQL",
+)
+TITLES = ("Software Engineer", "Senior Developer", "Data Analyst", "Engineering Manager",
+          "DevOps Specialist", "Backend Engineer", "Product Analyst")
+COMPANIES = ("Acme Inc", "Globex Corporation", "Initech LLC", "Umbrella Ltd",
+             "Hooli Company", "Vandelay Industries")
+VERBS = ("Developed", "Built", "Implemented", "Created", "Designed", "Led", "Optimized")
+OBJECTS = ("a billing pipeline", "the search service", "an internal analytics platform",
+           "a mobile onboarding flow", "real-time fraud detection", "the deployment toolchain")
+OUTCOMES = ("cutting latency by {n}%", "saving {n} engineer hours a month",
+            "serving {n}k daily users", "reducing costs by {n}%")
+SCHOOLS = ("State University", "Institute of Technology", "City College")
+DEGREES = ("Bachelor of Science in Computer Science", "Master of Engineering",
+           "PhD in Statistics", "Bachelor of Arts in Economics")
+NOISE_LINES = (
+    "References available upon request", "Page {n}", "------------------------------",
+    "Curriculum Vitae", "Hobbies: hiking, chess, photography", "Languages: English, Spanish",
+    "Confidential", "Last updated {n}/2024",
+)
+
+
+def build_resume_lines(rng, entries=8, noise=0.2, layout=DEFAULT_LAYOUT):
+    """
+    Generate the text lines of one resume.
+
+    Args:
+        rng (random.Random): Seeded random source
+        entries (int): Approximate number of entries per list section
+        noise (float): Probability of injecting a noise line after each line
+        layout (tuple): Section order
+
+    Returns:
+        list: Resume text lines in document order
+    """
+    first, last = rng.choice(("Alex", "Sam", "Jordan", "Priya", "Wei")), rng.choice(("Doe", "Lee", "Khan", "Garcia"))
+    lines = [f"{first} {last}"]
+
+    for section in layout:
+        lines.append(rng.choice(SECTION_HEADINGS[section]))
+        if section == "contact":
+            lines.append(f"{first.lower()}.{last.lower()}@example.com")
+            lines.append(f"+1{rng.randint(2000000000, 9999999999)}")
+        elif section == "summary":
+            lines.append(f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience "
+                         f"{rng.choice(VERBS).lower()} {rng.choice(OBJECTS)}.")
+        elif section == "skills":
+            for _ in range(max(1, entries // 3)):
+                delimiter = rng.choice((", ", " | ", " • ", "; "))
+                lines.append(delimiter.join(rng.sample(SKILLS, 5)))
+        elif section == "experience":
+            for _ in range(entries):
+                start = rng.randint(2005, 2020)
+                lines.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} {start}-{start + rng.randint(1, 4)}")
+                lines.append(_achievement(rng))
+        elif section == "projects":
+            for _ in range(entries):
+                lines.append(f"- {_achievement(rng)}")
+        elif section == "education":
+            for _ in range(max(1, entries // 4)):
+                lines.append(f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)} {rng.randint(2000, 2020)}")
+
+    noisy = []
+    for line in lines:
+        noisy.append(line)
+        if rng.random() < noise:
+            noisy.append(rng.choice(NOISE_LINES).format(n=rng.randint(1, 12)))
+    return noisy
+
+
+def build_resume_data(rng):
+    """One parsed-resume dict, as ResumeParser returns it, with a realistic spread of section sizes."""
+    def bullet():
+        return (f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} with {rng.choice(SKILLS)} and "
+                f"{rng.choice(SKILLS)}, {rng.choice(OUTCOMES).format(n=rng.randint(5, 90))}.")
+
+    return {
+        "summary": " ".join(bullet() for _ in range(rng.randint(0, 3))),
+        "skills": rng.sample(SKILLS, rng.randint(2, 14)),
+        "experience": [f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}. "
+                       + " ".join(bullet() for _ in range(rng.randint(1, 4)))
+                       for _ in range(rng.randint(0, 6))],
+        "projects": [bullet() for _ in range(rng.randint(0, 4))],
+        "education": [f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}"] * rng.randint(0, 2),
+        "contact_info": {"email": "candidate@example.com"} if rng.random() < 0.8 else {},
+    }
+
+
+def _achievement(rng):
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 80))
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)}, {outcome}."
+
+
+def write_docx(lines, path):
+    """Write lines as DOCX paragraphs."""
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(path)
+
+
+def write_pdf(lines, path, lines_per_page=48):
+    """Write lines as a text-only PDF using the built-in Helvetica font."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    font_id = 1
+    pages_id = 2 + 2 * len(pages)
+
+    page_ids = []
+    for page_lines in pages:
+        operations = ["BT /F1 10 Tf 50 760 Td 14 TL"]
+        for line in page_lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            operations.append(f"({escaped}) Tj T*")
+        operations.append("ET")
+        stream = "\n".join(operations).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+                       % (pages_id, font_id, len(objects)))
+        page_ids.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects.append(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids)))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += (b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+               % (len(objects) + 1, len(objects), xref_offset))
+
+    with open(path, "wb") as handle:
+        handle.write(output)
+
+
+WRITERS = {"docx": write_docx, "pdf": write_pdf}
+
+
+def generate_corpus(output_dir, count=50, formats=("pdf", "docx"), entries=8, noise=0.2,
+                    layout=DEFAULT_LAYOUT, seed=42):
+    """
+    Write count resumes per format into output_dir.
+
+    Returns:
+        dict: Format name -> list of generated file paths
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    generated = {}
+    for file_format in formats:
+        # Same seed per format, so both formats carry identical content
+        rng = random.Random(seed)
+        paths = []
+        for index in range(count):
+            lines = build_resume_lines(rng, entries=entries, noise=noise, layout=layout)
+            path = os.path.join(output_dir, f"resume_{index:04d}.{file_format}")
+            WRITERS[file_format](lines, path)
+            paths.append(path)
+        generated[file_format] = paths
+    return generated
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus")
+    arg_parser.add_argument("output_dir")
+    arg_parser.add_argument("--count", type=int, default=50)
+    arg_parser.add_argument("--formats", nargs="+", choices=sorted(WRITERS), default=["pdf", "docx"])
+    arg_parser.add_argument("--entries", type=int, default=8)
+    arg_parser.add_argument("--noise", type=float, default=0.2)
+    arg_parser.add_argument("--layout", default=",".join(DEFAULT_LAYOUT))
+    arg_parser.add_argument("--seed", type=int, default=42)
+    args = arg_parser.parse_args()
+
+    generated = generate_corpus(args.output_dir, args.count, args.formats, args.entries,
+                                args.noise, tuple(args.layout.split(",")), args.seed)
+    for file_format, paths in generated.items():
+        print(f"{file_format}: {len(paths)} files in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark DOCX text extraction: streaming word/document.xml parser versus
+the python-docx object model.
+
+Peak memory comes from tracemalloc, which only sees Python allocations;
+lxml's C heap used by python-docx is not included, so its figure is a floor.
+
+Usage:
+    python benchmarks/docx_engine_bench.py [--paragraphs 5000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+from resume_modifier.docx_stream import iter_docx_text
+
+
+def build_document(paragraph_count):
+    """Build an in-memory DOCX with prose paragraphs and a skills table."""
+    doc = Document()
+    for index in range(paragraph_count):
+        if index % 50 == 0:
+            doc.add_paragraph("Professional Experience")
+        doc.add_paragraph(
+            f"Delivered project {index} using Python, Docker and PostgreSQL, "
+            f"reducing processing time by {index % 90 + 10} percent."
+        )
+        if index % 250 == 0:
+            table = doc.add_table(rows=4, cols=3)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = "Kubernetes, Terraform, AWS"
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx_lines(content):
+    """Paragraph and table-cell text through the python-docx DOM."""
+    doc = Document(BytesIO(content))
+    lines = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    lines.append(cell.text.strip())
+    return lines
+
+
+def stream_lines(content):
+    return list(iter_docx_text(BytesIO(content)))
+
+
+def measure(extract, content, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lines = extract(content)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    extract(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), len(lines), peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--paragraphs", type=int, default=5000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    content = build_document(args.paragraphs)
+    megabytes = len(content) / (1024 * 1024)
+    print(f"document: {args.paragraphs:,} paragraphs, {megabytes:.2f} MB zipped")
+
+    for name, extract in (("python-docx", python_docx_lines), ("stream", stream_lines)):
+        seconds, line_count, peak = measure(extract, content, args.repeat)
+        print(f"{name:12} {line_count / seconds:>12,.0f} lines/sec  "
+              f"{megabytes / seconds:6.2f} MB/sec  peak {peak / (1024 * 1024):6.1f} MB  "
+              f"({line_count:,} lines)")
+
+
+if __name__ == "__main__":
+    main()
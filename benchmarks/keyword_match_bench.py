@@ -0,0 +1,125 @@
+"""
+Benchmark keyword matching throughput of the compiled word-boundary
+KeywordMatcher against the per-keyword substring checks it replaced in
+ResumeScorer and ResumeFormatter.
+
+Keyword lists of several sizes are drawn from the skill taxonomy and
+matched against synthetic resume texts, once with the scoring context's
+precomputed tokens (as ResumeScorer calls it) and once from the raw text
+(as ResumeFormatter calls it). Substring hits the matcher rejects, like
+"Go" in "good", are counted as false positives of the old check.
+
+Usage:
+    python benchmarks/keyword_match_bench.py [--resumes 2000]
+        [--keywords 10 25 50 100] [--repeat 5] [--seed 42]
+        [--output keyword_match_bench.json]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import SKILLS, build_resume_data
+from resume_modifier.keyword_matcher import KeywordMatcher
+from resume_modifier.scoring_context import ScoringContext
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "resume_modifier", "data", "skill_taxonomy.json")
+# Everyday words that contain short skill names
+PROSE = ("good", "maintain", "detail", "ago", "gorgeous", "rusty", "restore", "interest",
+         "reactive", "aid", "sqlite", "expressive", "available")
+
+
+def taxonomy_terms():
+    with open(TAXONOMY_PATH, encoding="utf-8") as handle:
+        taxonomy = json.load(handle)
+    return [entry["name"] for category in ("skills", "requirements", "technologies")
+            for entry in taxonomy.get(category, [])]
+
+
+def legacy_count(keywords, text_lower):
+    """The original check: one lowercase substring search per keyword."""
+    return sum(1 for keyword in keywords if keyword.lower() in text_lower)
+
+
+def best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark word-boundary keyword matching")
+    arg_parser.add_argument("--resumes", type=int, default=2000)
+    arg_parser.add_argument("--keywords", type=int, nargs="+", default=[10, 25, 50, 100])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    arg_parser.add_argument("--output", default="keyword_match_bench.json")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    contexts = []
+    for _ in range(args.resumes):
+        resume = build_resume_data(rng)
+        resume["summary"] += " " + " ".join(rng.sample(PROSE, 3))
+        contexts.append(ScoringContext.build(resume))
+    vocabulary = list(dict.fromkeys(taxonomy_terms() + list(SKILLS)))
+
+    sizes = {}
+    for size in args.keywords:
+        keywords = rng.sample(vocabulary, min(size, len(vocabulary)))
+        start = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        legacy = best_time(lambda: [legacy_count(keywords, context.text_lower) for context in contexts],
+                           args.repeat)
+        with_tokens = best_time(lambda: [matcher.count(context.text, context.text_lower, context.tokens)
+                                         for context in contexts], args.repeat)
+        from_text = best_time(lambda: [matcher.count(context.text) for context in contexts], args.repeat)
+
+        legacy_hits = sum(legacy_count(keywords, context.text_lower) for context in contexts)
+        matcher_hits = sum(matcher.count(context.text) for context in contexts)
+        result = sizes[str(len(keywords))] = {
+            "compile_ms": round(compile_ms, 3),
+            "legacy_resumes_per_sec": round(args.resumes / legacy, 1),
+            "matcher_resumes_per_sec": round(args.resumes / with_tokens, 1),
+            "matcher_from_text_resumes_per_sec": round(args.resumes / from_text, 1),
+            "legacy_hits": legacy_hits,
+            "matcher_hits": matcher_hits,
+            "false_positive_share": round(1 - matcher_hits / legacy_hits, 3) if legacy_hits else 0.0,
+        }
+        print(f"{len(keywords):>4} keywords: legacy {result['legacy_resumes_per_sec']:>9.0f}/s  "
+              f"matcher {result['matcher_resumes_per_sec']:>9.0f}/s "
+              f"({result['matcher_resumes_per_sec'] / result['legacy_resumes_per_sec']:.2f}x)  "
+              f"from text {result['matcher_from_text_resumes_per_sec']:>8.0f}/s  "
+              f"compile {result['compile_ms']:.2f} ms  "
+              f"substring false positives {result['false_positive_share']:.1%}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "resumes": args.resumes,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "sizes": sizes,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark ResumeParser.parse_resume throughput over a synthetic corpus.
+
+Each format runs in its own spawned process so peak RSS reflects that format
+alone. Results are printed and written as JSON so runs can be compared
+across parser changes.
+
+Usage:
+    python benchmarks/parser_bench.py [--corpus-dir DIR] [--count 50]
+        [--entries 8] [--noise 0.2] [--repeat 3] [--output parser_bench.json]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import generate_corpus
+
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(percent / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _bench_format(paths, repeat, parser_options, results):
+    from resume_modifier.resume_parser import ResumeParser
+
+    baseline_rss = _peak_rss_kb()
+    latencies = []
+    failures = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            parse_start = time.perf_counter()
+            parser = ResumeParser(path, **parser_options)
+            parser.parse_resume()
+            latencies.append(time.perf_counter() - parse_start)
+            failures += parser._parse_failed
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    results.put({
+        "documents": len(latencies),
+        "failures": failures,
+        "docs_per_sec": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies) * 1000, 3),
+            "p50": round(_percentile(latencies, 50) * 1000, 3),
+            "p95": round(_percentile(latencies, 95) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+        },
+        "baseline_rss_kb": baseline_rss,
+        "peak_rss_kb": _peak_rss_kb(),
+    })
+
+
+def run_benchmark(corpus, repeat=3, parser_options=None):
+    """
+    Benchmark every format in corpus, each in a fresh process.
+
+    Args:
+        corpus (dict): Format name -> list of file paths
+        repeat (int): Passes over the corpus per format
+        parser_options (dict): Extra ResumeParser keyword arguments
+
+    Returns:
+        dict: Format name -> throughput, latency and memory figures
+    """
+    context = multiprocessing.get_context("spawn")
+    report = {}
+    for file_format, paths in corpus.items():
+        results = context.Queue()
+        process = context.Process(target=_bench_format,
+                                  args=(paths, repeat, parser_options or {}, results))
+        process.start()
+        report[file_format] = results.get()
+        process.join()
+    return report
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark resume parsing throughput")
+    arg_parser.add_argument("--corpus-dir", help="Reuse or create the corpus here (default: temp dir)")
+    arg_parser.add_argument("--formats", nargs="+", choices=["pdf", "docx"], default=["pdf", "docx"])
+    arg_parser.add_argument("--count", type=int, default=50)
+    arg_parser.add_argument("--entries", type=int, default=8)
+    arg_parser.add_argument("--noise", type=float, default=0.2)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--docx-engine", choices=["stream", "python-docx"])
+    arg_parser.add_argument("--output", default="parser_bench.json")
+    args = arg_parser.parse_args()
+
+    parser_options = {"docx_engine": args.docx_engine} if args.docx_engine else {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus = generate_corpus(args.corpus_dir or temp_dir, args.count, args.formats,
+                                 args.entries, args.noise, seed=args.seed)
+        formats = run_benchmark(corpus, args.repeat, parser_options)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {"count": args.count, "entries": args.entries, "noise": args.noise,
+                   "seed": args.seed, "repeat": args.repeat},
+        "parser_options": parser_options,
+        "formats": formats,
+    }
+
+    for file_format, result in formats.items():
+        latency = result["latency_ms"]
+        print(f"{file_format:>5}: {result['docs_per_sec']:9.1f} docs/sec  "
+              f"p50 {latency['p50']:.2f} ms  p95 {latency['p95']:.2f} ms  "
+              f"p99 {latency['p99']:.2f} ms  peak RSS {result['peak_rss_kb'] / 1024:.1f} MB  "
+              f"failures {result['failures']}")
+
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
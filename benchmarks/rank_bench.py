@@ -0,0 +1,156 @@
+"""
+Benchmark top-k candidate ranking over the resume inverted index.
+
+Indexes N synthetic resumes, then ranks them against a set of job
+descriptions with max-score pruning and with exhaustive BM25 scoring,
+checking both return the same top k. Resumes get a long-tail filler
+vocabulary on top of the corpus phrases so postings lengths follow a
+realistic Zipf spread.
+
+Usage:
+    python benchmarks/rank_bench.py [--sizes 10000 100000] [--k 50]
+        [--queries 20] [--seed 42] [--output rank_bench.json]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import SKILLS, build_resume_data
+from resume_modifier.resume_index import ResumeIndex, query_terms
+
+JOB_DESCRIPTIONS = (
+    "Senior Backend Engineer: Python, SQL and PostgreSQL; Docker and Kubernetes on AWS. "
+    "Design scalable services and mentor engineers.",
+    "Data Engineer building pipelines with Kafka, Airflow and Spark. 3+ years experience.",
+    "Frontend developer with React, TypeScript and GraphQL, focused on performance.",
+    "Engineering Manager to lead a platform team; CI/CD, Terraform and cloud infrastructure.",
+    "Machine Learning engineer: Python, TensorFlow, model deployment and analytics platform.",
+)
+FILLER_WORDS = 20000
+FILLER_PER_RESUME = 40
+
+
+def filler_lexicon(rng):
+    """Pseudo-words whose use frequency follows Zipf's law."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = ["".join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(FILLER_WORDS)]
+    weights = [1 / rank for rank in range(1, FILLER_WORDS + 1)]
+    return words, weights
+
+
+def build_documents(rng, size, lexicon):
+    words, weights = lexicon
+    documents = []
+    for resume_id in range(1, size + 1):
+        resume = build_resume_data(rng)
+        resume["summary"] += " " + " ".join(rng.choices(words, weights, k=FILLER_PER_RESUME))
+        documents.append((resume_id, resume, resume_id % 50))
+    return documents
+
+
+def build_queries(rng, count, lexicon):
+    """The fixed job descriptions, then variants with extra skills and filler words."""
+    words, weights = lexicon
+    queries = list(JOB_DESCRIPTIONS)
+    while len(queries) < count:
+        extra = rng.sample(SKILLS, 3) + rng.choices(words, weights, k=5)
+        queries.append(rng.choice(JOB_DESCRIPTIONS) + " " + ", ".join(extra))
+    return queries[:count]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def time_queries(index, weights_list, k, prune):
+    timings = []
+    results = []
+    for weights in weights_list:
+        start = time.perf_counter()
+        results.append(index.search_terms(weights, k, prune=prune))
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark inverted-index resume ranking")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    arg_parser.add_argument("--k", type=int, default=50)
+    arg_parser.add_argument("--queries", type=int, default=20)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    arg_parser.add_argument("--output", default="rank_bench.json")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    lexicon = filler_lexicon(rng)
+    queries = build_queries(rng, args.queries, lexicon)
+
+    sizes = {}
+    for size in args.sizes:
+        documents = build_documents(rng, size, lexicon)
+        index = ResumeIndex()
+
+        start = time.perf_counter()
+        index.add_many(documents[:-100])
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for document in documents[-100:]:
+            index.add(*document)
+        add_ms = (time.perf_counter() - start) * 1000 / 100
+
+        weights_list = [query_terms(query, index.skill_weight) for query in queries]
+        before = index.stats()
+        pruned_ms, pruned = time_queries(index, weights_list, args.k, prune=True)
+        after = index.stats()
+        exhaustive_ms, exhaustive = time_queries(index, weights_list, args.k, prune=False)
+
+        stats = index.stats()
+        result = sizes[str(size)] = {
+            "identical": pruned == exhaustive,
+            "bulk_index_seconds": round(build_seconds, 2),
+            "bulk_index_resumes_per_sec": round((size - 100) / build_seconds, 1),
+            "single_add_ms": round(add_ms, 3),
+            "terms": stats["terms"],
+            "postings": stats["postings"],
+            "pruned_p50_ms": round(statistics.median(pruned_ms), 2),
+            "pruned_p95_ms": round(percentile(pruned_ms, 0.95), 2),
+            "exhaustive_p50_ms": round(statistics.median(exhaustive_ms), 2),
+            "exhaustive_p95_ms": round(percentile(exhaustive_ms, 0.95), 2),
+            "postings_scanned_per_query": round(
+                (after["postings_scanned"] - before["postings_scanned"]) / len(queries)),
+            "postings_probed_per_query": round(
+                (after["postings_probed"] - before["postings_probed"]) / len(queries)),
+        }
+        print(f"N={size:>7}: index {result['bulk_index_seconds']:7.2f} s "
+              f"({result['bulk_index_resumes_per_sec']:.0f}/s), add {result['single_add_ms']:.2f} ms, "
+              f"top-{args.k} p50 {result['pruned_p50_ms']:.2f} ms / p95 {result['pruned_p95_ms']:.2f} ms "
+              f"(exhaustive p50 {result['exhaustive_p50_ms']:.2f} ms)  identical {result['identical']}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "k": args.k,
+        "queries": len(queries),
+        "seed": args.seed,
+        "sizes": sizes,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
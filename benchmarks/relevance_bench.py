@@ -0,0 +1,120 @@
+"""
+Micro-benchmark BM25 relevance against the set-overlap relevance it replaced.
+
+Builds corpus statistics from synthetic resumes, then times the relevance
+of one resume-JD pair with the old implementation (tokenize the job
+description, intersect word sets), with BM25Relevance.score (cached job
+description vector, sparse dot product) and with score_many over the
+whole pool. Statistics build, save and load times are reported too.
+
+Usage:
+    python benchmarks/relevance_bench.py [--corpus 5000] [--pairs 1000]
+        [--repeat 5] [--seed 42] [--output relevance_bench.json]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import build_resume_data
+from scoring_bench import JOB_DESCRIPTION
+from resume_modifier.bm25 import BM25Relevance, CorpusStats
+from resume_modifier.resume_data import ResumeData
+from resume_modifier.scoring_context import WORD_PATTERN, ScoringContext
+
+
+def overlap_relevance(context, job_description):
+    """The previous _calculate_relevance_score: share of JD words in the resume."""
+    job_words = set(WORD_PATTERN.findall(job_description.lower()))
+    common_words = job_words.intersection(context.tokens)
+    relevance_ratio = len(common_words) / len(job_words) if job_words else 0
+    return min(relevance_ratio * 100, 100.0)
+
+
+def best_time(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark BM25 relevance scoring")
+    arg_parser.add_argument("--corpus", type=int, default=5000)
+    arg_parser.add_argument("--pairs", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    arg_parser.add_argument("--output", default="relevance_bench.json")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    payloads = [ResumeData.from_legacy(build_resume_data(rng)).to_bytes() for _ in range(args.corpus)]
+    corpus_stats = CorpusStats()
+    start = time.perf_counter()
+    for content_id, payload in enumerate(payloads, 1):
+        corpus_stats.add(payload, content_id, resume_id=content_id)
+    build_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stats.npz")
+        save_ms = best_time(lambda: corpus_stats.save(path), args.repeat) * 1000
+        load_ms = best_time(lambda: CorpusStats.load(path), args.repeat) * 1000
+        file_bytes = os.path.getsize(path)
+
+    contexts = [ScoringContext.build(build_resume_data(rng)) for _ in range(args.pairs)]
+    warm = BM25Relevance(corpus_stats)
+    cold = BM25Relevance(corpus_stats, query_cache_entries=0)
+
+    timings = {
+        "overlap": best_time(lambda: [overlap_relevance(context, JOB_DESCRIPTION) for context in contexts],
+                             args.repeat),
+        "bm25_uncached_query": best_time(lambda: [cold.score(context, JOB_DESCRIPTION) for context in contexts],
+                                         args.repeat),
+        "bm25": best_time(lambda: [warm.score(context, JOB_DESCRIPTION) for context in contexts], args.repeat),
+        "bm25_score_many": best_time(lambda: warm.score_many(contexts, JOB_DESCRIPTION), args.repeat),
+    }
+    per_pair = {name: round(seconds / args.pairs * 1e6, 2) for name, seconds in timings.items()}
+    identical = [warm.score(context, JOB_DESCRIPTION) for context in contexts] == \
+        warm.score_many(contexts, JOB_DESCRIPTION).tolist()
+
+    print(f"Corpus stats: {args.corpus} resumes in {build_seconds:.2f} s, {len(corpus_stats.terms)} terms, "
+          f"save {save_ms:.2f} ms, load {load_ms:.2f} ms, {file_bytes} bytes")
+    for name, microseconds in per_pair.items():
+        print(f"{name:>20}: {microseconds:8.2f} us/pair  ({per_pair['overlap'] / microseconds:5.2f}x overlap)")
+    print(f"score_many identical to score: {identical}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": args.corpus,
+        "pairs": args.pairs,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "stats_build_resumes_per_sec": round(args.corpus / build_seconds, 1),
+        "stats_terms": len(corpus_stats.terms),
+        "stats_save_ms": round(save_ms, 3),
+        "stats_load_ms": round(load_ms, 3),
+        "stats_file_bytes": file_bytes,
+        "microseconds_per_pair": per_pair,
+        "score_many_identical": identical,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark re-scoring stored resumes against several job descriptions.
+
+Each resume is scored against every job description three ways:
+calculate_comprehensive_score per job with no context cache (every
+component recomputed per job), the same through a ScoringContextCache
+(tokens and resume features computed once per resume), and
+calculate_job_scores from features loaded from their stored JSON, which
+is what the rescore API runs. All three must return the same breakdowns.
+
+Usage:
+    python benchmarks/rescore_bench.py [--resumes 200] [--repeat 3]
+        [--seed 42] [--output rescore_bench.json]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import build_resume_data
+from rank_bench import JOB_DESCRIPTIONS
+from resume_modifier.llm_model import LLMModel
+from resume_modifier.scoring_context import ScoringContextCache
+from resume_scoring import ResumeFeatures, ResumeScorer
+
+
+def best_time(function, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark multi-job re-scoring of stored resumes")
+    arg_parser.add_argument("--resumes", type=int, default=200)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    arg_parser.add_argument("--output", default="rescore_bench.json")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    rng = random.Random(args.seed)
+    resumes = [build_resume_data(rng) for _ in range(args.resumes)]
+    llm_model = LLMModel()
+    jobs = [(job_description, llm_model.parse_job_description(job_description))
+            for job_description in JOB_DESCRIPTIONS]
+
+    uncached = ResumeScorer(llm_model=llm_model)
+    stored = [uncached.resume_features(uncached.scoring_context(resume)).to_json() for resume in resumes]
+
+    def per_job_uncached():
+        return [[uncached.calculate_comprehensive_score(resume, job_description, keywords)
+                 for job_description, keywords in jobs] for resume in resumes]
+
+    def per_job_cached():
+        # A fresh cache per run, so each resume is tokenized and featured once
+        scorer = ResumeScorer(llm_model=llm_model, context_cache=ScoringContextCache(max_entries=len(resumes)))
+        return [[scorer.calculate_comprehensive_score(resume, job_description, keywords)
+                 for job_description, keywords in jobs] for resume in resumes]
+
+    def job_scores_stored():
+        return [uncached.calculate_job_scores(resume, jobs, features=ResumeFeatures.from_json(features))
+                for resume, features in zip(resumes, stored)]
+
+    pairs = len(resumes) * len(jobs)
+    timings = {}
+    results = {}
+    for name, function in (("per_job_uncached", per_job_uncached), ("per_job_cached_context", per_job_cached),
+                           ("job_scores_stored_features", job_scores_stored)):
+        seconds, results[name] = best_time(function, args.repeat)
+        timings[name] = round(seconds / pairs * 1e6, 2)
+    identical = results["per_job_uncached"] == results["per_job_cached_context"] == \
+        results["job_scores_stored_features"]
+
+    for name, microseconds in timings.items():
+        print(f"{name:>27}: {microseconds:8.2f} us/pair  "
+              f"({timings['per_job_uncached'] / microseconds:5.2f}x per-job)")
+    print(f"{len(resumes)} resumes x {len(jobs)} jobs, identical: {identical}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "resumes": len(resumes),
+        "jobs": len(jobs),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "microseconds_per_pair": timings,
+        "identical": identical,
+    }
+    with open(args.output, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
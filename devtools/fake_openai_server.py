@@ -0,0 +1,278 @@
+"""
+Local stand-in for the OpenAI HTTP API, for exercising the LLM client offline.
+
+Serves POST /v1/chat/completions with a JSON object of keywords pulled from
+the prompt by the rule-based extractor, plus the files and batches
+endpoints used by the Batch API (batches complete after --batch-latency
+seconds). Latency and failures are configurable so retries, deadlines,
+concurrency limits and per-item batch fallbacks can be observed.
+
+Usage:
+    python devtools/fake_openai_server.py [--port 8011] [--latency 0.2]
+        [--fail-rate 0.1] [--fail-status 429] [--batch-latency 2] [--seed 7]
+
+    OPENAI_API_KEY=test OPENAI_BASE_URL=http://127.0.0.1:8011/v1 python main.py
+"""
+import argparse
+import email.parser
+import email.policy
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_modifier.skill_extractor import SKILL_EXTRACTOR
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Request handler; behaviour comes from the attributes of its server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        route = self.path.split("?", 1)[0].rstrip("/")
+
+        if route.endswith("/files"):
+            self._send_json(200, self._create_file(body))
+            return
+        if route.endswith("/batches"):
+            self._create_batch(json.loads(body or b"{}"))
+            return
+        if route.endswith("/cancel"):
+            self._cancel_batch(route.split("/")[-2])
+            return
+        if not route.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown route {route}", "type": "invalid_request_error"}})
+            return
+
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+            failing = server.random.random() < server.fail_rate
+        try:
+            time.sleep(server.latency)
+            if failing:
+                self._send_json(server.fail_status, {
+                    "error": {"message": "Injected failure", "type": "server_error", "code": None}
+                }, {"Retry-After": "0"})
+            else:
+                self._send_json(200, self._chat_completion(json.loads(body or b"{}")))
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def do_GET(self):
+        server = self.server
+        route = self.path.split("?", 1)[0].rstrip("/")
+        parts = route.split("/")
+        if route == "/stats":
+            with server.lock:
+                self._send_json(200, {"requests": server.requests,
+                                      "peak_in_flight": server.peak_in_flight,
+                                      "batches": len(server.batches)})
+        elif route.endswith("/content") and parts[-2] in server.files:
+            self._send_bytes(200, server.files[parts[-2]]["content"], "application/jsonl")
+        elif "batches" in parts and parts[-1] in server.batches:
+            with server.lock:
+                self._send_json(200, dict(server.batches[parts[-1]]))
+        else:
+            self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+    def _create_file(self, body):
+        """Store a multipart upload and return its file object."""
+        header = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("latin-1")
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(header + body)
+        fields = {}
+        for part in message.iter_parts():
+            fields[part.get_param("name", header="content-disposition")] = (
+                part.get_filename(), part.get_payload(decode=True)
+            )
+        filename, content = fields.get("file", ("upload.jsonl", b""))
+        return self._store_file(filename, content, fields.get("purpose", (None, b"batch"))[1].decode())
+
+    def _store_file(self, filename, content, purpose):
+        server = self.server
+        file_object = {
+            "id": f"file-{uuid.uuid4().hex[:24]}",
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed"
+        }
+        with server.lock:
+            server.files[file_object["id"]] = dict(file_object, content=content)
+        return file_object
+
+    def _create_batch(self, payload):
+        server = self.server
+        input_file = server.files.get(payload.get("input_file_id"))
+        if input_file is None:
+            self._send_json(400, {"error": {"message": "Unknown input_file_id", "type": "invalid_request_error"}})
+            return
+
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex[:24]}",
+            "object": "batch",
+            "endpoint": payload.get("endpoint"),
+            "errors": None,
+            "input_file_id": input_file["id"],
+            "completion_window": payload.get("completion_window", "24h"),
+            "status": "in_progress",
+            "output_file_id": None,
+            "error_file_id": None,
+            "created_at": int(time.time()),
+            "metadata": payload.get("metadata"),
+            "request_counts": {"total": 0, "completed": 0, "failed": 0}
+        }
+        with server.lock:
+            server.batches[batch["id"]] = batch
+        timer = threading.Timer(server.batch_latency, self._complete_batch,
+                                args=(server, batch["id"], input_file["content"]))
+        timer.daemon = True
+        timer.start()
+        self._send_json(200, batch)
+
+    def _complete_batch(self, server, batch_id, content):
+        """Answer every request line, failing a fail_rate share of them."""
+        outputs, errors = [], []
+        for line in content.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            with server.lock:
+                failing = server.random.random() < server.fail_rate
+            if failing:
+                errors.append({"id": f"batch_req_{uuid.uuid4().hex[:12]}", "custom_id": item["custom_id"],
+                               "response": None,
+                               "error": {"code": "server_error", "message": "Injected failure"}})
+            else:
+                outputs.append({"id": f"batch_req_{uuid.uuid4().hex[:12]}", "custom_id": item["custom_id"],
+                                "response": {"status_code": 200, "body": self._chat_completion(item["body"])},
+                                "error": None})
+
+        def jsonl(rows):
+            return "".join(json.dumps(row) + "\n" for row in rows).encode("utf-8")
+
+        output_file = self._store_file("output.jsonl", jsonl(outputs), "batch_output") if outputs else None
+        error_file = self._store_file("errors.jsonl", jsonl(errors), "batch_output") if errors else None
+        with server.lock:
+            batch = server.batches[batch_id]
+            if batch["status"] != "in_progress":
+                return
+            batch.update(status="completed", completed_at=int(time.time()),
+                         output_file_id=output_file and output_file["id"],
+                         error_file_id=error_file and error_file["id"],
+                         request_counts={"total": len(outputs) + len(errors),
+                                         "completed": len(outputs), "failed": len(errors)})
+
+    def _cancel_batch(self, batch_id):
+        server = self.server
+        with server.lock:
+            batch = server.batches.get(batch_id)
+            if batch is not None and batch["status"] == "in_progress":
+                batch.update(status="cancelled", cancelled_at=int(time.time()))
+        if batch is None:
+            self._send_json(404, {"error": {"message": "Unknown batch", "type": "invalid_request_error"}})
+        else:
+            self._send_json(200, dict(batch))
+
+    def _chat_completion(self, payload):
+        prompt = " ".join(str(message.get("content", "")) for message in payload.get("messages", [])
+                          if message.get("role") == "user")
+        content = json.dumps({"keywords": SKILL_EXTRACTOR.extract(prompt)})
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "gpt-4o"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                      "total_tokens": (len(prompt) + len(content)) // 4}
+        }
+
+    def _send_json(self, status, payload, headers=None):
+        self._send_bytes(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def _send_bytes(self, status, data, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8011, latency=0.0, fail_rate=0.0, fail_status=500,
+                batch_latency=1.0, seed=7, verbose=False):
+    """
+    Build a fake OpenAI server. Call serve_forever() (e.g. in a thread) to run it.
+
+    Args:
+        latency (float): Seconds every chat completion sleeps before answering
+        fail_rate (float): Probability that a chat completion or batch item fails
+        fail_status (int): HTTP status used for injected failures (429, 500, ...)
+        batch_latency (float): Seconds before a submitted batch completes
+        seed (int): Seed for the failure injection
+    """
+    server = ThreadingHTTPServer((host, port), FakeOpenAIHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.fail_rate = fail_rate
+    server.fail_status = fail_status
+    server.batch_latency = batch_latency
+    server.files = {}
+    server.batches = {}
+    server.random = random.Random(seed)
+    server.verbose = verbose
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.in_flight = 0
+    server.peak_in_flight = 0
+    return server
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Fake OpenAI-compatible API server")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8011)
+    arg_parser.add_argument("--latency", type=float, default=0.0)
+    arg_parser.add_argument("--fail-rate", type=float, default=0.0)
+    arg_parser.add_argument("--fail-status", type=int, default=500)
+    arg_parser.add_argument("--batch-latency", type=float, default=1.0)
+    arg_parser.add_argument("--seed", type=int, default=7)
+    arg_parser.add_argument("--verbose", action="store_true")
+    args = arg_parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency, args.fail_rate, args.fail_status,
+                         args.batch_latency, args.seed, args.verbose)
+    print(f"Fake OpenAI API listening on http://{args.host}:{server.server_port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -83,6 +83,54 @@ class UserResume(db.Model):
         return f'<UserResume {self.title}>'
 
 
+class ResumeContent(db.Model):
+    """Parsed content of a saved resume, kept for candidate search"""
+    __tablename__ = 'resume_contents'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    resume_id = db.Column(db.Integer, db.ForeignKey('user_resumes.id'), unique=True, nullable=False)
+    content = db.Column(db.LargeBinary, nullable=False)  # ResumeData.to_bytes()
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    resume = db.relationship('UserResume', backref=db.backref('content', uselist=False, lazy=True))
+    
+    def __repr__(self):
+        return f'<ResumeContent {self.resume_id}>'
+
+
+class ResumeScore(db.Model):
+    """Full score breakdown of a saved resume, served by /api/resume-score"""
+    __tablename__ = 'resume_scores'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    resume_id = db.Column(db.Integer, db.ForeignKey('user_resumes.id'), unique=True, nullable=False)
+    breakdown = db.Column(db.Text, nullable=False)  # JSON of ResumeScorer.calculate_comprehensive_score
+    etag = db.Column(db.String(64), nullable=False)  # SHA-256 of breakdown
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    resume = db.relationship('UserResume', backref=db.backref('score', uselist=False, lazy=True))
+    
+    def __repr__(self):
+        return f'<ResumeScore {self.resume_id}>'
+
+
+class ResumeFeatureSet(db.Model):
+    """Job-independent scoring features of a saved resume's stored content"""
+    __tablename__ = 'resume_feature_sets'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    resume_id = db.Column(db.Integer, db.ForeignKey('user_resumes.id'), unique=True, nullable=False)
+    fingerprint = db.Column(db.String(32), index=True)  # context_fingerprint of the content
+    version = db.Column(db.Integer, nullable=False)  # resume_scoring.FEATURES_VERSION
+    features = db.Column(db.Text, nullable=False)  # ResumeFeatures.to_json()
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    resume = db.relationship('UserResume', backref=db.backref('feature_set', uselist=False, lazy=True))
+    
+    def __repr__(self):
+        return f'<ResumeFeatureSet {self.resume_id}>'
+
+
 class JobApplication(db.Model):
     """Track job applications with resume versions"""
     __tablename__ = 'job_applications'
@@ -0,0 +1,299 @@
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from resume_modifier.resume_data import ResumeData
+from resume_modifier.scoring_context import WORD_PATTERN, scorable_parts, term_document_matrix
+from resume_modifier.tfidf_extractor import STOPWORDS
+
+
+def bm25_idf(document_frequency, document_count):
+    """BM25 inverse document frequency, kept non-negative for very common terms."""
+    return math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+class CorpusStats:
+    """
+    Document frequencies and average length of the stored resume corpus.
+
+    Terms get ids in first-seen order; the id -> term list and a growable
+    int32 document-frequency array are the whole table, saved together in
+    one .npz file. Resumes are counted once each, keyed by resume id,
+    and ``synced_through`` is the highest stored content row counted, so
+    any process can load the saved table and catch up from the database,
+    re-reading rows near the mark, without double counting.
+    """
+
+    def __init__(self, terms=None, document_frequency=None, document_count=0, total_length=0,
+                 synced_through=0, resume_ids=None):
+        """
+        Initialize the table.
+
+        Args:
+            terms (list): Terms in id order
+            document_frequency (numpy.ndarray): Resumes containing each term
+            document_count (int): Resumes counted
+            total_length (int): Sum of the counted resumes' lengths
+            synced_through (int): Highest stored content row counted
+            resume_ids (iterable): Ids of the resumes counted
+        """
+        self.terms = list(terms or [])
+        self._term_ids = {term: term_id for term_id, term in enumerate(self.terms)}
+        self._document_frequency = np.zeros(max(len(self.terms), 64), dtype=np.int32)
+        if document_frequency is not None:
+            self._document_frequency[:len(self.terms)] = document_frequency[:len(self.terms)]
+        self.document_count = document_count
+        self.total_length = total_length
+        self.synced_through = synced_through
+        self._resume_ids = set(resume_ids or ())
+        self.dirty = False
+        self.saved_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def average_length(self):
+        return self.total_length / self.document_count if self.document_count else 0.0
+
+    def __contains__(self, resume_id):
+        return resume_id in self._resume_ids
+
+    def document_frequency(self, term):
+        """Number of counted resumes containing term."""
+        term_id = self._term_ids.get(term)
+        return 0 if term_id is None else int(self._document_frequency[term_id])
+
+    def add(self, resume_data, content_id=None, resume_id=None):
+        """
+        Count one resume.
+
+        Args:
+            resume_data (dict | ResumeData | bytes): Parsed resume, or a
+                ResumeData.to_bytes() payload
+            content_id (int): Id of its stored content row, advancing
+                synced_through
+            resume_id (int): Id of the resume; a resume already counted is
+                skipped
+
+        Returns:
+            bool: Whether the resume was counted
+        """
+        if resume_id is not None and resume_id in self._resume_ids:
+            return False
+        if isinstance(resume_data, (bytes, memoryview)):
+            resume_data = ResumeData.from_bytes(resume_data)
+        _, text, _ = scorable_parts(resume_data)
+        words = [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS]
+
+        with self._lock:
+            # Checked again under the lock: concurrent syncs may read the
+            # same rows, and only the first to get here counts each one
+            if resume_id is not None:
+                if resume_id in self._resume_ids:
+                    return False
+                self._resume_ids.add(resume_id)
+            term_ids = []
+            for term in set(words):
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    term_id = self._term_ids[term] = len(self.terms)
+                    self.terms.append(term)
+                term_ids.append(term_id)
+            if len(self.terms) > len(self._document_frequency):
+                grown = np.zeros(2 * len(self.terms), dtype=np.int32)
+                grown[:len(self._document_frequency)] = self._document_frequency
+                self._document_frequency = grown
+            self._document_frequency[term_ids] += 1
+            self.document_count += 1
+            self.total_length += len(words)
+            if content_id is not None:
+                self.synced_through = max(self.synced_through, content_id)
+            self.dirty = True
+        return True
+
+    def save(self, path):
+        """Write the table atomically to path, one .npz holding every array."""
+        with self._lock:
+            terms = np.array(self.terms, dtype=str) if self.terms else np.array([], dtype="<U1")
+            document_frequency = self._document_frequency[:len(self.terms)].copy()
+            counters = np.array([self.document_count, self.total_length, self.synced_through], dtype=np.int64)
+            resume_ids = np.fromiter(self._resume_ids, dtype=np.int64, count=len(self._resume_ids))
+            self.dirty = False
+            self.saved_at = time.time()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as handle:
+            np.savez(handle, terms=terms, document_frequency=document_frequency, counters=counters,
+                     resume_ids=resume_ids)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a saved table.
+
+        Returns:
+            CorpusStats: The table, or an empty one if none is saved (or it
+                predates per-resume ids, so it is recounted from scratch)
+        """
+        try:
+            with np.load(path) as saved:
+                terms = saved["terms"].tolist()
+                document_frequency = saved["document_frequency"]
+                document_count, total_length, synced_through = saved["counters"].tolist()
+                resume_ids = saved["resume_ids"].tolist()
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Could not load relevance corpus stats: {e}")
+            return cls()
+        return cls(terms, document_frequency, document_count, total_length, synced_through, resume_ids)
+
+    def stats(self):
+        """Return the table size."""
+        return {
+            "documents": self.document_count,
+            "terms": len(self.terms),
+            "average_length": round(self.average_length, 1),
+            "synced_through": self.synced_through
+        }
+
+
+class BM25Relevance:
+    """
+    Resume-to-job relevance as a normalized BM25 score.
+
+    The job description is the query: its distinct non-stopword words that
+    occur in the stored resume corpus, weighted by their IDF there, form a
+    sparse vector, and a resume's relevance is the dot product with its
+    BM25 term weights.
+    Scores are scaled so a resume of average length containing every query
+    word once scores 100 (higher raw scores are capped). Until the corpus
+    holds min_documents resumes its statistics are too thin to trust:
+    every word then has the same IDF and the score reduces to saturated
+    word coverage.
+    """
+
+    def __init__(self, corpus_stats=None, k1=1.2, b=0.75, min_documents=50, query_cache_entries=128):
+        """
+        Initialize the scorer.
+
+        Args:
+            corpus_stats (CorpusStats): Corpus document frequencies (None for an empty corpus)
+            k1 (float): Term-frequency saturation
+            b (float): Document-length normalization
+            min_documents (int): Corpus size from which its statistics are used
+            query_cache_entries (int): Job description vectors kept
+        """
+        self.corpus_stats = corpus_stats or CorpusStats()
+        self.k1 = k1
+        self.b = b
+        self.min_documents = min_documents
+        self.query_cache_entries = query_cache_entries
+        self._queries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def query_vector(self, job_description):
+        """
+        The job description's query terms and IDF weights.
+
+        Vectors are cached per job description and corpus size, since every
+        resume of a batch is scored against the same one.
+
+        Returns:
+            tuple: (terms tuple, IDF weights tuple, sum of the weights)
+        """
+        stats = self.corpus_stats
+        key = (job_description, stats.document_count)
+        with self._lock:
+            vector = self._queries.get(key)
+            if vector is not None:
+                self._queries.move_to_end(key)
+                return vector
+
+        words = dict.fromkeys(word for word in WORD_PATTERN.findall(job_description.lower())
+                              if word not in STOPWORDS)
+        if self._use_corpus():
+            query = [(word, stats.document_frequency(word)) for word in words]
+            # Words no stored resume uses are posting boilerplate ("hiring",
+            # "nice") and would only dilute the score with maximal IDF
+            query = [(word, frequency) for word, frequency in query if frequency]
+            document_count = stats.document_count
+        else:
+            query = [(word, 0) for word in words]
+            document_count = 0
+        terms = tuple(term for term, _ in query)
+        weights = tuple(bm25_idf(frequency, document_count) for _, frequency in query)
+        vector = (terms, weights, sum(weights))
+        with self._lock:
+            self._queries[key] = vector
+            while len(self._queries) > self.query_cache_entries:
+                self._queries.popitem(last=False)
+        return vector
+
+    def score(self, context, job_description):
+        """
+        Relevance of one resume.
+
+        Args:
+            context (ScoringContext): The resume's scoring context
+            job_description (str): Job description text
+
+        Returns:
+            float: Relevance from 0 to 100
+        """
+        terms, weights, ideal = self.query_vector(job_description)
+        if not terms:
+            return 0.0
+
+        norm = self._length_norm(context.word_count())
+        token_counts = context.token_counts
+        total = 0.0
+        for term, weight in zip(terms, weights):
+            frequency = token_counts.get(term)
+            if frequency:
+                total += frequency * (self.k1 + 1) / (frequency + norm) * weight
+        return min(total / ideal * 100, 100.0)
+
+    def score_many(self, contexts, job_description):
+        """
+        Relevance of many resumes as one sparse matrix-vector product.
+
+        Gives the same values as score for each context.
+
+        Returns:
+            numpy.ndarray: Relevance from 0 to 100 per context
+        """
+        terms, weights, ideal = self.query_vector(job_description)
+        if not terms:
+            return np.zeros(len(contexts))
+
+        matrix, _ = term_document_matrix(contexts, {term: column for column, term in enumerate(terms)})
+        matrix.sort_indices()
+        lengths = np.fromiter((context.word_count() for context in contexts),
+                              dtype=np.float64, count=len(contexts))
+        norms = self._length_norm(lengths)
+        # Turn the counts into BM25 term weights in place
+        rows = np.repeat(np.arange(len(contexts)), np.diff(matrix.indptr))
+        matrix.data = matrix.data * (self.k1 + 1) / (matrix.data + norms[rows])
+        return np.minimum(matrix @ np.array(weights) / ideal * 100, 100.0)
+
+    def _use_corpus(self):
+        return self.corpus_stats.document_count >= max(self.min_documents, 1)
+
+    def _length_norm(self, length):
+        if not self._use_corpus():
+            # Every resume counts as average length
+            return self.k1 if np.isscalar(length) else np.full(len(length), self.k1)
+        return self.k1 * (1 - self.b + self.b * length / self.corpus_stats.average_length)
+
+    def stats(self):
+        """Return the corpus table size and cached query count."""
+        stats = self.corpus_stats.stats()
+        stats["cached_queries"] = len(self._queries)
+        return stats
@@ -0,0 +1,85 @@
+import logging
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After failure_threshold failures in a row the breaker opens and calls
+    are skipped for cooldown seconds. The first call after the cool-down is
+    let through as a probe: success closes the breaker, failure opens it for
+    another cool-down.
+    """
+
+    def __init__(self, name, failure_threshold=5, cooldown=30.0):
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            name (str): Name used in logs
+            failure_threshold (int): Consecutive failures that open the breaker
+            cooldown (float): Seconds the breaker stays open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._counters = {"opened": 0, "short_circuited": 0}
+
+    def allow(self):
+        """Return True if a call may go ahead now."""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self._state = HALF_OPEN
+                self._probing = False
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            if self._state == CLOSED:
+                return True
+            self._counters["short_circuited"] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                logging.info(f"Circuit breaker '{self.name}' closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED
+                                            and self._failures >= self.failure_threshold):
+                if self._state == CLOSED:
+                    logging.warning(f"Circuit breaker '{self.name}' opened after "
+                                    f"{self._failures} consecutive failures")
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+                self._counters["opened"] += 1
+
+    def record_abandoned(self):
+        """Record a call that ended without an outcome (e.g. cancelled), freeing the probe slot."""
+        with self._lock:
+            self._probing = False
+
+    def stats(self):
+        """Return the current state and counters."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["state"] = self._state
+            stats["consecutive_failures"] = self._failures
+        return stats
@@ -0,0 +1,81 @@
+import zipfile
+import xml.etree.ElementTree as ET
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_NS = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+PARAGRAPH = f'{W_NS}p'
+TEXT = f'{W_NS}t'
+TAB = f'{W_NS}tab'
+BREAKS = (f'{W_NS}br', f'{W_NS}cr')
+BODY = f'{W_NS}body'
+TABLE_ROW = f'{W_NS}tr'
+# Legacy renderings of drawing content that duplicate the primary choice
+FALLBACK = f'{MC_NS}Fallback'
+
+
+def iter_docx_text(stream):
+    """
+    Yield paragraph text from a DOCX file in document order.
+
+    The main document part is read with iterparse and every element is
+    cleared as soon as it has been consumed, so memory stays constant in the
+    size of the document. Paragraphs inside table cells and text boxes are
+    emitted like any other paragraph.
+
+    Args:
+        stream: Path or binary file object of the DOCX file
+
+    Yields:
+        str: Stripped, non-empty paragraph text
+    """
+    with zipfile.ZipFile(stream) as archive:
+        with archive.open('word/document.xml') as document_xml:
+            yield from _iter_document_xml(document_xml)
+
+
+def _iter_document_xml(document_xml):
+    body = None
+    depth = 0
+    fallback_depth = 0
+    paragraphs = []
+
+    for event, elem in ET.iterparse(document_xml, events=('start', 'end')):
+        tag = elem.tag
+
+        if event == 'start':
+            depth += 1
+            if tag == FALLBACK:
+                fallback_depth += 1
+            elif tag == PARAGRAPH:
+                # Text boxes nest paragraphs inside runs, so keep a stack
+                paragraphs.append([])
+            elif tag == BODY:
+                body = elem
+            continue
+
+        depth -= 1
+        if tag == PARAGRAPH:
+            text = ''.join(paragraphs.pop()).strip()
+            if text and not fallback_depth:
+                yield text
+            elem.clear()
+        elif tag == FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == TEXT:
+            if elem.text and paragraphs:
+                paragraphs[-1].append(elem.text)
+        elif tag == TAB:
+            if paragraphs:
+                paragraphs[-1].append('\t')
+        elif tag in BREAKS:
+            if paragraphs:
+                paragraphs[-1].append('\n')
+        elif tag == TABLE_ROW:
+            elem.clear()
+
+        # Drop finished top-level blocks so the tree never grows with the document
+        if body is not None and depth == 2:
+            body.clear()
@@ -0,0 +1,153 @@
+import logging
+import math
+import re
+from collections import namedtuple
+
+from resume_modifier.skill_extractor import SKILL_EXTRACTOR
+
+try:
+    import tiktoken
+except ImportError:  # optional; token counts fall back to an estimate
+    tiktoken = None
+
+HEADER_PATTERN = re.compile(r'^\s*(?:[#*\-•]+\s*)?([A-Za-z][A-Za-z &/\'-]{1,60}?)\s*:?\s*$')
+WORD_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Section headers and phrases typical of low-signal boilerplate
+BOILERPLATE_HEADERS = ("benefits", "perks", "what we offer", "about us", "about the company",
+                       "who we are", "our culture", "equal opportunity", "eeo", "compensation",
+                       "salary", "how to apply", "privacy", "disclaimer", "why join")
+BOILERPLATE_CUES = ("equal opportunity", "without regard to", "race", "religion", "gender identity",
+                    "sexual orientation", "national origin", "veteran", "disability",
+                    "accommodation", "401(k)", "401k", "dental", "vision", "health insurance",
+                    "paid time off", "pto", "parental leave", "wellness", "perks", "salary range",
+                    "compensation", "privacy", "e-verify", "background check", "apply now",
+                    "we are proud", "our mission", "founded in")
+# Section headers and phrases that carry the requirements
+SIGNAL_HEADERS = ("requirements", "qualifications", "responsibilities", "skills", "what you",
+                  "you will", "you have", "experience", "must have", "nice to have", "role",
+                  "the job", "duties", "tech stack")
+SIGNAL_CUES = ("experience", "proficient", "knowledge of", "familiar", "degree", "years",
+               "responsible for", "you will", "ability to", "required", "preferred", "must")
+
+# Smallest remainder of the budget worth filling with a truncated section
+MIN_SECTION_TOKENS = 16
+
+PreparedPrompt = namedtuple("PreparedPrompt",
+                            ["text", "original_tokens", "tokens", "tokens_saved", "dropped_sections"])
+JDSection = namedtuple("JDSection", ["header", "text", "score"])
+
+
+class JDPreprocessor:
+    """
+    Trims a job description to its high-signal sections before an LLM call.
+
+    The text is split into header-delimited sections, each scored by a
+    cheap cue-based classifier (taxonomy hits and requirement phrases count
+    for a section, benefits and EEO phrases against it). Boilerplate
+    sections are dropped and the rest is cut to a token budget, keeping
+    the best-scoring sections in their original order.
+    """
+
+    def __init__(self, token_budget=1500, model="gpt-4o"):
+        """
+        Initialize the preprocessor.
+
+        Args:
+            token_budget (int): Maximum prompt tokens for the job description
+            model (str): Model whose tokenizer is used when tiktoken is installed
+        """
+        self.token_budget = token_budget
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except Exception as e:
+                logging.debug(f"tiktoken unavailable for {model}, estimating tokens: {e}")
+
+    def count_tokens(self, text):
+        """Token count of text (estimated when tiktoken is not installed)."""
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        # Roughly one token per four characters of a word, one per punctuation mark
+        return sum(math.ceil(len(piece) / 4) for piece in WORD_PATTERN.findall(text))
+
+    def split_sections(self, job_description):
+        """Split a job description into header-delimited, scored sections."""
+        sections = []
+        header, lines = "", []
+        for line in (job_description or "").splitlines():
+            match = HEADER_PATTERN.match(line)
+            if match and (line.rstrip().endswith(":") or line.strip().isupper() or line.lstrip().startswith("#")):
+                if lines:
+                    sections.append(self._section(header, lines))
+                header, lines = match.group(1).strip(), []
+            elif line.strip():
+                lines.append(line.strip())
+        if lines or header:
+            sections.append(self._section(header, lines))
+        return sections
+
+    def prepare(self, job_description):
+        """
+        Drop boilerplate and cut the job description to the token budget.
+
+        Returns:
+            PreparedPrompt: Trimmed text with token counts before and after
+        """
+        original_tokens = self.count_tokens(job_description or "")
+        sections = self.split_sections(job_description)
+        kept = [section for section in sections if section.score >= 0] or sections
+
+        # Spend the budget on the strongest sections, then restore document
+        # order; the first section that does not fit is cut to what is left
+        chosen = {}
+        remaining = self.token_budget
+        for index in sorted(range(len(kept)), key=lambda i: -kept[i].score):
+            rendered = self._render(kept[index])
+            tokens = self.count_tokens(rendered)
+            if tokens > remaining:
+                if remaining >= MIN_SECTION_TOKENS or not chosen:
+                    chosen[index] = self._truncate(rendered, remaining)
+                break
+            chosen[index] = rendered
+            remaining -= tokens
+        parts = [chosen[index] for index in sorted(chosen)]
+
+        text = "\n\n".join(parts)
+        tokens = self.count_tokens(text)
+        return PreparedPrompt(text, original_tokens, tokens, max(original_tokens - tokens, 0),
+                              len(sections) - len(parts))
+
+    def _section(self, header, lines):
+        text = "\n".join(lines)
+        return JDSection(header, text, self._score(header, text))
+
+    @staticmethod
+    def _render(section):
+        return f"{section.header}:\n{section.text}" if section.header else section.text
+
+    @staticmethod
+    def _score(header, text):
+        """Positive for requirement-bearing sections, negative for boilerplate."""
+        header_lower = header.lower()
+        text_lower = text.lower()
+        score = 3 * sum(cue in header_lower for cue in SIGNAL_HEADERS)
+        score -= 4 * sum(cue in header_lower for cue in BOILERPLATE_HEADERS)
+        score += len(SKILL_EXTRACTOR.extract(text, limit=50))
+        score += sum(cue in text_lower for cue in SIGNAL_CUES)
+        score -= 2 * sum(cue in text_lower for cue in BOILERPLATE_CUES)
+        return score
+
+    def _truncate(self, text, budget):
+        if self._encoding is not None:
+            return self._encoding.decode(self._encoding.encode(text)[:budget])
+        pieces = []
+        used = 0
+        for match in re.finditer(r"\S+\s*", text):
+            cost = self.count_tokens(match.group())
+            if used + cost > budget:
+                break
+            pieces.append(match.group())
+            used += cost
+        return "".join(pieces).rstrip()
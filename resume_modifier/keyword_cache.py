@@ -0,0 +1,299 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class KeywordCache:
+    """
+    Cache of job-description keyword extraction results.
+
+    Entries are keyed by a hash of the normalized job description plus the
+    extractor version (model name or rule-set revision). Lookups go through
+    an in-process LRU first and then a SQLite database shared by every
+    gunicorn worker on the host. Concurrent misses for the same key are
+    coalesced: one caller computes while the others wait for its result,
+    within a process through an event and across processes through a lease
+    row in the database.
+    """
+
+    def __init__(self, path=None, memory_entries=256, ttl=24 * 3600, max_entries=10000,
+                 lease_timeout=60):
+        """
+        Initialize the keyword cache.
+
+        Args:
+            path (str): SQLite database file for the shared tier (None disables it)
+            memory_entries (int): Maximum number of entries kept in process
+            ttl (float): Seconds an entry stays valid
+            max_entries (int): Size budget for the shared tier
+            lease_timeout (float): Seconds another process may hold a key
+                before waiters stop waiting and compute it themselves
+        """
+        self.path = path
+        self.memory_entries = memory_entries
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lease_timeout = lease_timeout
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._instance = uuid.uuid4().hex
+        self._counters = {
+            "memory_hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0
+        }
+
+        if self.path:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._create_tables()
+            except (OSError, sqlite3.Error) as e:
+                logging.warning(f"Keyword cache database unavailable, using memory only: {e}")
+                self.path = None
+
+    @staticmethod
+    def make_key(job_description, version):
+        """Build the cache key for a job description and extractor version."""
+        normalized = WHITESPACE_PATTERN.sub(' ', job_description or '').strip().lower()
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return f"{digest}-{version}"
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached keywords for key, computing them at most once.
+
+        Args:
+            key (str): Key from make_key
+            compute (callable): Returns (keywords, cacheable); results marked
+                not cacheable (e.g. degraded fallbacks) are returned but not stored
+
+        Returns:
+            list: Extracted keywords
+        """
+        while True:
+            keywords = self._get_memory(key)
+            if keywords is not None:
+                return keywords
+
+            with self._lock:
+                event = self._inflight.get(key)
+                leader = event is None
+                if leader:
+                    event = self._inflight[key] = threading.Event()
+                else:
+                    self._counters["coalesced"] += 1
+
+            if not leader:
+                # Another thread is computing this key; retry once it is done
+                event.wait(self.lease_timeout)
+                continue
+
+            try:
+                return self._lead(key, compute)
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+                event.set()
+
+    def get(self, key):
+        """Return the cached keywords for key without computing, or None."""
+        keywords = self._get_memory(key)
+        if keywords is None:
+            keywords = self._get_shared(key)
+        if keywords is None:
+            with self._lock:
+                self._counters["misses"] += 1
+        return keywords
+
+    def set(self, key, keywords):
+        """Store keywords computed outside get_or_compute (e.g. by a batch job)."""
+        with self._lock:
+            self._remember(key, keywords, time.time() + self.ttl)
+        self._set_shared(key, keywords)
+
+    def stats(self):
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+        stats["shared_entries"] = self._count_shared()
+        lookups = stats["memory_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _lead(self, key, compute):
+        """Resolve a key as the only thread in this process working on it."""
+        keywords = self._get_shared(key)
+        if keywords is not None:
+            return keywords
+
+        # Coordinate with other processes: wait while someone else holds the lease
+        deadline = time.monotonic() + self.lease_timeout
+        while not self._acquire_lease(key):
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+            keywords = self._get_shared(key)
+            if keywords is not None:
+                with self._lock:
+                    self._counters["coalesced"] += 1
+                return keywords
+
+        try:
+            with self._lock:
+                self._counters["misses"] += 1
+            keywords, cacheable = compute()
+            if cacheable:
+                with self._lock:
+                    self._remember(key, keywords, time.time() + self.ttl)
+                self._set_shared(key, keywords)
+            return keywords
+        finally:
+            self._release_lease(key)
+
+    def _get_memory(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            keywords, expires = entry
+            if expires <= time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            self._counters["memory_hits"] += 1
+            return list(keywords)
+
+    def _remember(self, key, keywords, expires):
+        """Insert into the in-process LRU. Caller holds the lock."""
+        self._memory[key] = (list(keywords), expires)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    @property
+    def _owner(self):
+        # Forked workers inherit the instance, so the pid tells them apart
+        return f"{self._instance}-{os.getpid()}"
+
+    def _connection(self):
+        """One connection per thread and process; sqlite3 connections are not shareable."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _create_tables(self):
+        conn = self._connection()
+        conn.execute("CREATE TABLE IF NOT EXISTS keyword_cache ("
+                     "key TEXT PRIMARY KEY, keywords TEXT NOT NULL, "
+                     "expires REAL NOT NULL, accessed REAL NOT NULL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS keyword_cache_lease ("
+                     "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_keyword_cache_accessed "
+                     "ON keyword_cache (accessed)")
+
+    def _get_shared(self, key):
+        if not self.path:
+            return None
+        now = time.time()
+        try:
+            conn = self._connection()
+            row = conn.execute("SELECT keywords, expires FROM keyword_cache WHERE key = ?",
+                               (key,)).fetchone()
+            if row is None or row[1] <= now:
+                return None
+            conn.execute("UPDATE keyword_cache SET accessed = ? WHERE key = ?", (now, key))
+            keywords = json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Could not read keyword cache entry: {e}")
+            return None
+
+        with self._lock:
+            self._counters["shared_hits"] += 1
+            self._remember(key, keywords, row[1])
+        return list(keywords)
+
+    def _set_shared(self, key, keywords):
+        if not self.path:
+            return
+        now = time.time()
+        try:
+            conn = self._connection()
+            conn.execute("INSERT OR REPLACE INTO keyword_cache (key, keywords, expires, accessed) "
+                         "VALUES (?, ?, ?, ?)", (key, json.dumps(keywords), now + self.ttl, now))
+            count = conn.execute("SELECT COUNT(*) FROM keyword_cache").fetchone()[0]
+            if count > self.max_entries:
+                self._evict_shared(conn, count, now)
+        except sqlite3.Error as e:
+            logging.warning(f"Could not write keyword cache entry: {e}")
+
+    def _evict_shared(self, conn, count, now):
+        """Drop expired entries, then least recently used ones down to 90% of budget."""
+        evicted = conn.execute("DELETE FROM keyword_cache WHERE expires <= ?", (now,)).rowcount
+        excess = count - evicted - int(self.max_entries * 0.9)
+        if excess > 0:
+            evicted += conn.execute(
+                "DELETE FROM keyword_cache WHERE key IN "
+                "(SELECT key FROM keyword_cache ORDER BY accessed LIMIT ?)", (excess,)
+            ).rowcount
+        with self._lock:
+            self._counters["evictions"] += evicted
+
+    def _count_shared(self):
+        if not self.path:
+            return 0
+        try:
+            return self._connection().execute("SELECT COUNT(*) FROM keyword_cache").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def _acquire_lease(self, key):
+        """Claim key for this process unless another live lease holds it."""
+        if not self.path:
+            return True
+        now = time.time()
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT owner, expires FROM keyword_cache_lease WHERE key = ?",
+                                   (key,)).fetchone()
+                if row is not None and row[0] != self._owner and row[1] > now:
+                    return False
+                conn.execute("INSERT OR REPLACE INTO keyword_cache_lease (key, owner, expires) "
+                             "VALUES (?, ?, ?)", (key, self._owner, now + self.lease_timeout))
+            finally:
+                conn.execute("COMMIT")
+            return True
+        except sqlite3.Error as e:
+            # Coordination is best effort; compute rather than fail the request
+            logging.warning(f"Could not acquire keyword cache lease: {e}")
+            return True
+
+    def _release_lease(self, key):
+        if not self.path:
+            return
+        try:
+            self._connection().execute("DELETE FROM keyword_cache_lease WHERE key = ? AND owner = ?",
+                                       (key, self._owner))
+        except sqlite3.Error as e:
+            logging.warning(f"Could not release keyword cache lease: {e}")
@@ -0,0 +1,145 @@
+import re
+import threading
+from collections import OrderedDict
+
+from resume_modifier.scoring_context import WORD_PATTERN
+from resume_modifier.skill_extractor import SKILL_EXTRACTOR, SYMBOL_SUFFIX
+
+MATCHER_CACHE_ENTRIES = 256
+WORD_CHAR = re.compile(r"\w")
+
+
+def keyword_key(keyword):
+    """Lowercase, single-spaced form keywords are matched and compared by."""
+    return " ".join(str(keyword).lower().split())
+
+
+def _escape(char):
+    # Multi-word keywords match across any run of whitespace
+    return r"\s+" if char == " " else re.escape(char)
+
+
+class KeywordMatcher:
+    """
+    Precompiled word-boundary matcher for a list of job keywords.
+
+    A keyword only matches as whole words: "Go" is not found in "good",
+    "AI" in "maintain" nor "C" in "C++" or "C#", and keywords the skill
+    taxonomy marks case-sensitive (Go, AI, REST, ...) must also match its
+    capitalization. Plain single-word keywords match exactly when they are
+    one of the text's word tokens, so one tokenization pass (usually the
+    one the caller already has, ScoringContext.tokens) finds all of them
+    with set lookups. The remaining phrases (multi-word, punctuated,
+    case-sensitive or symbol-prefix keywords such as "Machine Learning",
+    "CI/CD", "Go" or "C")
+    are precompiled into one regex each, and a phrase is only searched
+    for when every word of it is among the tokens, which rules out almost
+    all of them before any scan.
+    """
+
+    def __init__(self, keywords, extractor=SKILL_EXTRACTOR):
+        """
+        Compile the matcher.
+
+        Args:
+            keywords (list): Keywords to look for, in the caller's order
+            extractor (SkillExtractor): Taxonomy giving case-sensitive spellings
+        """
+        self.keywords = list(keywords)
+        self._keys = [keyword_key(keyword) for keyword in self.keywords]
+        keys = dict.fromkeys(key for key in self._keys if key)
+
+        # Tokenization splits "C++" and "C#" into the token "c", so a word
+        # with a symbol-suffixed sibling must be searched for as a phrase
+        symbol_stems = {match.group(1) for match in map(SYMBOL_SUFFIX.fullmatch, keys) if match}
+
+        self._phrases = []
+        words = []
+        for key in keys:
+            exact = extractor.exact_case(key)
+            if (exact is None and WORD_PATTERN.fullmatch(key)
+                    and key not in symbol_stems and not extractor.has_symbol_variant(key)):
+                words.append(key)
+                continue
+            # Searched in the lowercased text; the preceding word boundary is
+            # checked per match, since a leading lookbehind would defeat the
+            # regex engine's literal-prefix search. A trailing word character
+            # may not be followed by + or # either ("c" is not in "c++")
+            end_guard = r"(?![\w+#])" if WORD_CHAR.match(key[-1]) else r"(?!\w)"
+            pattern = re.compile("".join(_escape(char) for char in key) + end_guard)
+            self._phrases.append((key, frozenset(WORD_PATTERN.findall(key)), pattern, exact))
+        self._word_keys = frozenset(words)
+
+    def find(self, text, text_lower=None, tokens=None):
+        """
+        Find the keywords in text.
+
+        Args:
+            text (str): Text to search
+            text_lower (str): text.lower(), if the caller has it
+            tokens (set): Lowercase word tokens of text, if the caller has them
+
+        Returns:
+            set: keyword_key() forms of the keywords found
+        """
+        if not text:
+            return set()
+        lower = text.lower() if text_lower is None else text_lower
+        if tokens is None:
+            tokens = set(WORD_PATTERN.findall(lower))
+
+        found = set(self._word_keys.intersection(tokens))
+        for phrase, phrase_words, pattern, exact in self._phrases:
+            if phrase_words <= tokens:
+                if len(lower) != len(text):
+                    # Lowercasing lengthened some character; keep offsets aligned
+                    lower = "".join(char.lower()[0] for char in text)
+                if self._occurs(pattern, exact, text, lower):
+                    found.add(phrase)
+        return found
+
+    @staticmethod
+    def _occurs(pattern, exact, text, lower):
+        for match in pattern.finditer(lower):
+            start, end = match.span()
+            if start and WORD_CHAR.match(lower, start - 1):
+                continue
+            if exact is None or " ".join(text[start:end].split()) == exact:
+                return True
+        return False
+
+    def matched(self, text, text_lower=None, tokens=None):
+        """Return the keywords found in text, in keyword order."""
+        found = self.find(text, text_lower, tokens)
+        return [keyword for keyword, key in zip(self.keywords, self._keys) if key in found]
+
+    def count(self, text, text_lower=None, tokens=None):
+        """Number of keywords (duplicates included) found in text."""
+        found = self.find(text, text_lower, tokens)
+        return sum(1 for key in self._keys if key in found)
+
+
+_matchers = OrderedDict()
+_matchers_lock = threading.Lock()
+
+
+def keyword_matcher(keywords):
+    """
+    Return the compiled matcher for keywords, reusing a recent one.
+
+    A job's keyword list is matched against every resume scored or
+    enhanced for it, so compiled matchers are kept in a small LRU.
+    """
+    cache_key = tuple(keywords)
+    with _matchers_lock:
+        matcher = _matchers.get(cache_key)
+        if matcher is not None:
+            _matchers.move_to_end(cache_key)
+            return matcher
+
+    matcher = KeywordMatcher(cache_key)
+    with _matchers_lock:
+        _matchers[cache_key] = matcher
+        while len(_matchers) > MATCHER_CACHE_ENTRIES:
+            _matchers.popitem(last=False)
+    return matcher
@@ -0,0 +1,118 @@
+import io
+import json
+import logging
+import time
+
+from openai import DefaultHttpxClient, OpenAI
+
+from resume_modifier.llm_client import http_limits
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# Batch states after which polling stops
+TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+class LLMBatchRunner:
+    """
+    Runs many chat completions as one OpenAI Batch API submission.
+
+    Requests are written to a JSONL file, uploaded with purpose "batch" and
+    submitted as a single batch. The runner then polls until the batch
+    reaches a terminal state (or its own timeout, after which the batch is
+    cancelled) and maps the output file back to the caller's ids. Items that
+    fail or never complete are simply absent from the result so callers can
+    fall back per item.
+    """
+
+    def __init__(self, api_key, base_url=None, poll_interval=5.0, timeout=3600.0,
+                 completion_window="24h", pool_limits=None):
+        """
+        Initialize the batch runner.
+
+        Args:
+            api_key (str): OpenAI API key
+            base_url (str): API base URL (None for api.openai.com)
+            poll_interval (float): Seconds between status checks
+            timeout (float): Seconds to wait for the batch before cancelling it
+            completion_window (str): Completion window requested from the API
+            pool_limits (dict): Connection pool limits (see AsyncLLMClient)
+        """
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.completion_window = completion_window
+        http_client = DefaultHttpxClient(limits=http_limits(pool_limits)) if pool_limits else None
+        self._client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+    def run(self, requests, metadata=None):
+        """
+        Submit chat completion requests as one batch and wait for the results.
+
+        Args:
+            requests (dict): custom_id -> chat completion request body
+            metadata (dict): Optional metadata attached to the batch
+
+        Returns:
+            dict: custom_id -> message content for every request that succeeded
+        """
+        if not requests:
+            return {}
+
+        lines = [
+            json.dumps({"custom_id": custom_id, "method": "POST",
+                        "url": CHAT_COMPLETIONS_ENDPOINT, "body": body})
+            for custom_id, body in requests.items()
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        input_file = self._client.files.create(file=("batch.jsonl", io.BytesIO(payload)),
+                                               purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window=self.completion_window,
+            metadata=metadata
+        )
+        logging.info(f"Submitted LLM batch {batch.id} with {len(requests)} requests")
+
+        batch = self._wait(batch)
+        if not batch.output_file_id:
+            logging.warning(f"LLM batch {batch.id} ended '{batch.status}' without output")
+            return {}
+
+        results = self._read_output(batch.output_file_id)
+        logging.info(f"LLM batch {batch.id} ended '{batch.status}': "
+                     f"{len(results)} of {len(requests)} requests succeeded")
+        return results
+
+    def _wait(self, batch):
+        """Poll until the batch is terminal, cancelling it on timeout."""
+        deadline = time.monotonic() + self.timeout
+        while batch.status not in TERMINAL_STATES:
+            if time.monotonic() >= deadline:
+                logging.warning(f"LLM batch {batch.id} timed out after {self.timeout}s, cancelling")
+                try:
+                    batch = self._client.batches.cancel(batch.id)
+                except Exception as e:
+                    logging.warning(f"Could not cancel LLM batch {batch.id}: {e}")
+                return batch
+            time.sleep(self.poll_interval)
+            batch = self._client.batches.retrieve(batch.id)
+        return batch
+
+    def _read_output(self, output_file_id):
+        """Map custom_id to message content for successful output lines."""
+        results = {}
+        content = self._client.files.content(output_file_id).text
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                logging.warning(f"Skipping malformed LLM batch output line: {e}")
+        return results
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import random
+import threading
+
+from openai import (AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError,
+                    DefaultAsyncHttpxClient)
+
+try:
+    # Newer openai releases are built on httpx2; its Limits must match the client
+    import httpx2 as httpx
+except ImportError:
+    import httpx
+
+
+class LLMClientError(Exception):
+    """Raised when an LLM call fails after exhausting its retries."""
+
+
+class LLMDeadlineExceeded(LLMClientError):
+    """Raised when an LLM call does not complete within its deadline."""
+
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+def http_limits(pool_limits):
+    """httpx connection limits for a pool_limits dict (None keeps the SDK defaults)."""
+    return httpx.Limits(**pool_limits) if pool_limits else None
+
+
+class AsyncLLMClient:
+    """
+    asyncio OpenAI client with bounded concurrency, deadlines and retries.
+
+    A single semaphore caps the requests in flight for the whole process.
+    Every call carries a deadline that covers waiting for a slot, each
+    attempt and the backoff between attempts. Rate limiting (429) and
+    transient server errors are retried with jittered exponential backoff,
+    honouring Retry-After when the server sends one.
+    """
+
+    def __init__(self, api_key, base_url=None, max_concurrency=8, max_retries=3,
+                 default_deadline=20.0, backoff_base=0.5, backoff_cap=8.0, pool_limits=None):
+        """
+        Initialize the client.
+
+        Args:
+            api_key (str): OpenAI API key
+            base_url (str): API base URL (None for api.openai.com)
+            max_concurrency (int): Maximum requests in flight at once
+            max_retries (int): Retries after the first attempt
+            default_deadline (float): Seconds a call may take when none is given
+            backoff_base (float): First backoff delay in seconds
+            backoff_cap (float): Largest backoff delay in seconds
+            pool_limits (dict): max_connections, max_keepalive_connections and
+                keepalive_expiry for the keep-alive connection pool
+        """
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.default_deadline = default_deadline
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        # Retries and timeouts are handled here so they respect the deadline
+        http_client = DefaultAsyncHttpxClient(limits=http_limits(pool_limits)) if pool_limits else None
+        self._client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0,
+                                   http_client=http_client)
+        self._semaphore = None
+
+    async def chat_completion(self, messages, model, deadline=None, **kwargs):
+        """
+        Run a chat completion and return the message content.
+
+        Args:
+            messages (list): Chat messages
+            model (str): Model name
+            deadline (float): Seconds the whole call may take, retries included
+
+        Returns:
+            str: Content of the first choice
+
+        Raises:
+            LLMDeadlineExceeded: The deadline passed before a response arrived
+            LLMClientError: The request failed and could not be retried
+        """
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + (deadline or self.default_deadline)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        attempt = 0
+        while True:
+            remaining = expires - loop.time()
+            if remaining <= 0:
+                raise LLMDeadlineExceeded(f"LLM call exceeded its deadline after {attempt} attempts")
+
+            try:
+                return await asyncio.wait_for(
+                    self._attempt(messages, model, remaining, kwargs), remaining
+                )
+            except asyncio.TimeoutError:
+                raise LLMDeadlineExceeded("LLM call exceeded its deadline") from None
+            except (APIConnectionError, APIStatusError) as e:
+                status = getattr(e, "status_code", None)
+                retryable = (isinstance(e, (APIConnectionError, APITimeoutError))
+                             or status in RETRYABLE_STATUS)
+                if not retryable or attempt >= self.max_retries:
+                    raise LLMClientError(f"LLM call failed: {e}") from e
+
+                delay = self._backoff(attempt, e)
+                if loop.time() + delay >= expires:
+                    raise LLMDeadlineExceeded("LLM call would exceed its deadline while backing off") from e
+                logging.warning(f"LLM call failed ({status or type(e).__name__}), "
+                                f"retrying in {delay:.2f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _attempt(self, messages, model, timeout, kwargs):
+        async with self._semaphore:
+            response = await self._client.chat.completions.create(
+                model=model, messages=messages, timeout=timeout, **kwargs
+            )
+        return response.choices[0].message.content
+
+    def _backoff(self, attempt, error):
+        """Full-jitter exponential backoff, at least the server's Retry-After."""
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                delay = max(delay, float(response.headers.get("retry-after", 0)))
+            except ValueError:
+                pass
+        return delay
+
+    async def close(self):
+        await self._client.close()
+
+
+class LLMClient:
+    """
+    Synchronous facade over AsyncLLMClient for Flask routes.
+
+    Calls are submitted to an event loop running on a background daemon
+    thread, so every request thread shares one connection pool and one
+    concurrency limit.
+    """
+
+    def __init__(self, api_key, base_url=None, **options):
+        """
+        Initialize the facade. The event loop thread starts on first use.
+
+        Args:
+            api_key (str): OpenAI API key
+            base_url (str): API base URL (None for api.openai.com)
+            **options: Passed to AsyncLLMClient
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.options = options
+        self._loop = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    def complete(self, messages, model, deadline=None, **kwargs):
+        """
+        Run a chat completion, blocking the calling thread until it finishes.
+
+        Returns:
+            str: Content of the first choice
+
+        Raises:
+            LLMDeadlineExceeded: The deadline passed before a response arrived
+            LLMClientError: The request failed and could not be retried
+        """
+        deadline = deadline or self.options.get("default_deadline", 20.0)
+        future = self.submit(messages, model, deadline=deadline, **kwargs)
+        try:
+            # The coroutine enforces the deadline; the grace period covers scheduling
+            return future.result(timeout=deadline + 1.0)
+        except TimeoutError:
+            future.cancel()
+            raise LLMDeadlineExceeded("LLM call exceeded its deadline") from None
+
+    def submit(self, messages, model, deadline=None, **kwargs):
+        """
+        Start a chat completion without waiting for it.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the content of the first choice
+        """
+        loop, client = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            client.chat_completion(messages, model, deadline=deadline, **kwargs), loop
+        )
+
+    def close(self):
+        """Stop the event loop thread."""
+        with self._lock:
+            loop, client = self._loop, self._async_client
+            self._loop = self._async_client = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=5)
+        except Exception as e:
+            logging.debug(f"Error closing LLM client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="llm-client-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._async_client = AsyncLLMClient(self.api_key, self.base_url, **self.options)
+            return self._loop, self._async_client
@@ -1,23 +1,78 @@
 import logging
-import re
 import os
-from openai import OpenAI
 import json
+import threading
+import time
+from collections import deque
+from resume_modifier.circuit_breaker import CircuitBreaker
+from resume_modifier.llm_registry import LLM_CLIENTS
+from resume_modifier.jd_preprocessor import JDPreprocessor
+from resume_modifier.skill_extractor import SKILL_EXTRACTOR
+from resume_modifier.keyword_cache import KeywordCache
 
 class LLMModel:
-    def __init__(self):
-        """Initialize the LLM model for job description analysis."""
-        self.client = None
-        try:
-            api_key = os.environ.get("OPENAI_API_KEY")
-            if api_key:
-                self.client = OpenAI(api_key=api_key)
-                logging.info("OpenAI client initialized successfully")
-            else:
-                logging.warning("No OpenAI API key found, using rule-based analysis")
-        except Exception as e:
-            logging.warning(f"Could not initialize OpenAI client: {e}")
-            self.client = None
+    # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
+    # do not change this unless explicitly requested by the user
+    OPENAI_MODEL = "gpt-4o"
+    
+    # Bump whenever the rule-based extractor's output changes so cached
+    # keyword lists are not reused (taxonomy and TF-IDF index edits bump
+    # their own versions)
+    RULESET_VERSION = "3"
+    RULE_KEYWORD_LIMIT = 15
+
+    def __init__(self, keyword_cache=None, tfidf_extractor=None, clients=None):
+        """
+        Initialize the LLM model for job description analysis.
+        
+        Args:
+            keyword_cache (KeywordCache): Optional cache of extracted keywords
+                shared across requests and workers
+            tfidf_extractor (TfidfExtractor): Optional corpus-trained extractor
+                that tops up the taxonomy keywords without a network call
+            clients (LLMClientRegistry): Where OpenAI clients are resolved
+                (defaults to the process-wide registry)
+        """
+        self.keyword_cache = keyword_cache
+        self.tfidf_extractor = tfidf_extractor
+        self.clients = clients or LLM_CLIENTS
+        self.deadline = float(os.environ.get("OPENAI_DEADLINE", 20))
+        # Seconds to wait for the LLM before answering with the rule-based
+        # keywords computed alongside it (0 waits for the full deadline)
+        self.hedge_budget = float(os.environ.get("OPENAI_HEDGE_BUDGET", 3))
+        self.breaker = CircuitBreaker(
+            "openai",
+            failure_threshold=int(os.environ.get("OPENAI_BREAKER_FAILURES", 5)),
+            cooldown=float(os.environ.get("OPENAI_BREAKER_COOLDOWN", 30))
+        )
+        # Job descriptions are trimmed to their high-signal sections before sending
+        self.jd_preprocessor = JDPreprocessor(
+            token_budget=int(os.environ.get("OPENAI_PROMPT_TOKEN_BUDGET", 1500)),
+            model=self.OPENAI_MODEL
+        )
+        self._latencies = deque(maxlen=512)
+        self._stats_lock = threading.Lock()
+        self._counters = {
+            "llm_calls": 0,
+            "llm_wins": 0,
+            "hedge_wins": 0,
+            "llm_failures": 0,
+            "breaker_skips": 0,
+            "prompt_tokens": 0,
+            "prompt_tokens_saved": 0
+        }
+        if self.client is None:
+            logging.warning("No OpenAI API key found, using rule-based analysis")
+
+    @property
+    def client(self):
+        """This process's shared LLMClient, or None without an API key."""
+        return self.clients.client()
+
+    @property
+    def batch_runner(self):
+        """This process's shared LLMBatchRunner, or None without an API key."""
+        return self.clients.batch_runner()
 
     def parse_job_description(self, job_description):
         """
@@ -30,148 +85,233 @@ class LLMModel:
             list: List of extracted keywords and requirements
         """
         try:
-            if self.client:
-                return self._openai_parse_job_description(job_description)
-            else:
-                return self._rule_based_parse_job_description(job_description)
+            if self.keyword_cache is None:
+                return self._extract_keywords(job_description)[0]
+            
+            cache_key = self.keyword_cache.make_key(job_description, self.keyword_version)
+            return self.keyword_cache.get_or_compute(
+                cache_key, lambda: self._extract_keywords(job_description, cache_key)
+            )
         except Exception as e:
             logging.error(f"Error parsing job description: {e}")
             return self._basic_keyword_extraction(job_description)
 
-    def _openai_parse_job_description(self, job_description):
-        """Use OpenAI to parse job description intelligently."""
-        try:
-            # the newest OpenAI model is "gpt-4o" which was released May 13, 2024.
-            # do not change this unless explicitly requested by the user
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are an expert resume analyst. Extract key skills, technologies, requirements, and qualifications from job descriptions. Return only a JSON array of the most important keywords and requirements, limiting to 15 items."
-                    },
-                    {
-                        "role": "user", 
-                        "content": f"Extract key skills and requirements from this job description:\n\n{job_description}"
-                    }
-                ],
-                response_format={"type": "json_object"}
-            )
+    def parse_job_descriptions(self, job_descriptions, metadata=None):
+        """
+        Extract keywords for many job descriptions with one Batch API submission.
+        
+        Identical job descriptions are submitted once and cached results are
+        not resubmitted. Items the batch does not answer, and every item
+        while the circuit breaker is open, fall back to the rule-based
+        extractor; a batch that fails or answers nothing counts as one
+        breaker failure.
+        
+        Args:
+            job_descriptions (list): Job description texts
+            metadata (dict): Optional metadata attached to the batch
             
-            result = json.loads(response.choices[0].message.content)
-            return result.get("keywords", [])[:15]
+        Returns:
+            list: Keyword lists, aligned with job_descriptions
+        """
+        if not self.batch_runner:
+            return [self.parse_job_description(jd) for jd in job_descriptions]
+        
+        results = {}
+        pending = {}
+        for job_description in job_descriptions:
+            custom_id = KeywordCache.make_key(job_description, self.keyword_version)
+            if custom_id in results or custom_id in pending:
+                continue
+            cached = self.keyword_cache.get(custom_id) if self.keyword_cache else None
+            if cached is not None:
+                results[custom_id] = cached
+            else:
+                pending[custom_id] = job_description
+        
+        contents = {}
+        if pending and not self.breaker.allow():
+            # The upstream is failing; answer the whole batch from the rules
+            self._count("breaker_skips")
+            logging.warning(f"Circuit breaker open, skipping OpenAI batch of {len(pending)} requests")
+            for custom_id, job_description in pending.items():
+                results[custom_id] = self._rule_based_parse_job_description(job_description)
+            pending = {}
+        elif pending:
+            try:
+                requests = {
+                    custom_id: self._job_description_request(job_description)
+                    for custom_id, job_description in pending.items()
+                }
+                contents = self.batch_runner.run(requests, metadata=metadata)
+            except Exception as e:
+                logging.error(f"OpenAI batch failed: {e}")
+            if contents:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+                self._count("llm_failures")
+        
+        for custom_id, job_description in pending.items():
+            try:
+                keywords = self._parse_llm_keywords(contents[custom_id])
+                if self.keyword_cache:
+                    self.keyword_cache.set(custom_id, keywords)
+            except (KeyError, ValueError, AttributeError):
+                logging.warning(f"No usable batch result for {custom_id}, using rule-based keywords")
+                keywords = self._rule_based_parse_job_description(job_description)
+            results[custom_id] = keywords
+        
+        return [results[KeywordCache.make_key(jd, self.keyword_version)] for jd in job_descriptions]
+
+    @property
+    def keyword_version(self):
+        """Identifies the extractor in keyword cache keys."""
+        if self.client:
+            return f"{self.OPENAI_MODEL}-r{self.RULESET_VERSION}"
+        version = f"rules-r{self.RULESET_VERSION}-t{SKILL_EXTRACTOR.version}"
+        if self.tfidf_extractor is not None:
+            version += f"-i{self.tfidf_extractor.version}"
+        return version
+
+    def stats(self):
+        """Return hedging counters, LLM latency percentiles and breaker state."""
+        with self._stats_lock:
+            stats = dict(self._counters)
+            latencies = sorted(self._latencies)
+        decided = stats["llm_wins"] + stats["hedge_wins"]
+        stats["hedge_win_rate"] = round(stats["hedge_wins"] / decided, 4) if decided else 0.0
+        stats["hedge_budget"] = self.hedge_budget
+        if latencies:
+            stats["latency_p50"] = round(latencies[len(latencies) // 2], 3)
+            stats["latency_p95"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3)
+        stats["breaker"] = self.breaker.stats()
+        return stats
+
+    def _extract_keywords(self, job_description, cache_key=None):
+        """
+        Extract keywords with the configured extractor.
+        
+        The LLM call is hedged: rule-based keywords are computed while it
+        runs and returned if the LLM has not answered within hedge_budget,
+        fails, or is skipped by the open circuit breaker.
+        
+        Args:
+            job_description (str): The job description text
+            cache_key (str): Keyword cache key, used to store a late LLM answer
             
+        Returns:
+            tuple: (keywords, cacheable) where cacheable is False when the
+                rule-based fallback answered for the LLM
+        """
+        if not self.client:
+            return self._rule_based_parse_job_description(job_description), True
+        
+        if not self.breaker.allow():
+            self._count("breaker_skips")
+            return self._rule_based_parse_job_description(job_description), False
+        
+        self._count("llm_calls")
+        started = time.monotonic()
+        future = self.client.submit(deadline=self.deadline, **self._job_description_request(job_description))
+        fallback = self._rule_based_parse_job_description(job_description)
+        
+        try:
+            content = future.result(timeout=self.hedge_budget or self.deadline + 1)
+            keywords = self._parse_llm_keywords(content)
+        except TimeoutError:
+            # Let the call finish in the background so its answer still reaches
+            # the cache; the breaker hears about it once it has finished, since
+            # a slow answer is not a failed one
+            self._count("hedge_wins")
+            future.add_done_callback(lambda done: self._late_result(done, cache_key, started))
+            return fallback, False
         except Exception as e:
             logging.error(f"OpenAI parsing failed: {e}")
-            return self._rule_based_parse_job_description(job_description)
+            self.breaker.record_failure()
+            self._count("llm_failures")
+            return fallback, False
+        
+        self.breaker.record_success()
+        self._record_latency(started)
+        self._count("llm_wins")
+        return keywords, True
+
+    def _late_result(self, future, cache_key, started):
+        """Record the outcome of an LLM call the hedge answered for and cache its keywords."""
+        if future.cancelled():
+            # Says nothing about the upstream, but may have been the probe
+            self.breaker.record_abandoned()
+            return
+        try:
+            keywords = self._parse_llm_keywords(future.result())
+        except Exception as e:
+            logging.warning(f"Late OpenAI call failed: {e}")
+            self.breaker.record_failure()
+            self._count("llm_failures")
+            return
+        self.breaker.record_success()
+        self._record_latency(started)
+        if cache_key and self.keyword_cache:
+            self.keyword_cache.set(cache_key, keywords)
+
+    @staticmethod
+    def _parse_llm_keywords(content):
+        return json.loads(content).get("keywords", [])[:15]
+
+    def _record_latency(self, started):
+        with self._stats_lock:
+            self._latencies.append(time.monotonic() - started)
+
+    def _count(self, counter):
+        with self._stats_lock:
+            self._counters[counter] += 1
+
+    def _job_description_request(self, job_description):
+        """Chat completion request body for keyword extraction."""
+        prepared = self.jd_preprocessor.prepare(job_description)
+        logging.info(f"Job description prompt: {prepared.tokens} tokens, {prepared.tokens_saved} saved "
+                     f"({prepared.dropped_sections} sections dropped)")
+        with self._stats_lock:
+            self._counters["prompt_tokens"] += prepared.tokens
+            self._counters["prompt_tokens_saved"] += prepared.tokens_saved
+        
+        return {
+            "model": self.OPENAI_MODEL,
+            "messages": [
+                {
+                    "role": "system", 
+                    "content": "You are an expert resume analyst. Extract key skills, technologies, requirements, and qualifications from job descriptions. Return only a JSON array of the most important keywords and requirements, limiting to 15 items."
+                },
+                {
+                    "role": "user", 
+                    "content": f"Extract key skills and requirements from this job description:\n\n{prepared.text}"
+                }
+            ],
+            "response_format": {"type": "json_object"}
+        }
 
     def _rule_based_parse_job_description(self, job_description):
         """Fallback rule-based parsing method."""
-        # Clean and preprocess the job description
-        cleaned_text = self._clean_text(job_description)
-        
-        # Extract skills and keywords using multiple approaches
-        skills = self._extract_skills(cleaned_text)
-        requirements = self._extract_requirements(cleaned_text)
-        technologies = self._extract_technologies(cleaned_text)
-        
-        # Combine all extracted information
-        all_keywords = list(set(skills + requirements + technologies))
-        
-        # Limit to most relevant keywords (top 15)
-        return all_keywords[:15]
-
-    def _clean_text(self, text):
-        """Clean and normalize text."""
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text.strip())
-        return text
-
-    def _extract_skills(self, text):
-        """Extract technical skills from job description."""
-        # Common technical skills and tools
-        skill_patterns = [
-            r'\b(?:Python|Java|JavaScript|C\+\+|C#|Ruby|PHP|Go|Rust|Swift|Kotlin)\b',
-            r'\b(?:React|Angular|Vue|Node\.js|Express|Django|Flask|Spring|Laravel)\b',
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Jenkins|Git|GitHub|GitLab)\b',
-            r'\b(?:SQL|MySQL|PostgreSQL|MongoDB|Redis|Elasticsearch)\b',
-            r'\b(?:Machine Learning|AI|Data Science|Analytics|Big Data)\b',
-            r'\b(?:Agile|Scrum|DevOps|CI/CD|TDD|Microservices)\b',
-            r'\b(?:HTML|CSS|SASS|LESS|Bootstrap|Tailwind)\b',
-            r'\b(?:REST|API|GraphQL|JSON|XML|SOAP)\b'
-        ]
-        
-        skills = []
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            skills.extend([match.title() for match in matches])
-        
-        return list(set(skills))
-
-    def _extract_requirements(self, text):
-        """Extract requirements and qualifications."""
-        requirements = []
-        
-        # Look for experience requirements
-        exp_patterns = [
-            r'(\d+)\s*\+?\s*years?\s+(?:of\s+)?experience',
-            r'(\d+)\s*\+?\s*years?\s+(?:in|with|of)',
-            r'minimum\s+(\d+)\s+years?',
-            r'at least\s+(\d+)\s+years?'
-        ]
-        
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                requirements.append(f"{match}+ years experience")
-        
-        # Look for degree requirements
-        degree_patterns = [
-            r'bachelor\'?s?\s+degree',
-            r'master\'?s?\s+degree',
-            r'phd|doctorate',
-            r'computer science|engineering|mathematics'
-        ]
-        
-        for pattern in degree_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                match = re.search(pattern, text, re.IGNORECASE).group()
-                requirements.append(match.title())
-        
-        return list(set(requirements))
-
-    def _extract_technologies(self, text):
-        """Extract specific technologies and tools."""
-        tech_keywords = [
-            'cloud', 'database', 'frontend', 'backend', 'fullstack',
-            'mobile', 'web development', 'software development',
-            'data analysis', 'testing', 'deployment', 'automation',
-            'security', 'performance', 'scalability', 'architecture'
-        ]
-        
-        technologies = []
-        text_lower = text.lower()
-        
-        for keyword in tech_keywords:
-            if keyword in text_lower:
-                technologies.append(keyword.title())
-        
-        return technologies
+        # Skills, requirements and technologies come out of one taxonomy scan,
+        # ranked by frequency and first occurrence (top 15)
+        keywords = SKILL_EXTRACTOR.extract(job_description, limit=self.RULE_KEYWORD_LIMIT)
+        if self.tfidf_extractor is None or len(keywords) >= self.RULE_KEYWORD_LIMIT:
+            return keywords
+        
+        # Terms the taxonomy does not know are ranked by how distinctive they
+        # are across every stored job description
+        try:
+            seen = {keyword.lower() for keyword in keywords}
+            for keyword in self.tfidf_extractor.extract(job_description, limit=self.RULE_KEYWORD_LIMIT):
+                if keyword.lower() not in seen:
+                    seen.add(keyword.lower())
+                    keywords.append(keyword)
+                    if len(keywords) >= self.RULE_KEYWORD_LIMIT:
+                        break
+        except Exception as e:
+            logging.warning(f"TF-IDF keyword extraction failed: {e}")
+        return keywords
 
     def _basic_keyword_extraction(self, text):
         """Basic fallback keyword extraction."""
-        # Simple keyword extraction as fallback
-        common_keywords = [
-            'Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker',
-            'SQL', 'Git', 'Agile', 'API', 'Machine Learning', 'Data Science',
-            'Cloud', 'DevOps', 'Testing', 'Frontend', 'Backend'
-        ]
-        
-        found_keywords = []
-        text_lower = text.lower()
-        
-        for keyword in common_keywords:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords[:10]
+        return SKILL_EXTRACTOR.extract(text, limit=10)
@@ -0,0 +1,131 @@
+import logging
+import os
+import threading
+
+from resume_modifier.llm_batch import LLMBatchRunner
+from resume_modifier.llm_client import LLMClient
+
+
+class LLMClientRegistry:
+    """
+    Process-wide home of the OpenAI clients.
+
+    Every LLMModel, ResumeScorer and route resolves its client here, so a
+    worker holds one keep-alive connection pool per API endpoint instead of
+    one per object. Clients are built lazily from the environment on first
+    use. A forked child (gunicorn --preload) drops whatever it inherited and
+    builds its own clients: event loop threads do not survive a fork and
+    pooled sockets must not be shared with the parent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._batch_runners = {}
+        self._pid = os.getpid()
+        self._counters = {"clients_created": 0, "batch_runners_created": 0, "fork_resets": 0}
+
+    @staticmethod
+    def pool_limits():
+        """Connection pool limits shared by every client of this process."""
+        return {
+            "max_connections": int(os.environ.get("OPENAI_POOL_MAX_CONNECTIONS", 16)),
+            "max_keepalive_connections": int(os.environ.get("OPENAI_POOL_MAX_KEEPALIVE", 8)),
+            "keepalive_expiry": float(os.environ.get("OPENAI_POOL_KEEPALIVE_EXPIRY", 30))
+        }
+
+    def client(self):
+        """
+        Return this process's LLMClient for the configured endpoint.
+
+        Returns:
+            LLMClient: The shared client, or None when no API key is set
+        """
+        key = self._endpoint()
+        if key is None:
+            return None
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = LLMClient(
+                    key[0],
+                    base_url=key[1],
+                    max_concurrency=int(os.environ.get("OPENAI_MAX_CONCURRENCY", 8)),
+                    max_retries=int(os.environ.get("OPENAI_MAX_RETRIES", 3)),
+                    default_deadline=float(os.environ.get("OPENAI_DEADLINE", 20)),
+                    pool_limits=self.pool_limits()
+                )
+                self._clients[key] = client
+                self._counters["clients_created"] += 1
+                logging.info(f"OpenAI client initialized for process {os.getpid()}")
+            return client
+
+    def batch_runner(self):
+        """
+        Return this process's LLMBatchRunner for the configured endpoint.
+
+        Returns:
+            LLMBatchRunner: The shared runner, or None when no API key is set
+        """
+        key = self._endpoint()
+        if key is None:
+            return None
+        with self._lock:
+            runner = self._batch_runners.get(key)
+            if runner is None:
+                runner = LLMBatchRunner(
+                    key[0],
+                    base_url=key[1],
+                    poll_interval=float(os.environ.get("OPENAI_BATCH_POLL_INTERVAL", 5)),
+                    timeout=float(os.environ.get("OPENAI_BATCH_TIMEOUT", 3600)),
+                    pool_limits=self.pool_limits()
+                )
+                self._batch_runners[key] = runner
+                self._counters["batch_runners_created"] += 1
+            return runner
+
+    def close(self):
+        """Close every client; later calls build new ones."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._batch_runners.clear()
+        for client in clients:
+            client.close()
+
+    def stats(self):
+        """Return the live client counts, pool limits and counters."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["clients"] = len(self._clients)
+            stats["batch_runners"] = len(self._batch_runners)
+        stats["pid"] = os.getpid()
+        stats["pool_limits"] = self.pool_limits()
+        return stats
+
+    @staticmethod
+    def _endpoint():
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            return None
+        return api_key, os.environ.get("OPENAI_BASE_URL") or None
+
+    def _after_fork(self):
+        """
+        Forget the parent's clients in a forked child.
+
+        They are dropped rather than closed: closing would shut down
+        connections and an event loop the parent is still using.
+        """
+        self._lock = threading.Lock()
+        if self._clients or self._batch_runners:
+            self._counters["fork_resets"] += 1
+        self._clients = {}
+        self._batch_runners = {}
+        self._pid = os.getpid()
+
+
+LLM_CLIENTS = LLMClientRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=LLM_CLIENTS._after_fork)
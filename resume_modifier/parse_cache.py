@@ -0,0 +1,201 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from resume_modifier.resume_data import ResumeData, ResumeDataError
+
+
+class ParseCache:
+    """
+    Content-addressed cache of resume parse results.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes plus the parser
+    version, so re-uploading the same document skips extraction entirely.
+    Lookups go through an in-process LRU first and then an on-disk store
+    shared by every worker on the host. Both tiers hold the compact
+    ResumeData binary encoding.
+    """
+
+    def __init__(self, directory=None, memory_entries=256, max_disk_bytes=64 * 1024 * 1024):
+        """
+        Initialize the parse cache.
+
+        Args:
+            directory (str): Directory for the persistent tier (None disables it)
+            memory_entries (int): Maximum number of entries kept in process
+            max_disk_bytes (int): Size budget for the persistent tier
+        """
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0
+        }
+        self._disk_bytes = 0
+
+        if self.directory:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            except OSError as e:
+                logging.warning(f"Parse cache directory unavailable, using memory only: {e}")
+                self.directory = None
+
+    @staticmethod
+    def make_key(content, parser_version):
+        """Build the cache key for a document's raw bytes."""
+        digest = hashlib.sha256(content).hexdigest()
+        return f"{digest}-{parser_version}"
+
+    def get(self, key):
+        """
+        Look up a parse result.
+
+        Returns:
+            dict: A fresh copy of the cached resume data, or None on a miss
+        """
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return ResumeData.from_bytes(payload).to_legacy()
+
+        payload = self._read_disk(key)
+        if payload is not None:
+            try:
+                resume_data = ResumeData.from_bytes(payload).to_legacy()
+            except ResumeDataError as e:
+                logging.warning(f"Discarding unreadable parse cache entry: {e}")
+                payload = None
+
+        with self._lock:
+            if payload is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._remember(key, payload)
+        return resume_data
+
+    def set(self, key, resume_data):
+        """Store a parse result in both tiers."""
+        try:
+            payload = ResumeData.coerce(resume_data).to_bytes()
+        except ResumeDataError as e:
+            logging.warning(f"Parse result not cacheable: {e}")
+            return
+
+        with self._lock:
+            self._remember(key, payload)
+            self._counters["writes"] += 1
+        self._write_disk(key, payload)
+
+    def stats(self):
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _remember(self, key, payload):
+        """Insert into the in-process LRU. Caller holds the lock."""
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def _read_disk(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as handle:
+                payload = handle.read()
+            # Touch the entry so eviction stays least-recently-used
+            os.utime(path)
+            return payload
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logging.warning(f"Could not read parse cache entry: {e}")
+            return None
+
+    def _write_disk(self, key, payload):
+        if not self.directory:
+            return
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            with open(temp_path, 'wb') as handle:
+                handle.write(payload)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write parse cache entry: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._disk_bytes += len(payload) - replaced
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _scan_disk(self):
+        """Yield (path, size, mtime) for every persisted entry."""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.bin'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def _evict_disk(self):
+        """Delete least recently used entries until the store is at 90% of budget."""
+        try:
+            entries = sorted(self._scan_disk(), key=lambda entry: entry[2])
+        except OSError as e:
+            logging.warning(f"Could not scan parse cache directory: {e}")
+            return
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_disk_bytes * 0.9)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Could not evict parse cache entry: {e}")
+                continue
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._counters["evictions"] += evicted
@@ -0,0 +1,259 @@
+import atexit
+import logging
+import multiprocessing
+import queue
+import threading
+
+from resume_modifier.resume_parser import ResumeParser
+from resume_modifier.resume_data import ResumeData
+
+
+class ParseWorkerError(Exception):
+    """Raised when a parse worker process dies while handling a document."""
+
+
+class ParseTimeout(ParseWorkerError):
+    """Raised when a document takes longer than the per-task timeout."""
+
+
+def _worker_main(conn):
+    """Parse documents sent over the pipe until told to stop."""
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+
+        source, options = task
+        try:
+            parser = ResumeParser(source, **options)
+            resume_data = ResumeData.from_legacy(parser.parse_resume())
+            # The compact encoding is cheaper to pickle than the dict
+            conn.send(("ok", resume_data.to_bytes(), parser._parse_failed, parser.revision))
+        except Exception as e:
+            conn.send(("error", str(e), True, None))
+    conn.close()
+
+
+class _Worker:
+    """One parse process and the parent end of its pipe."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks_completed = 0
+
+    def stop(self):
+        """Ask the process to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        """Kill the process immediately."""
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ParsePool:
+    """
+    Bounded pool of parser processes.
+
+    PyPDF2 extraction is pure Python and CPU bound, so parsing runs outside
+    the request thread. Each document is handled by exactly one worker
+    process; a document that exceeds the task timeout gets its own process
+    killed and replaced without disturbing work running on the others.
+    Workers are recycled after a fixed number of tasks to cap memory growth.
+    """
+
+    def __init__(self, max_workers=2, task_timeout=30, max_tasks_per_worker=50,
+                 parser_options=None, cache=None, revisions=None, start_method="spawn"):
+        """
+        Initialize the parse pool. Worker processes start lazily.
+
+        Args:
+            max_workers (int): Maximum concurrent parse processes (0 parses in-process)
+            task_timeout (float): Seconds a single document may take
+            max_tasks_per_worker (int): Tasks after which a worker is replaced
+            parser_options (dict): Keyword arguments passed to ResumeParser
+            cache (ParseCache): Optional parse cache consulted in the parent process
+            revisions (RevisionStore): Optional store of each owner's last parse,
+                enabling incremental re-parses of revised uploads
+            start_method (str): multiprocessing start method for workers
+        """
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.parser_options = dict(parser_options or {})
+        self.cache = cache
+        self.revisions = revisions
+        self._context = multiprocessing.get_context(start_method)
+        self._slots = queue.LifoQueue()
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._counters = {
+            "tasks": 0,
+            "timeouts": 0,
+            "crashes": 0,
+            "recycled": 0
+        }
+
+        # Each slot holds a running worker or None until one is needed; LIFO
+        # order keeps handing out the warm workers first
+        for _ in range(max_workers):
+            self._slots.put(None)
+        atexit.register(self.close)
+
+    def parse(self, resume_source, revision_key=None):
+        """
+        Parse a resume in a worker process.
+
+        Args:
+            resume_source (str | bytes | BytesIO | memoryview): Path to the resume
+                file or its raw contents
+            revision_key: Owner of the resume (e.g. a user id); when set, the
+                owner's previous upload is used to re-parse only changed lines
+                and this upload becomes the baseline for the next one, even
+                when it is served from the parse cache
+
+        Returns:
+            dict: Structured resume data
+
+        Raises:
+            ParseTimeout: The document exceeded the per-task timeout
+            ParseWorkerError: The worker process died while parsing
+        """
+        options = dict(self.parser_options)
+        track_revision = revision_key is not None and self.revisions is not None
+        if track_revision:
+            options["track_revision"] = True
+            options["previous_revision"] = self.revisions.get(revision_key)
+
+        parser = ResumeParser(resume_source, **options)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(parser._read_bytes(), parser.cache_version)
+            # The document's revision is kept next to its parse result, so a
+            # cache hit still becomes the owner's baseline for the next edit
+            revision = self.revisions.get(self._content_key(cache_key)) if track_revision else None
+            if revision is not None or not track_revision:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self._save_revision(revision_key, revision, False)
+                    return cached
+
+        if self.max_workers <= 0:
+            resume_data = parser.parse_resume()
+            parse_failed, revision = parser._parse_failed, parser.revision
+        else:
+            # In-memory documents cross the pipe as plain bytes
+            if not isinstance(resume_source, str):
+                resume_source = bytes(parser._read_bytes())
+            resume_data, parse_failed, revision = self._run((resume_source, options))
+
+        if cache_key is not None and not parse_failed:
+            self.cache.set(cache_key, resume_data)
+            if track_revision:
+                self._save_revision(self._content_key(cache_key), revision, parse_failed)
+        self._save_revision(revision_key, revision, parse_failed)
+        return resume_data
+
+    def stats(self):
+        """Return task, timeout and recycling counters."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["live_workers"] = len(self._workers)
+        stats["max_workers"] = self.max_workers
+        return stats
+
+    def close(self):
+        """Stop every worker process."""
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def _run(self, task):
+        """Send one task to a free worker and wait for its result."""
+        worker = self._slots.get()
+        try:
+            if worker is None or not worker.process.is_alive():
+                worker = self._start_worker()
+
+            with self._lock:
+                self._counters["tasks"] += 1
+
+            try:
+                worker.conn.send(task)
+                ready = worker.conn.poll(self.task_timeout)
+            except (BrokenPipeError, OSError):
+                ready = None
+
+            if not ready:
+                crashed = ready is None or not worker.process.is_alive()
+                self._discard(worker, kill=True)
+                worker = None
+                if crashed:
+                    self._count("crashes")
+                    raise ParseWorkerError("Parse worker exited unexpectedly")
+                self._count("timeouts")
+                raise ParseTimeout(f"Resume parsing exceeded {self.task_timeout} seconds")
+
+            try:
+                status, payload, parse_failed, revision = worker.conn.recv()
+            except (EOFError, OSError):
+                self._discard(worker, kill=True)
+                worker = None
+                self._count("crashes")
+                raise ParseWorkerError("Parse worker exited unexpectedly")
+
+            worker.tasks_completed += 1
+            if worker.tasks_completed >= self.max_tasks_per_worker:
+                self._discard(worker, kill=False)
+                worker = None
+                self._count("recycled")
+
+            if status != "ok":
+                raise ParseWorkerError(payload)
+            return ResumeData.from_bytes(payload).to_legacy(), parse_failed, revision
+        finally:
+            self._slots.put(worker)
+
+    @staticmethod
+    def _content_key(cache_key):
+        """Revision store owner under which a cached document's revision is kept."""
+        return f"content:{cache_key}"
+
+    def _save_revision(self, revision_key, revision, parse_failed):
+        if revision_key is not None and revision is not None and not parse_failed:
+            self.revisions.set(revision_key, revision)
+
+    def _start_worker(self):
+        worker = _Worker(self._context)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _discard(self, worker, kill):
+        with self._lock:
+            self._workers.discard(worker)
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
+        logging.debug(f"Parse worker {worker.process.pid} {'killed' if kill else 'recycled'}")
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
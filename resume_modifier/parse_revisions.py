@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+# One parsed line: its digest, the section in effect when it was read, the
+# section it opened (headers only) and what it added to that section
+LineRecord = namedtuple("LineRecord", ["digest", "section", "header", "contribution"])
+
+
+def line_digest(text):
+    """Short stable digest of one line of resume text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ParseRevision:
+    """
+    Per-line record of one parse, used to re-parse the next revision.
+
+    Args:
+        version (str): ResumeParser.cache_version the records were produced with
+        records (list): LineRecord for every line fed to the section parser
+    """
+
+    def __init__(self, version, records):
+        self.version = version
+        self.records = records
+
+    @property
+    def digests(self):
+        return [record.digest for record in self.records]
+
+    def to_json(self):
+        """Serialize for the revision store."""
+        return json.dumps({"version": self.version, "records": self.records},
+                          separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload):
+        """Load a revision written by to_json."""
+        data = json.loads(payload)
+        return cls(data["version"], [LineRecord(*record) for record in data["records"]])
+
+
+class RevisionStore:
+    """
+    Latest ParseRevision per owner (typically a user id).
+
+    Mirrors ParseCache: an in-process LRU in front of a directory of JSON
+    files so every worker on the host sees the last upload of each user,
+    with the directory kept to a byte budget by least-recently-used
+    eviction.
+    """
+
+    def __init__(self, directory=None, memory_entries=512, max_disk_bytes=64 * 1024 * 1024):
+        """
+        Initialize the revision store.
+
+        Args:
+            directory (str): Directory for the persistent tier (None disables it)
+            memory_entries (int): Maximum number of owners kept in process
+            max_disk_bytes (int): Size budget for the persistent tier
+        """
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._disk_bytes = 0
+
+        if self.directory:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            except OSError as e:
+                logging.warning(f"Revision store directory unavailable, using memory only: {e}")
+                self.directory = None
+
+    def get(self, owner):
+        """Return the owner's last ParseRevision, or None."""
+        key = self._key(owner)
+        with self._lock:
+            revision = self._memory.get(key)
+            if revision is not None:
+                self._memory.move_to_end(key)
+                self._counters["hits"] += 1
+                return revision
+
+        revision = self._read_disk(key)
+        with self._lock:
+            if revision is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            self._remember(key, revision)
+        return revision
+
+    def set(self, owner, revision):
+        """Replace the owner's last ParseRevision."""
+        key = self._key(owner)
+        with self._lock:
+            self._remember(key, revision)
+            self._counters["writes"] += 1
+        self._write_disk(key, revision)
+
+    def stats(self):
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+        return stats
+
+    @staticmethod
+    def _key(owner):
+        return hashlib.sha256(str(owner).encode("utf-8")).hexdigest()
+
+    def _remember(self, key, revision):
+        """Insert into the in-process LRU. Caller holds the lock."""
+        self._memory[key] = revision
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                revision = ParseRevision.from_json(handle.read())
+            # Touch the entry so eviction stays least-recently-used
+            os.utime(path)
+            return revision
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"Could not read parse revision: {e}")
+            return None
+
+    def _write_disk(self, key, revision):
+        if not self.directory:
+            return
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        payload = revision.to_json().encode("utf-8")
+        try:
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            with open(temp_path, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write parse revision: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._disk_bytes += len(payload) - replaced
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _scan_disk(self):
+        """Yield (path, size, mtime) for every persisted revision."""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def _evict_disk(self):
+        """Delete least recently used revisions until the store is at 90% of budget."""
+        try:
+            entries = sorted(self._scan_disk(), key=lambda entry: entry[2])
+        except OSError as e:
+            logging.warning(f"Could not scan parse revision directory: {e}")
+            return
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_disk_bytes * 0.9)
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Could not evict parse revision: {e}")
+                continue
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._counters["evictions"] += evicted
@@ -0,0 +1,244 @@
+from dataclasses import dataclass, field, fields
+
+# Binary layout: magic, format version, then every field in declaration
+# order. Strings are varint length + UTF-8, lists are varint count + items.
+BINARY_MAGIC = b'RD'
+BINARY_VERSION = 1
+
+
+class ResumeDataError(ValueError):
+    """Raised when resume data cannot be converted or decoded."""
+
+
+@dataclass(slots=True)
+class ContactInfo:
+    """Candidate contact details."""
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+
+    def __bool__(self):
+        return bool(self.name or self.email or self.phone or self.location)
+
+
+@dataclass(slots=True)
+class ExperienceEntry:
+    """One position held by the candidate."""
+    title: str = ""
+    company: str = ""
+    dates: str = ""
+    description: str = ""
+
+
+@dataclass(slots=True)
+class ProjectEntry:
+    """One project the candidate worked on."""
+    title: str = ""
+    description: str = ""
+
+
+@dataclass(slots=True)
+class EducationEntry:
+    """One degree or course of study."""
+    degree: str = ""
+    school: str = ""
+    year: str = ""
+    description: str = ""
+
+
+@dataclass(slots=True)
+class ResumeData:
+    """
+    Typed resume representation shared by the parser, formatter and scorer.
+
+    The parser historically produced plain dicts with ``contact_info`` and
+    string entries while the scorer and document builder expected
+    ``contact`` and dict entries. ``from_legacy`` accepts either shape and
+    ``to_legacy`` reproduces the parser's dict for templates and callers
+    that still work on dicts.
+    """
+    summary: str = ""
+    skills: list = field(default_factory=list)
+    experience: list = field(default_factory=list)
+    projects: list = field(default_factory=list)
+    education: list = field(default_factory=list)
+    contact: ContactInfo = field(default_factory=ContactInfo)
+    raw_text: str = ""
+    job_requirements: list = field(default_factory=list)
+
+    @classmethod
+    def coerce(cls, resume_data):
+        """Return resume_data as a ResumeData, converting legacy dicts once."""
+        if isinstance(resume_data, cls):
+            return resume_data
+        return cls.from_legacy(resume_data)
+
+    @classmethod
+    def from_legacy(cls, data):
+        """
+        Build ResumeData from either legacy dict shape.
+
+        Args:
+            data (dict): Parser output (``contact_info``, string entries) or
+                scorer/formatter input (``contact``, dict entries)
+
+        Returns:
+            ResumeData: The typed representation
+        """
+        if not isinstance(data, dict):
+            raise ResumeDataError(f"Expected resume dict, got {type(data).__name__}")
+
+        contact = data.get("contact") or data.get("contact_info") or {}
+        return cls(
+            summary=_text(data.get("summary")),
+            skills=[_text(skill) for skill in data.get("skills") or [] if skill],
+            experience=[_entry(ExperienceEntry, item) for item in data.get("experience") or []],
+            projects=[_entry(ProjectEntry, item) for item in data.get("projects") or []],
+            education=[_entry(EducationEntry, item) for item in data.get("education") or []],
+            contact=_entry(ContactInfo, contact) if isinstance(contact, dict) else ContactInfo(),
+            raw_text=_text(data.get("raw_text")),
+            job_requirements=[_text(item) for item in data.get("job_requirements") or []]
+        )
+
+    def to_legacy(self):
+        """Return the dict shape produced by ResumeParser.parse_resume."""
+        data = {
+            "summary": self.summary,
+            "skills": list(self.skills),
+            "experience": [_entry_text(entry) for entry in self.experience],
+            "projects": [_entry_text(entry) for entry in self.projects],
+            "education": [_entry_text(entry) for entry in self.education],
+            "contact_info": {name: value for name, value in _items(self.contact) if value},
+            "raw_text": self.raw_text
+        }
+        if self.job_requirements:
+            data["job_requirements"] = list(self.job_requirements)
+        return data
+
+    def to_bytes(self):
+        """Encode into the compact binary format used for caching and storage."""
+        out = bytearray(BINARY_MAGIC)
+        out.append(BINARY_VERSION)
+        _write_str(out, self.summary)
+        _write_strs(out, self.skills)
+        for entries in (self.experience, self.projects, self.education):
+            _write_varint(out, len(entries))
+            for entry in entries:
+                for _, value in _items(entry):
+                    _write_str(out, value)
+        for _, value in _items(self.contact):
+            _write_str(out, value)
+        _write_str(out, self.raw_text)
+        _write_strs(out, self.job_requirements)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, payload):
+        """Decode data produced by to_bytes."""
+        view = memoryview(payload)
+        if bytes(view[:2]) != BINARY_MAGIC or len(view) < 3:
+            raise ResumeDataError("Not an encoded ResumeData payload")
+        if view[2] != BINARY_VERSION:
+            raise ResumeDataError(f"Unsupported ResumeData encoding version {view[2]}")
+
+        reader = _Reader(view, 3)
+        summary = reader.read_str()
+        skills = reader.read_strs()
+        entries = []
+        for entry_type in (ExperienceEntry, ProjectEntry, EducationEntry):
+            width = len(fields(entry_type))
+            entries.append([entry_type(*(reader.read_str() for _ in range(width)))
+                            for _ in range(reader.read_varint())])
+        contact = ContactInfo(*(reader.read_str() for _ in range(len(fields(ContactInfo)))))
+        raw_text = reader.read_str()
+        job_requirements = reader.read_strs()
+        if reader.offset != len(view):
+            raise ResumeDataError("Trailing bytes after ResumeData payload")
+
+        return cls(summary, skills, entries[0], entries[1], entries[2], contact, raw_text,
+                   job_requirements)
+
+
+def _text(value):
+    return value if isinstance(value, str) else ("" if value is None else str(value))
+
+
+def _items(entry):
+    return ((f.name, getattr(entry, f.name)) for f in fields(entry))
+
+
+def _entry(entry_type, item):
+    """Convert a legacy string or dict entry into entry_type."""
+    if isinstance(item, entry_type):
+        return item
+    if isinstance(item, dict):
+        names = {f.name for f in fields(entry_type)}
+        return entry_type(**{name: _text(value) for name, value in item.items() if name in names})
+    if isinstance(item, str) and "description" in {f.name for f in fields(entry_type)}:
+        return entry_type(description=item)
+    raise ResumeDataError(f"Cannot convert {type(item).__name__} to {entry_type.__name__}")
+
+
+def _entry_text(entry):
+    """Render an entry as the single line the parser would have produced."""
+    values = [value for name, value in _items(entry) if name != "description" and value]
+    if not values:
+        return entry.description
+    line = " | ".join(values)
+    return f"{line} - {entry.description}" if entry.description else line
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_str(out, value):
+    encoded = value.encode("utf-8")
+    _write_varint(out, len(encoded))
+    out += encoded
+
+
+def _write_strs(out, values):
+    _write_varint(out, len(values))
+    for value in values:
+        _write_str(out, value)
+
+
+class _Reader:
+    """Cursor over an encoded payload."""
+
+    __slots__ = ("view", "offset")
+
+    def __init__(self, view, offset):
+        self.view = view
+        self.offset = offset
+
+    def read_varint(self):
+        result = 0
+        shift = 0
+        while True:
+            try:
+                byte = self.view[self.offset]
+            except IndexError:
+                raise ResumeDataError("Truncated ResumeData payload") from None
+            self.offset += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_str(self):
+        length = self.read_varint()
+        end = self.offset + length
+        if end > len(self.view):
+            raise ResumeDataError("Truncated ResumeData payload")
+        value = str(self.view[self.offset:end], "utf-8")
+        self.offset = end
+        return value
+
+    def read_strs(self):
+        return [self.read_str() for _ in range(self.read_varint())]
@@ -1,8 +1,10 @@
 import logging
 from docx import Document
-from docx.shared import Inches
+from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import re
+from resume_modifier.keyword_matcher import KeywordMatcher, keyword_key, keyword_matcher
+from resume_modifier.resume_data import ResumeData
 
 class ResumeFormatter:
     def __init__(self):
@@ -79,6 +81,11 @@ class ResumeFormatter:
     def _enhance_skills(self, original_skills, job_requirements):
         """Enhance skills section with relevant job requirements."""
         enhanced_skills = original_skills.copy()
+        requirement_matcher = keyword_matcher(job_requirements)
+        
+        # Requirements each skill names (as whole words), one scan per skill
+        skill_hits = [requirement_matcher.find(skill) for skill in enhanced_skills]
+        present = set().union(*skill_hits)
         
         # Add job requirements that aren't already in skills
         for requirement in job_requirements:
@@ -87,16 +94,24 @@ class ResumeFormatter:
                 continue
                 
             # Check if skill is already present (case-insensitive)
-            if not any(requirement.lower() in skill.lower() for skill in enhanced_skills):
+            if keyword_key(requirement) not in present:
                 enhanced_skills.append(requirement)
+                skill_hits.append(requirement_matcher.find(requirement))
+                present |= skill_hits[-1]
+        
+        # Prioritize skills that match job requirements: a skill naming a
+        # requirement, or named inside one. The skill list is per resume, so
+        # its matcher is not worth caching
+        skill_matcher = KeywordMatcher(enhanced_skills)
+        named_skills = set()
+        for requirement in job_requirements:
+            named_skills |= skill_matcher.find(requirement)
         
-        # Prioritize skills that match job requirements
         matched_skills = []
         other_skills = []
         
-        for skill in enhanced_skills:
-            if any(req.lower() in skill.lower() or skill.lower() in req.lower() 
-                   for req in job_requirements):
+        for skill, hits in zip(enhanced_skills, skill_hits):
+            if hits or keyword_key(skill) in named_skills:
                 matched_skills.append(skill)
             else:
                 other_skills.append(skill)
@@ -111,16 +126,18 @@ class ResumeFormatter:
         # Technical keywords to add to experience
         tech_keywords = [req for req in job_requirements 
                         if not any(char.isdigit() for char in req)]
+        # Add 1-2 relevant keywords to experience
+        relevant_keywords = tech_keywords[:2]
+        matcher = keyword_matcher(relevant_keywords)
         
         for exp in original_experience:
             enhanced_exp = exp
             
             # Add relevant keywords to experience descriptions
             if tech_keywords and len(exp) > 50:  # Only enhance substantial entries
-                # Add 1-2 relevant keywords to experience
-                relevant_keywords = tech_keywords[:2]
+                present = matcher.find(exp)
                 for keyword in relevant_keywords:
-                    if keyword.lower() not in exp.lower():
+                    if keyword_key(keyword) not in present:
                         enhanced_exp += f" Utilized {keyword} for improved performance."
                         break
             
@@ -135,15 +152,17 @@ class ResumeFormatter:
         # Technical keywords for projects
         tech_keywords = [req for req in job_requirements 
                         if not any(char.isdigit() for char in req)]
+        relevant_tech = tech_keywords[:1]  # Add one relevant technology
+        matcher = keyword_matcher(relevant_tech)
         
         for project in original_projects:
             enhanced_project = project
             
             # Add relevant technologies to project descriptions
             if tech_keywords and len(project) > 30:
-                relevant_tech = tech_keywords[:1]  # Add one relevant technology
+                present = matcher.find(project)
                 for tech in relevant_tech:
-                    if tech.lower() not in project.lower():
+                    if keyword_key(tech) not in present:
                         enhanced_project += f" Implemented using {tech}."
                         break
             
@@ -163,15 +182,12 @@ class ResumeFormatter:
         Create an enhanced resume document with professional formatting.
         
         Args:
-            resume_data (dict): Enhanced resume data
+            resume_data (dict | ResumeData): Enhanced resume data
             output_path (str): Path to save the output document
             template_id (int): Template ID to use for formatting
         """
         try:
-            from docx import Document
-            from docx.shared import Inches, Pt
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            from docx.oxml.shared import OxmlElement, qn
+            resume_data = ResumeData.coerce(resume_data)
             
             # Create new document
             doc = Document()
@@ -202,27 +218,20 @@ class ResumeFormatter:
     
     def _add_header(self, doc, resume_data):
         """Add header section with contact information"""
-        contact = resume_data.get('contact', {})
+        contact = resume_data.contact
         
         # Name (Title)
         name_paragraph = doc.add_paragraph()
         name_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_run = name_paragraph.add_run(contact.get('name', 'Professional Resume'))
+        name_run = name_paragraph.add_run(contact.name or 'Professional Resume')
         name_run.font.size = Pt(24)
         name_run.bold = True
         
         # Contact information
-        if contact:
+        contact_info = [value for value in (contact.email, contact.phone, contact.location) if value]
+        if contact_info:
             contact_paragraph = doc.add_paragraph()
             contact_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_info = []
-            if contact.get('email'):
-                contact_info.append(contact['email'])
-            if contact.get('phone'):
-                contact_info.append(contact['phone'])
-            if contact.get('location'):
-                contact_info.append(contact['location'])
-            
             contact_run = contact_paragraph.add_run(' | '.join(contact_info))
             contact_run.font.size = Pt(12)
         
@@ -231,7 +240,7 @@ class ResumeFormatter:
     
     def _add_summary(self, doc, resume_data):
         """Add professional summary section"""
-        summary = resume_data.get('summary', '')
+        summary = resume_data.summary
         if summary:
             heading = doc.add_paragraph()
             heading_run = heading.add_run('PROFESSIONAL SUMMARY')
@@ -245,7 +254,7 @@ class ResumeFormatter:
     
     def _add_skills(self, doc, resume_data):
         """Add skills section"""
-        skills = resume_data.get('skills', [])
+        skills = resume_data.skills
         if skills:
             heading = doc.add_paragraph()
             heading_run = heading.add_run('CORE COMPETENCIES')
@@ -260,7 +269,7 @@ class ResumeFormatter:
     
     def _add_experience(self, doc, resume_data):
         """Add work experience section"""
-        experience = resume_data.get('experience', [])
+        experience = resume_data.experience
         if experience:
             heading = doc.add_paragraph()
             heading_run = heading.add_run('PROFESSIONAL EXPERIENCE')
@@ -268,30 +277,31 @@ class ResumeFormatter:
             heading_run.bold = True
             
             for exp in experience:
-                # Job title and company
-                job_paragraph = doc.add_paragraph()
-                title_run = job_paragraph.add_run(exp.get('title', 'Position'))
-                title_run.bold = True
-                title_run.font.size = Pt(12)
-                
-                company_run = job_paragraph.add_run(f" | {exp.get('company', 'Company')}")
-                company_run.font.size = Pt(12)
+                # Job title and company (parsed entries may only carry a description)
+                if exp.title or exp.company:
+                    job_paragraph = doc.add_paragraph()
+                    title_run = job_paragraph.add_run(exp.title or 'Position')
+                    title_run.bold = True
+                    title_run.font.size = Pt(12)
+                    
+                    company_run = job_paragraph.add_run(f" | {exp.company or 'Company'}")
+                    company_run.font.size = Pt(12)
                 
                 # Dates
-                if exp.get('dates'):
-                    dates_paragraph = doc.add_paragraph(exp['dates'])
+                if exp.dates:
+                    dates_paragraph = doc.add_paragraph(exp.dates)
                     dates_paragraph.style = 'Normal'
                 
                 # Description
-                if exp.get('description'):
-                    desc_paragraph = doc.add_paragraph(exp['description'])
+                if exp.description:
+                    desc_paragraph = doc.add_paragraph(exp.description)
                     desc_paragraph.style = 'Normal'
                 
                 doc.add_paragraph()
     
     def _add_projects(self, doc, resume_data):
         """Add projects section"""
-        projects = resume_data.get('projects', [])
+        projects = resume_data.projects
         if projects:
             heading = doc.add_paragraph()
             heading_run = heading.add_run('KEY PROJECTS')
@@ -300,21 +310,22 @@ class ResumeFormatter:
             
             for project in projects:
                 # Project title
-                project_paragraph = doc.add_paragraph()
-                title_run = project_paragraph.add_run(project.get('title', 'Project'))
-                title_run.bold = True
-                title_run.font.size = Pt(12)
+                if project.title:
+                    project_paragraph = doc.add_paragraph()
+                    title_run = project_paragraph.add_run(project.title)
+                    title_run.bold = True
+                    title_run.font.size = Pt(12)
                 
                 # Description
-                if project.get('description'):
-                    desc_paragraph = doc.add_paragraph(project['description'])
+                if project.description:
+                    desc_paragraph = doc.add_paragraph(project.description)
                     desc_paragraph.style = 'Normal'
                 
                 doc.add_paragraph()
     
     def _add_education(self, doc, resume_data):
         """Add education section"""
-        education = resume_data.get('education', [])
+        education = resume_data.education
         if education:
             heading = doc.add_paragraph()
             heading_run = heading.add_run('EDUCATION')
@@ -323,14 +334,14 @@ class ResumeFormatter:
             
             for edu in education:
                 edu_paragraph = doc.add_paragraph()
-                degree_run = edu_paragraph.add_run(edu.get('degree', 'Degree'))
+                degree_run = edu_paragraph.add_run(edu.degree or edu.description or 'Degree')
                 degree_run.bold = True
                 
-                if edu.get('school'):
-                    school_run = edu_paragraph.add_run(f" | {edu['school']}")
+                if edu.school:
+                    school_run = edu_paragraph.add_run(f" | {edu.school}")
                 
-                if edu.get('year'):
-                    year_paragraph = doc.add_paragraph(edu['year'])
+                if edu.year:
+                    year_paragraph = doc.add_paragraph(edu.year)
     
     def add_content(self, doc, resume_data):
         """
@@ -0,0 +1,363 @@
+import math
+import threading
+from collections import Counter
+
+import numpy as np
+
+from resume_modifier.bm25 import bm25_idf
+from resume_modifier.resume_data import ResumeData
+from resume_modifier.scoring_context import WORD_PATTERN, scorable_parts
+from resume_modifier.skill_extractor import SKILL_EXTRACTOR
+from resume_modifier.tfidf_extractor import STOPWORDS
+
+# Skill terms live beside word terms in the same index under this prefix
+SKILL_PREFIX = "skill:"
+INITIAL_CAPACITY = 8
+# Candidates are looked up in a postings list (a binary search each) only
+# while that is cheaper than scanning the list; one lookup costs about this
+# many scanned postings
+PROBE_COST = 8
+
+
+def skill_term(skill):
+    """Index term for a skill, keyed by its canonical taxonomy name."""
+    name = SKILL_EXTRACTOR.canonical_name(skill) or " ".join(skill.split())
+    return SKILL_PREFIX + name.lower()
+
+
+def document_terms(resume_data):
+    """
+    Term frequencies a resume is indexed under.
+
+    Words of the scorable text (summary, skills, experience and projects)
+    count once per occurrence, stopwords excluded; each listed skill adds
+    one skill term.
+
+    Returns:
+        tuple: (Counter of term -> frequency, document length in words)
+    """
+    resume_data, text, _ = scorable_parts(resume_data)
+    words = [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS]
+    terms = Counter(words)
+    terms.update({skill_term(skill) for skill in resume_data.skills if skill.strip()})
+    return terms, len(words)
+
+
+def query_terms(job_description, skill_weight=2.0):
+    """
+    Weighted query terms of a job description.
+
+    Every distinct non-stopword counts once; skills the taxonomy finds in
+    the text are added as skill terms with skill_weight.
+
+    Returns:
+        dict: term -> query weight
+    """
+    terms = {word: 1.0 for word in WORD_PATTERN.findall((job_description or "").lower())
+             if word not in STOPWORDS}
+    for skill in SKILL_EXTRACTOR.extract(job_description or "", limit=50):
+        terms[skill_term(skill)] = skill_weight
+    return terms
+
+
+def _grow(array, needed):
+    """Return array with room for at least needed items, doubling capacity."""
+    if needed <= len(array):
+        return array
+    grown = np.empty(max(needed, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class _Postings:
+    """Growable postings list: ascending doc numbers with their term frequencies."""
+    __slots__ = ("docs", "tfs", "size", "max_tf", "min_length")
+
+    def __init__(self):
+        self.docs = np.empty(INITIAL_CAPACITY, dtype=np.uint32)
+        self.tfs = np.empty(INITIAL_CAPACITY, dtype=np.float32)
+        self.size = 0
+        self.max_tf = 0.0
+        self.min_length = math.inf
+
+    def extend(self, docs, tfs, lengths):
+        end = self.size + len(docs)
+        self.docs = _grow(self.docs, end)
+        self.tfs = _grow(self.tfs, end)
+        self.docs[self.size:end] = docs
+        self.tfs[self.size:end] = tfs
+        self.size = end
+        # Bounds for the term's best possible BM25 contribution
+        self.max_tf = max(self.max_tf, float(np.max(tfs)))
+        self.min_length = min(self.min_length, float(np.min(lengths)))
+
+
+class ResumeIndex:
+    """
+    In-memory inverted index over stored resumes for top-k candidate ranking.
+
+    Each term keeps a postings list of (document, term frequency) in
+    document order, held as NumPy arrays that grow in place as resumes are
+    added. Queries are ranked with BM25 and evaluated term-at-a-time with
+    max-score pruning: terms are processed from the highest possible
+    contribution down, and once the contributions left cannot lift an
+    unseen document into the current top k, the remaining (typically long,
+    low-IDF) postings lists are only probed for the surviving candidates.
+    Results are identical to exhaustive BM25 ranking.
+
+    Documents are identified by resume id and may carry an owner id so a
+    query can be restricted to one user's resumes. The index is rebuilt
+    from the database by each process; ``synced_through`` records the last
+    stored content row it has seen. Removed resumes are only masked out of
+    results: their postings, and their share of the corpus statistics,
+    stay until the process rebuilds its index.
+    """
+
+    def __init__(self, k1=1.2, b=0.75, skill_weight=2.0):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1 (float): BM25 term-frequency saturation
+            b (float): BM25 document-length normalization
+            skill_weight (float): Query weight of taxonomy skill terms
+        """
+        self.k1 = k1
+        self.b = b
+        self.skill_weight = skill_weight
+        self.synced_through = 0
+        self._lock = threading.RLock()
+        self._postings = {}
+        self._doc_numbers = {}
+        self._resume_ids = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+        self._owners = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+        self._lengths = np.empty(INITIAL_CAPACITY, dtype=np.float32)
+        self._live = np.empty(INITIAL_CAPACITY, dtype=bool)
+        self._count = 0
+        self._removed = 0
+        self._total_length = 0
+        self._counters = {"queries": 0, "postings_scanned": 0, "postings_probed": 0}
+
+    def __len__(self):
+        return self._count - self._removed
+
+    def __contains__(self, resume_id):
+        return resume_id in self._doc_numbers
+
+    def add(self, resume_id, resume_data, owner_id=0):
+        """
+        Index one resume.
+
+        Args:
+            resume_id (int): UserResume id
+            resume_data (dict | ResumeData): Parsed resume
+            owner_id (int): Id of the user the resume belongs to
+
+        Returns:
+            bool: False if the resume was already indexed
+        """
+        return self.add_many([(resume_id, resume_data, owner_id)]) == 1
+
+    def add_many(self, documents):
+        """
+        Index many resumes with one postings update per term.
+
+        Args:
+            documents (iterable): (resume_id, resume_data, owner_id) tuples;
+                resume_data may also be a ResumeData.to_bytes() payload
+
+        Returns:
+            int: Number of resumes added (already indexed ones are skipped)
+        """
+        analyzed = []
+        for resume_id, resume_data, owner_id in documents:
+            if isinstance(resume_data, (bytes, memoryview)):
+                resume_data = ResumeData.from_bytes(resume_data)
+            analyzed.append((resume_id, owner_id, *document_terms(resume_data)))
+
+        with self._lock:
+            # Postings of the whole batch as flat arrays, grouped per term below
+            term_numbers = {}
+            flat_terms = []
+            flat_frequencies = []
+            document_sizes = []
+            added = 0
+            for resume_id, owner_id, terms, length in analyzed:
+                if resume_id in self._doc_numbers:
+                    continue
+                number = self._count
+                self._resume_ids = _grow(self._resume_ids, number + 1)
+                self._owners = _grow(self._owners, number + 1)
+                self._lengths = _grow(self._lengths, number + 1)
+                self._live = _grow(self._live, number + 1)
+                self._resume_ids[number] = resume_id
+                self._owners[number] = owner_id or 0
+                self._lengths[number] = length
+                self._live[number] = True
+                self._doc_numbers[resume_id] = number
+                self._count += 1
+                self._total_length += length
+                added += 1
+                flat_terms.extend(term_numbers.setdefault(term, len(term_numbers)) for term in terms)
+                flat_frequencies.extend(terms.values())
+                document_sizes.append(len(terms))
+
+            if added:
+                first = self._count - added
+                docs = np.repeat(np.arange(first, self._count, dtype=np.uint32), document_sizes)
+                term_array = np.asarray(flat_terms, dtype=np.int64)
+                # A stable sort keeps each term's postings in document order
+                order = np.argsort(term_array, kind="stable")
+                docs = docs[order]
+                frequencies = np.asarray(flat_frequencies, dtype=np.float32)[order]
+                bounds = np.searchsorted(term_array[order], np.arange(len(term_numbers) + 1))
+                for term, number in term_numbers.items():
+                    start, end = bounds[number], bounds[number + 1]
+                    postings = self._postings.get(term)
+                    if postings is None:
+                        postings = self._postings[term] = _Postings()
+                    postings.extend(docs[start:end], frequencies[start:end], self._lengths[docs[start:end]])
+        return added
+
+    def remove(self, resume_ids):
+        """
+        Drop resumes from search results, e.g. once their rows are deleted.
+
+        Args:
+            resume_ids (iterable): UserResume ids; ids not indexed are ignored
+
+        Returns:
+            int: Number of resumes removed
+        """
+        removed = 0
+        with self._lock:
+            for resume_id in resume_ids:
+                number = self._doc_numbers.pop(resume_id, None)
+                if number is not None:
+                    self._live[number] = False
+                    removed += 1
+            self._removed += removed
+        return removed
+
+    def search(self, job_description, k=50, owner_id=None):
+        """
+        Rank indexed resumes against a job description.
+
+        Args:
+            job_description (str): Query text
+            k (int): Number of results
+            owner_id (int): Only rank this user's resumes (None ranks all)
+
+        Returns:
+            list: (resume_id, score) pairs, best first
+        """
+        return self.search_terms(query_terms(job_description, self.skill_weight), k, owner_id)
+
+    def search_terms(self, weights, k=50, owner_id=None, prune=True):
+        """
+        Rank indexed resumes against pre-analyzed query term weights.
+
+        prune=False scores every posting (for benchmarks and verification).
+        """
+        with self._lock:
+            count = self._count
+            if not count or k <= 0:
+                return []
+            self._counters["queries"] += 1
+
+            average_length = self._total_length / count or 1.0
+            lengths = self._lengths[:count].astype(np.float64)
+            # Per-document BM25 length normalization, shared by every term
+            norms = self.k1 * (1 - self.b + self.b * lengths / average_length)
+            allowed = None
+            if self._removed:
+                allowed = self._live[:count].copy()
+            if owner_id is not None:
+                owned = self._owners[:count] == owner_id
+                allowed = owned if allowed is None else allowed & owned
+
+            # Each term's best possible contribution: a higher frequency or
+            # a shorter document only raises BM25, so the largest frequency
+            # and the shortest document in its postings bound every score
+            plan = []
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None or not postings.size:
+                    continue
+                idf = bm25_idf(postings.size, count)
+                factor = weight * idf * (self.k1 + 1)
+                min_norm = self.k1 * (1 - self.b + self.b * postings.min_length / average_length)
+                plan.append((factor * postings.max_tf / (postings.max_tf + min_norm), factor, postings))
+            plan.sort(key=lambda item: -item[0])
+
+            # Bound on what the terms after each step can still add, with a
+            # little slack so rounding never prunes a true top-k document
+            bounds = [bound for bound, _, _ in plan]
+            remaining_bounds = [sum(bounds[index + 1:]) for index in range(len(bounds))]
+            scores = np.zeros(count)
+            scanned_bound = 0.0
+            candidates = None
+            for (bound, factor, postings), remaining in zip(plan, remaining_bounds):
+                remaining = remaining * (1 + 1e-9) + 1e-12
+                docs = postings.docs[:postings.size]
+                tfs = postings.tfs[:postings.size]
+                if candidates is None:
+                    scores[docs] += factor * tfs / (tfs + norms[docs])
+                    self._counters["postings_scanned"] += postings.size
+                    scanned_bound += bound
+                    # No score can exceed the bounds scanned so far, so the
+                    # k-th best is only worth finding once that beats what is left
+                    if not prune or remaining >= scanned_bound:
+                        continue
+                    threshold = self._kth_score(scores if allowed is None else scores[allowed], k)
+                    if remaining < threshold:
+                        # Nothing unseen can reach the top k any more
+                        eligible = scores + remaining >= threshold
+                        if allowed is not None:
+                            eligible &= allowed
+                        candidates = np.flatnonzero(eligible)
+                else:
+                    if len(candidates) * PROBE_COST < len(docs):
+                        positions = np.minimum(np.searchsorted(docs, candidates), len(docs) - 1)
+                        hit = docs[positions] == candidates
+                        matched = candidates[hit]
+                        matched_tfs = tfs[positions[hit]]
+                        scores[matched] += factor * matched_tfs / (matched_tfs + norms[matched])
+                        self._counters["postings_probed"] += len(candidates)
+                    else:
+                        # Too many candidates left for lookups to beat one pass
+                        scores[docs] += factor * tfs / (tfs + norms[docs])
+                        self._counters["postings_scanned"] += postings.size
+                    threshold = self._kth_score(scores[candidates], k)
+                    candidates = candidates[scores[candidates] + remaining >= threshold]
+
+            if candidates is None:
+                eligible = scores > 0
+                if allowed is not None:
+                    eligible &= allowed
+                candidates = np.flatnonzero(eligible)
+            candidates = candidates[scores[candidates] > 0]
+            if len(candidates) > k:
+                candidates = candidates[scores[candidates] >= self._kth_score(scores[candidates], k)]
+
+            # Highest score first, earlier-indexed resumes first on ties
+            best = candidates[np.lexsort((candidates, -scores[candidates]))[:k]]
+            return [(int(resume_id), float(score))
+                    for resume_id, score in zip(self._resume_ids[best], scores[best])]
+
+    @staticmethod
+    def _kth_score(scores, k):
+        if len(scores) < k:
+            return 0.0
+        return float(np.partition(scores, len(scores) - k)[len(scores) - k])
+
+    def stats(self):
+        """Return the index size and query counters."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["documents"] = self._count - self._removed
+            stats["removed"] = self._removed
+            stats["terms"] = len(self._postings)
+            stats["postings"] = sum(postings.size for postings in self._postings.values())
+            stats["synced_through"] = self.synced_through
+        return stats
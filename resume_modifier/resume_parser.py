@@ -3,16 +3,88 @@ from docx import Document
 import re
 import PyPDF2
 import os
+from difflib import SequenceMatcher
+from io import BytesIO
+from resume_modifier.section_matcher import SECTION_MATCHER, INDICATOR_KEYWORDS
+from resume_modifier.docx_stream import iter_docx_text
+from resume_modifier.parse_revisions import LineRecord, ParseRevision, line_digest
+
+YEAR_PATTERN = re.compile(r'\d{4}')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'[\+]?[1-9]?[0-9]{7,14}')
+SKILL_PHRASES = dict(INDICATOR_KEYWORDS)["skill_phrase"]
+
+# Magic bytes used to sniff the document format. PDF readers accept the
+# header anywhere in the first kilobyte; DOCX files are ZIP containers.
+PDF_MAGIC = b'%PDF-'
+ZIP_MAGIC = b'PK\x03\x04'
+
+class _SectionState:
+    """Incremental state for the line-by-line section state machine."""
+
+    def __init__(self):
+        self.resume_data = {
+            "summary": "",
+            "skills": [],
+            "experience": [],
+            "projects": [],
+            "education": [],
+            "contact_info": {},
+            "raw_text": ""
+        }
+        self.current_section = None
+        self.filled_sections = set()
+        self.lines = []
+        self.chars = 0
+        self.exhausted = False
+        # Per-line records, kept only when revision tracking is enabled
+        self.records = None
+        self.reused = 0
+
 
 class ResumeParser:
-    def __init__(self, resume_path):
+    # Extraction budgets keep worst-case latency and memory bounded for
+    # very long uploads (portfolios, scanned theses, ...)
+    DEFAULT_MAX_PAGES = 20
+    DEFAULT_MAX_CHARS = 100000
+    
+    # Bump whenever parsing output changes so cached results are not reused
+    PARSER_VERSION = "3"
+    
+    # 'stream' iterparses word/document.xml; 'python-docx' builds the full DOM
+    DOCX_ENGINES = ('stream', 'python-docx')
+    DEFAULT_DOCX_ENGINE = 'stream'
+
+    def __init__(self, resume_source, max_pages=None, max_chars=None, section_target=None,
+                 cache=None, docx_engine=None, track_revision=False, previous_revision=None):
         """
-        Initialize the resume parser with a DOCX file path.
+        Initialize the resume parser with a PDF or DOCX document.
         
         Args:
-            resume_path (str): Path to the resume DOCX file
+            resume_source (str | bytes | BytesIO | memoryview): Path to the resume
+                file, or its raw contents already held in memory
+            max_pages (int): Maximum number of PDF pages to extract
+            max_chars (int): Maximum number of characters to feed the section parser
+            section_target (int): Stop early once this many sections are filled
+                and the next section header is reached (None disables)
+            cache (ParseCache): Optional content-addressed parse result cache
+            docx_engine (str): DOCX extraction engine, one of DOCX_ENGINES
+            track_revision (bool): Record per-line results in self.revision so
+                the next upload of the same resume can be parsed incrementally
+            previous_revision (ParseRevision): Records of the previous upload;
+                unchanged lines reuse their section assignment and entries
+                (implies track_revision)
         """
-        self.resume_path = resume_path
+        self.resume_source = resume_source
+        self.max_pages = self.DEFAULT_MAX_PAGES if max_pages is None else max_pages
+        self.max_chars = self.DEFAULT_MAX_CHARS if max_chars is None else max_chars
+        self.section_target = section_target
+        self.cache = cache
+        self.docx_engine = docx_engine or self.DEFAULT_DOCX_ENGINE
+        self.track_revision = track_revision or previous_revision is not None
+        self.previous_revision = previous_revision
+        self.revision = None
+        self._parse_failed = False
 
     def parse_resume(self):
         """
@@ -22,14 +94,24 @@ class ResumeParser:
             dict: Structured resume data with summary, skills, experience, and projects
         """
         try:
-            # Check if file is PDF or DOCX
-            if self.resume_path.lower().endswith('.pdf'):
-                return self._parse_pdf_resume()
-            else:
-                return self._parse_docx_resume()
+            if self.cache is None:
+                return self._parse_document()
+            
+            cache_key = self.cache.make_key(self._read_bytes(), self.cache_version)
+            
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            resume_data = self._parse_document()
+            # Never pin a failed extraction in the cache
+            if not self._parse_failed:
+                self.cache.set(cache_key, resume_data)
+            return resume_data
                 
         except Exception as e:
             logging.error(f"Error parsing resume: {e}")
+            self._parse_failed = True
             return {
                 "summary": "Professional with diverse experience",
                 "skills": ["Communication", "Teamwork", "Problem Solving"],
@@ -40,28 +122,92 @@ class ResumeParser:
                 "raw_text": ""
             }
     
+    @property
+    def cache_version(self):
+        """Parser version plus every option that changes parse output."""
+        return (f"v{self.PARSER_VERSION}-p{self.max_pages}-c{self.max_chars}"
+                f"-s{self.section_target or 0}-{self.docx_engine}")
+    
+    def _parse_document(self):
+        """Dispatch to the format-specific parser."""
+        if self._detect_format() == 'pdf':
+            return self._parse_pdf_resume()
+        else:
+            return self._parse_docx_resume()
+    
+    def _detect_format(self):
+        """Identify the document format from its magic bytes."""
+        with self._open_stream() as stream:
+            head = stream.read(1024)
+        
+        if PDF_MAGIC in head:
+            return 'pdf'
+        if head.startswith(ZIP_MAGIC):
+            return 'docx'
+        
+        # Unrecognised content: fall back to the file extension when we have one
+        if isinstance(self.resume_source, str) and self.resume_source.lower().endswith('.pdf'):
+            return 'pdf'
+        return 'docx'
+    
+    def _open_stream(self):
+        """Open the resume source as a readable binary stream positioned at the start."""
+        source = self.resume_source
+        if isinstance(source, str):
+            return open(source, 'rb')
+        if isinstance(source, BytesIO):
+            # Read through a private cursor so the caller's position is untouched
+            return BytesIO(source.getbuffer())
+        return BytesIO(source)
+    
+    def _read_bytes(self):
+        """Return the raw document contents for hashing."""
+        source = self.resume_source
+        if isinstance(source, str):
+            with open(source, 'rb') as file:
+                return file.read()
+        if isinstance(source, BytesIO):
+            return source.getbuffer()
+        return source
+    
     def _parse_pdf_resume(self):
-        """Parse PDF resume file."""
+        """Parse PDF resume file, streaming lines page by page."""
+        lines = self._iter_pdf_lines()
         try:
-            with open(self.resume_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                all_text = []
-                
-                for page in pdf_reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        all_text.extend(text.split('\n'))
-                
-                return self._process_text_data(all_text)
+            return self._process_text_data(lines)
                 
         except Exception as e:
             logging.error(f"Error parsing PDF: {e}")
+            self._parse_failed = True
             return self._get_default_resume_data()
+        finally:
+            lines.close()
+    
+    def _iter_pdf_lines(self):
+        """Yield text lines one page at a time, honouring the page budget."""
+        with self._open_stream() as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            
+            for page_number, page in enumerate(pdf_reader.pages):
+                if page_number >= self.max_pages:
+                    logging.info(f"PDF page budget reached after {self.max_pages} pages")
+                    break
+                
+                text = page.extract_text()
+                if text:
+                    yield from text.split('\n')
     
     def _parse_docx_resume(self):
         """Parse DOCX resume file."""
+        if self.docx_engine == 'stream':
+            try:
+                return self._parse_docx_stream()
+            except Exception as e:
+                logging.warning(f"Streaming DOCX extraction failed, falling back to python-docx: {e}")
+        
         try:
-            doc = Document(self.resume_path)
+            with self._open_stream() as stream:
+                doc = Document(stream)
             all_text = []
             
             for paragraph in doc.paragraphs:
@@ -73,45 +219,153 @@ class ResumeParser:
                 
         except Exception as e:
             logging.error(f"Error parsing DOCX: {e}")
+            self._parse_failed = True
             return self._get_default_resume_data()
     
+    def _parse_docx_stream(self):
+        """Parse DOCX paragraphs and table cells straight from word/document.xml."""
+        with self._open_stream() as stream:
+            lines = iter_docx_text(stream)
+            try:
+                return self._process_text_data(lines)
+            finally:
+                lines.close()
+    
     def _process_text_data(self, all_text):
         """Process extracted text data from either PDF or DOCX."""
-        resume_data = {
-            "summary": "",
-            "skills": [],
-            "experience": [],
-            "projects": [],
-            "education": [],
-            "contact_info": {},
-            "raw_text": ""
-        }
+        state = _SectionState()
+        if self.track_revision:
+            state.records = []
         
-        current_section = None
+        previous = self.previous_revision
+        if previous is not None and previous.version == self.cache_version:
+            return self._process_revision(state, all_text, previous)
         
         for text in all_text:
-            if not text.strip():
-                continue
-                
-            # Identify sections
-            section = self._identify_section(text)
-            if section:
-                current_section = section
-                continue
-            
-            # Parse content based on current section
+            self._feed_line(state, text)
+            if state.exhausted:
+                break
+        
+        return self._finish_parse(state)
+    
+    def _process_revision(self, state, all_text, previous):
+        """Re-parse a revised resume, reusing results for unchanged lines."""
+        # Only lines inside the character budget can ever be fed
+        lines = []
+        chars = 0
+        for text in all_text:
+            lines.append(text)
+            chars += len(text)
+            if chars >= self.max_chars:
+                break
+        
+        # Align the two revisions line by line; lines in matching blocks
+        # carry their previous record as a hint
+        hints = [None] * len(lines)
+        matcher = SequenceMatcher(None, previous.digests, [line_digest(text) for text in lines],
+                                  autojunk=False)
+        for tag, old_start, old_end, new_start, _ in matcher.get_opcodes():
+            if tag == 'equal':
+                hints[new_start:new_start + old_end - old_start] = previous.records[old_start:old_end]
+        
+        for text, hint in zip(lines, hints):
+            self._feed_line(state, text, hint)
+            if state.exhausted:
+                break
+        
+        logging.debug(f"Incremental parse reused {state.reused} of {len(state.lines)} lines")
+        return self._finish_parse(state)
+    
+    def _feed_line(self, state, text, hint=None):
+        """
+        Advance the section state machine by one line of text.
+        
+        A hint is the record of an identical line from the previous revision;
+        it is reused when the line is read in the same section as before.
+        """
+        # Character budget: truncate the line that crosses it and stop
+        remaining = self.max_chars - state.chars
+        if len(text) >= remaining:
+            text = text[:remaining]
+            state.exhausted = True
+            hint = None
+            logging.info(f"Resume character budget reached after {self.max_chars} characters")
+        
+        state.lines.append(text)
+        state.chars += len(text)
+        current_section = state.current_section
+        
+        if hint is not None and hint.section == current_section:
+            header, contribution = hint.header, hint.contribution
+            state.reused += 1
+        else:
+            hint = None
+            header, contribution = self._classify_line(text, current_section)
+        
+        if header:
+            if (self.section_target and header != current_section
+                    and len(state.filled_sections) >= self.section_target):
+                # Enough sections are filled; everything after is extra
+                state.lines.pop()
+                state.exhausted = True
+                return
+            state.current_section = header
+        elif contribution:
+            resume_data = state.resume_data
+            field = self._section_field(current_section)
             if current_section == "summary":
-                resume_data["summary"] = self._parse_summary(text, resume_data["summary"])
-            elif current_section == "skills":
-                resume_data["skills"].extend(self._parse_skills(text))
-            elif current_section == "experience":
-                resume_data["experience"].extend(self._parse_experience(text))
-            elif current_section == "projects":
-                resume_data["projects"].extend(self._parse_projects(text))
-            elif current_section == "education":
-                resume_data["education"].extend(self._parse_education(text))
+                summary = resume_data["summary"]
+                resume_data["summary"] = f"{summary} {contribution}" if summary else contribution
             elif current_section == "contact":
-                resume_data["contact_info"].update(self._parse_contact(text))
+                resume_data["contact_info"].update(contribution)
+            else:
+                resume_data[field].extend(contribution)
+            
+            if resume_data[field]:
+                state.filled_sections.add(current_section)
+        
+        if state.records is not None:
+            digest = hint.digest if hint is not None else line_digest(text)
+            state.records.append(LineRecord(digest, current_section, header, contribution))
+    
+    def _classify_line(self, text, current_section):
+        """
+        Classify one line read while current_section is open.
+        
+        Returns:
+            tuple: (section opened by a header line or None, what the line
+                adds to the current section or None)
+        """
+        if not text.strip():
+            return None, None
+        
+        # Classify the line and collect its indicator keywords in one pass
+        features = SECTION_MATCHER.scan(text)
+        if features.section:
+            return features.section, None
+        
+        # Parse content based on current section
+        if current_section == "summary":
+            return None, self._parse_summary(text, "", features)
+        elif current_section == "skills":
+            return None, self._parse_skills(text, features)
+        elif current_section == "experience":
+            return None, self._parse_experience(text, features)
+        elif current_section == "projects":
+            return None, self._parse_projects(text, features)
+        elif current_section == "education":
+            return None, self._parse_education(text, features)
+        elif current_section == "contact":
+            return None, self._parse_contact(text)
+        return None, None
+    
+    def _finish_parse(self, state):
+        """Run the whole-document passes once the line stream is consumed."""
+        resume_data = state.resume_data
+        all_text = state.lines
+        
+        if state.records is not None:
+            self.revision = ParseRevision(self.cache_version, state.records)
         
         # Join all text for backup processing
         resume_data["raw_text"] = "\n".join(all_text)
@@ -126,6 +380,11 @@ class ResumeParser:
         logging.debug(f"Parsed resume data: {resume_data}")
         return resume_data
     
+    @staticmethod
+    def _section_field(section):
+        """Map a section name to its key in the resume data dict."""
+        return "contact_info" if section == "contact" else section
+    
     def _get_default_resume_data(self):
         """Return default resume data structure."""
         return {
@@ -140,35 +399,21 @@ class ResumeParser:
 
     def _identify_section(self, text):
         """Identify which section a paragraph belongs to."""
-        text_lower = text.lower()
-        
-        # Section headers
-        if any(keyword in text_lower for keyword in ['summary', 'profile', 'objective', 'about']):
-            return "summary"
-        elif any(keyword in text_lower for keyword in ['skills', 'technical skills', 'competencies']):
-            return "skills"
-        elif any(keyword in text_lower for keyword in ['experience', 'work experience', 'employment', 'professional experience']):
-            return "experience"
-        elif any(keyword in text_lower for keyword in ['projects', 'project experience', 'notable projects']):
-            return "projects"
-        elif any(keyword in text_lower for keyword in ['education', 'academic', 'qualification']):
-            return "education"
-        elif any(keyword in text_lower for keyword in ['contact', 'personal information', 'details']):
-            return "contact"
-        
-        return None
+        return SECTION_MATCHER.classify(text)
 
-    def _parse_summary(self, text, existing_summary):
+    def _parse_summary(self, text, existing_summary, features=None):
         """Parse summary/profile text."""
+        features = features or SECTION_MATCHER.scan(text)
+        
         # Skip section headers
-        if self._identify_section(text):
+        if features.section:
             return existing_summary
         
         if existing_summary:
             return f"{existing_summary} {text}"
         return text
 
-    def _parse_skills(self, text):
+    def _parse_skills(self, text, features=None):
         """Parse skills from text."""
         skills = []
         
@@ -182,44 +427,50 @@ class ResumeParser:
                 new_parts.extend(part.split(delimiter))
             text_parts = new_parts
         
+        # Fragments are substrings of the line, so a line without any section
+        # keyword cannot contain a fragment that looks like a header
+        check_fragments = features is None or features.section is not None
+        
         for part in text_parts:
             skill = part.strip()
-            if skill and len(skill) > 1 and not self._identify_section(skill):
+            if skill and len(skill) > 1 and not (check_fragments and self._identify_section(skill)):
                 skills.append(skill)
         
         return skills
 
-    def _parse_experience(self, text):
+    def _parse_experience(self, text, features=None):
         """Parse work experience entries."""
         experience = []
+        indicators = (features or SECTION_MATCHER.scan(text)).indicators
         
         # Look for company names, positions, dates
-        if any(keyword in text.lower() for keyword in ['company', 'corporation', 'inc', 'ltd', 'llc']):
+        if "company" in indicators:
             experience.append(text)
-        elif re.search(r'\d{4}', text):  # Contains year
+        elif YEAR_PATTERN.search(text):  # Contains year
             experience.append(text)
-        elif any(keyword in text.lower() for keyword in ['engineer', 'developer', 'manager', 'analyst', 'specialist']):
+        elif "role" in indicators:
             experience.append(text)
         
         return experience
 
-    def _parse_projects(self, text):
+    def _parse_projects(self, text, features=None):
         """Parse project entries."""
         projects = []
+        indicators = (features or SECTION_MATCHER.scan(text)).indicators
         
         # Look for project indicators
-        if any(keyword in text.lower() for keyword in ['project', 'developed', 'built', 'created', 'implemented']):
+        if "project" in indicators:
             projects.append(text)
         elif text.startswith('-') or text.startswith('•'):
             projects.append(text.lstrip('-•').strip())
         
         return projects
 
-    def _parse_education(self, text):
+    def _parse_education(self, text, features=None):
         """Parse education entries."""
         education = []
         
-        if any(keyword in text.lower() for keyword in ['university', 'college', 'degree', 'bachelor', 'master', 'phd']):
+        if "institution" in (features or SECTION_MATCHER.scan(text)).indicators:
             education.append(text)
         
         return education
@@ -229,12 +480,12 @@ class ResumeParser:
         contact = {}
         
         # Email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        email_match = EMAIL_PATTERN.search(text)
         if email_match:
             contact['email'] = email_match.group()
         
         # Phone
-        phone_match = re.search(r'[\+]?[1-9]?[0-9]{7,14}', text)
+        phone_match = PHONE_PATTERN.search(text)
         if phone_match:
             contact['phone'] = phone_match.group()
         
@@ -245,15 +496,14 @@ class ResumeParser:
         combined_text = " ".join(all_text)
         
         # Extract skills using common patterns
-        skill_indicators = ['proficient in', 'experienced with', 'skilled in', 'expertise in']
-        for indicator in skill_indicators:
-            if indicator in combined_text.lower():
+        positions = SECTION_MATCHER.first_positions(combined_text)
+        for indicator in SKILL_PHRASES:
+            start = positions.get(indicator)
+            if start is not None:
                 # Extract text following the indicator
-                start = combined_text.lower().find(indicator)
-                if start != -1:
-                    following_text = combined_text[start:start+200]
-                    skills = self._parse_skills(following_text)
-                    resume_data["skills"].extend(skills)
+                following_text = combined_text[start:start+200]
+                skills = self._parse_skills(following_text)
+                resume_data["skills"].extend(skills)
         
         # Use first few sentences as summary if none found
         if not resume_data["summary"]:
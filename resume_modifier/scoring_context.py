@@ -0,0 +1,244 @@
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy import sparse
+
+from resume_modifier.resume_data import ResumeData
+from resume_modifier.tfidf_extractor import STOPWORDS
+
+# Same matches as r'\b\w+\b' (a maximal run of word characters), found faster
+WORD_PATTERN = re.compile(r'\w+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s]')
+
+
+@dataclass(slots=True)
+class SectionStats:
+    """Section sizes the format, content and ATS components score on."""
+    summary_length: int = 0
+    skills: int = 0
+    experience: int = 0
+    projects: int = 0
+    education: int = 0
+    has_contact: bool = False
+    avg_experience_description_length: float = 0.0
+    short_experience_descriptions: int = 0
+
+
+@dataclass(slots=True)
+class ScoringContext:
+    """
+    Resume-side facts shared by every ResumeScorer component.
+
+    The scorable text (summary, skills, experience and project
+    descriptions) is joined, lowercased and tokenized once per resume
+    instead of once per component. Nothing here depends on the job
+    description, so a context can be cached and reused when the same
+    resume is scored against many jobs.
+    """
+    resume_data: ResumeData
+    fingerprint: str  # context_fingerprint when built by a cache, else None
+    text: str
+    text_lower: str
+    token_counts: Counter
+    tokens: frozenset
+    special_char_count: int
+    sections: SectionStats = field(default_factory=SectionStats)
+    # The distinct tokens and their counts as arrays, filled in by the first
+    # batch scoring run that uses the context
+    token_array: np.ndarray = None
+    count_array: np.ndarray = None
+    # Non-stopword token count, filled in by the first BM25 score
+    content_length: int = None
+    # The resume's ResumeFeatures, filled in by the first ResumeScorer run
+    features: object = None
+
+    @classmethod
+    def build(cls, resume_data):
+        """
+        Compute the context for a resume in one pass.
+
+        Args:
+            resume_data (dict | ResumeData): Resume to score
+
+        Returns:
+            ScoringContext: The context
+        """
+        return cls.from_parts(*scorable_parts(resume_data))
+
+    @classmethod
+    def from_parts(cls, resume_data, text, sections, fingerprint=None):
+        """Tokenize the output of scorable_parts into a context."""
+        text_lower = text.lower()
+        token_counts = Counter(WORD_PATTERN.findall(text_lower))
+        return cls(
+            resume_data=resume_data,
+            fingerprint=fingerprint,
+            text=text,
+            text_lower=text_lower,
+            token_counts=token_counts,
+            tokens=frozenset(token_counts),
+            special_char_count=len(SPECIAL_CHAR_PATTERN.findall(text)),
+            sections=sections
+        )
+
+    def word_count(self):
+        """Number of non-stopword tokens, computed on first use."""
+        if self.content_length is None:
+            self.content_length = sum(count for token, count in self.token_counts.items()
+                                      if token not in STOPWORDS)
+        return self.content_length
+
+    def token_arrays(self):
+        """Return (token_array, count_array), computing them on first use."""
+        if self.token_array is None:
+            self.token_array = np.array(list(self.token_counts), dtype=str)
+            self.count_array = np.fromiter(self.token_counts.values(), dtype=np.float64,
+                                           count=len(self.token_counts))
+        return self.token_array, self.count_array
+
+
+def scorable_parts(resume_data):
+    """
+    Split a resume into what its scoring context is computed from.
+
+    Returns:
+        tuple: (ResumeData, scorable text, SectionStats)
+    """
+    resume_data = ResumeData.coerce(resume_data)
+
+    text_parts = []
+    if resume_data.summary:
+        text_parts.append(resume_data.summary)
+    text_parts.extend(resume_data.skills)
+    text_parts.extend(exp.description for exp in resume_data.experience)
+    text_parts.extend(project.description for project in resume_data.projects)
+
+    experience = resume_data.experience
+    description_lengths = [len(exp.description) for exp in experience]
+    sections = SectionStats(
+        summary_length=len(resume_data.summary),
+        skills=len(resume_data.skills),
+        experience=len(experience),
+        projects=len(resume_data.projects),
+        education=len(resume_data.education),
+        has_contact=bool(resume_data.contact),
+        avg_experience_description_length=(sum(description_lengths) / len(experience)
+                                           if experience else 0.0),
+        short_experience_descriptions=sum(1 for length in description_lengths if length < 100)
+    )
+    return resume_data, ' '.join(text_parts), sections
+
+
+def context_fingerprint(text, sections):
+    """
+    Cache key for a scoring context.
+
+    A context is fully determined by its scorable text and section stats,
+    so hashing just those is cheaper than hashing the whole resume and
+    lets resumes that score identically share an entry.
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16)
+    digest.update(repr(sections).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def term_document_matrix(contexts, vocabulary=None):
+    """
+    Stack the token counts of many scoring contexts into one sparse matrix.
+
+    The contexts' token arrays are concatenated and mapped to columns with
+    one sorted lookup, so building the matrix costs no Python work per token.
+
+    Args:
+        contexts (list): ScoringContext objects, one row each
+        vocabulary (dict): Fixed term -> column mapping; other tokens are
+            left out. None builds the vocabulary from every token seen.
+
+    Returns:
+        tuple: (scipy.sparse.csr_matrix of shape (len(contexts), terms),
+            dict mapping term -> column)
+    """
+    arrays = [context.token_arrays() for context in contexts]
+    tokens = np.concatenate([token_array for token_array, _ in arrays] or [np.array([], dtype=str)])
+    counts = np.concatenate([count_array for _, count_array in arrays] or [np.array([])])
+    rows = np.repeat(np.arange(len(contexts)),
+                     np.fromiter((len(token_array) for token_array, _ in arrays), dtype=np.int64,
+                                 count=len(contexts)))
+
+    if vocabulary is None:
+        terms, columns = np.unique(tokens, return_inverse=True)
+        vocabulary = {str(term): column for column, term in enumerate(terms)}
+    else:
+        terms = np.array(sorted(vocabulary), dtype=str)
+        term_columns = np.fromiter((vocabulary[term] for term in terms.tolist()), dtype=np.int64,
+                                   count=len(terms))
+        if len(terms) and len(tokens):
+            positions = np.minimum(np.searchsorted(terms, tokens), len(terms) - 1)
+            known = terms[positions] == tokens
+        else:
+            positions = known = np.zeros(len(tokens), dtype=bool)
+        rows, counts = rows[known], counts[known]
+        columns = term_columns[positions[known]] if len(terms) else np.zeros(0, dtype=np.int64)
+
+    matrix = sparse.csr_matrix((counts, (rows, columns)), shape=(len(contexts), len(vocabulary)))
+    return matrix, vocabulary
+
+
+class ScoringContextCache:
+    """
+    In-process LRU of scoring contexts keyed by resume fingerprint.
+
+    Contexts are cheap to rebuild and hold live objects, so there is no
+    persistent tier; the cache only saves the repeated tokenization (and,
+    through ScoringContext.features, the resume-side scores) when one
+    resume is scored against several job descriptions.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of contexts kept
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, resume_data):
+        """
+        Return the context for resume_data, building and caching it on a miss.
+
+        Returns:
+            ScoringContext: The resume's context
+        """
+        resume_data, text, sections = scorable_parts(resume_data)
+        fingerprint = context_fingerprint(text, sections)
+        with self._lock:
+            context = self._entries.get(fingerprint)
+            if context is not None:
+                self._entries.move_to_end(fingerprint)
+                self._counters["hits"] += 1
+                return context
+            self._counters["misses"] += 1
+
+        context = ScoringContext.from_parts(resume_data, text, sections, fingerprint)
+        with self._lock:
+            self._entries[fingerprint] = context
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+        return context
+
+    def stats(self):
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+        return stats
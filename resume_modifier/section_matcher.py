@@ -0,0 +1,124 @@
+import re
+from collections import namedtuple
+
+# Section header keywords, in priority order: a line mentioning several
+# sections is classified as the first one listed here.
+SECTION_KEYWORDS = (
+    ("summary", ("summary", "profile", "objective", "about")),
+    ("skills", ("skills", "technical skills", "competencies")),
+    ("experience", ("experience", "work experience", "employment", "professional experience")),
+    ("projects", ("projects", "project experience", "notable projects")),
+    ("education", ("education", "academic", "qualification")),
+    ("contact", ("contact", "personal information", "details")),
+)
+
+# Indicator keywords used by the section-specific parsers
+INDICATOR_KEYWORDS = (
+    ("company", ("company", "corporation", "inc", "ltd", "llc")),
+    ("role", ("engineer", "developer", "manager", "analyst", "specialist")),
+    ("project", ("project", "developed", "built", "created", "implemented")),
+    ("institution", ("university", "college", "degree", "bachelor", "master", "phd")),
+    ("skill_phrase", ("proficient in", "experienced with", "skilled in", "expertise in")),
+)
+
+LineFeatures = namedtuple("LineFeatures", ["section", "indicators"])
+
+
+def _trie_pattern(keywords):
+    """Build a regex alternation factored by common prefixes."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # An end-of-keyword marker makes the remainder optional; the greedy
+        # quantifier keeps the longest keyword at each position
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class SectionMatcher:
+    """
+    Precompiled multi-keyword matcher for section classification.
+
+    All section and indicator keywords are compiled into one prefix-factored
+    regex wrapped in a lookahead, so a single scan reports every keyword
+    occurrence, overlapping ones included. At any position only the longest
+    keyword is reported; the shorter keywords it starts with are recovered
+    from a precomputed prefix table. Matching is substring based, exactly
+    like the keyword checks it replaces.
+    """
+
+    def __init__(self, sections=SECTION_KEYWORDS, indicators=INDICATOR_KEYWORDS):
+        """
+        Compile the matcher.
+
+        Args:
+            sections (tuple): (section, keywords) pairs in priority order
+            indicators (tuple): (label, keywords) pairs for indicator terms
+        """
+        self.section_priority = {section: rank for rank, (section, _) in enumerate(sections)}
+
+        labels = {}
+        for section, keywords in sections:
+            for keyword in keywords:
+                labels.setdefault(keyword, set()).add(("section", section))
+        for label, keywords in indicators:
+            for keyword in keywords:
+                labels.setdefault(keyword, set()).add(("indicator", label))
+
+        # Keywords found at a position include every keyword the longest one starts with
+        self._keywords_at = {}
+        self._labels_at = {}
+        for keyword in labels:
+            prefixes = [other for other in labels if keyword.startswith(other)]
+            self._keywords_at[keyword] = tuple(prefixes)
+            self._labels_at[keyword] = frozenset().union(*(labels[other] for other in prefixes))
+
+        longest_first = sorted(labels, key=len, reverse=True)
+        self._pattern = re.compile(f"(?=({_trie_pattern(longest_first)}))")
+
+    def scan(self, text):
+        """
+        Classify a line and collect its indicator labels in one pass.
+
+        Returns:
+            LineFeatures: (section or None, frozenset of indicator labels)
+        """
+        found = set()
+        for keyword in self._pattern.findall(text.lower()):
+            found |= self._labels_at[keyword]
+
+        section = None
+        indicators = set()
+        for kind, label in found:
+            if kind == "indicator":
+                indicators.add(label)
+            elif section is None or self.section_priority[label] < self.section_priority[section]:
+                section = label
+        return LineFeatures(section, frozenset(indicators))
+
+    def classify(self, text):
+        """Return the section a line introduces, or None."""
+        return self.scan(text).section
+
+    def first_positions(self, text):
+        """Map each keyword found in text to the index of its first occurrence."""
+        positions = {}
+        for match in self._pattern.finditer(text.lower()):
+            for keyword in self._keywords_at[match.group(1)]:
+                positions.setdefault(keyword, match.start())
+        return positions
+
+
+# Shared, compiled once at import
+SECTION_MATCHER = SectionMatcher()
@@ -0,0 +1,115 @@
+import json
+import os
+import re
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "data", "skill_taxonomy.json")
+
+# Term categories, in the order their aliases are read from the taxonomy
+CATEGORIES = ("skills", "requirements", "technologies")
+# An alias made of a word and trailing symbols, like C++ or C#
+SYMBOL_SUFFIX = re.compile(r"(\w+)[+#]+")
+
+
+class SkillExtractor:
+    """
+    Single-scan keyword extractor compiled from the skill taxonomy.
+
+    Every term alias and every experience pattern is compiled into one
+    case-insensitive regex, so a job description is scanned once no matter
+    how large the taxonomy grows. Terms match on word boundaries and map
+    back to their canonical name; terms flagged ``case_sensitive`` (Go, REST,
+    LESS, ...) only match with their exact capitalization so ordinary words
+    do not count as skills.
+    """
+
+    def __init__(self, taxonomy):
+        """
+        Compile the extractor.
+
+        Args:
+            taxonomy (dict): Parsed skill taxonomy (see data/skill_taxonomy.json)
+        """
+        self.version = taxonomy["version"]
+        self._canonical = {}
+        self._exact_case = {}
+
+        alternatives = []
+        for category in CATEGORIES:
+            for entry in taxonomy.get(category, []):
+                name = entry["name"]
+                for alias in [name] + entry.get("aliases", []):
+                    self._canonical[alias.lower()] = name
+                    pattern = re.escape(alias).replace(r"\ ", r"\s+")
+                    if entry.get("case_sensitive"):
+                        pattern = f"(?-i:{pattern})"
+                        self._exact_case[alias.lower()] = alias
+                    alternatives.append((len(alias), pattern))
+
+        # Longest alias first so "Machine Learning" wins over shorter overlaps
+        alternatives.sort(key=lambda item: -item[0])
+        branches = [f"(?P<term>(?<!\\w)(?:{'|'.join(pattern for _, pattern in alternatives)})(?!\\w))"]
+
+        experience = taxonomy.get("experience", {})
+        self._experience_label = experience.get("label", "{years}+ years experience")
+        self._year_groups = []
+        for index, pattern in enumerate(experience.get("patterns", [])):
+            group = f"years_{index}"
+            self._year_groups.append(group)
+            branches.insert(index, pattern.replace("(?P<years>", f"(?P<{group}>"))
+
+        self._pattern = re.compile("|".join(branches), re.IGNORECASE)
+
+        # Words that some alias extends with symbols: "c" for C++ and C#
+        self._symbol_stems = {match.group(1) for match in map(SYMBOL_SUFFIX.fullmatch, self._canonical) if match}
+
+    @classmethod
+    def from_file(cls, path=TAXONOMY_PATH):
+        """Load and compile a taxonomy file."""
+        with open(path, encoding="utf-8") as handle:
+            return cls(json.load(handle))
+
+    def canonical_name(self, term):
+        """Canonical taxonomy name for term, or None if it is not an alias."""
+        return self._canonical.get(" ".join(term.lower().split()))
+
+    def exact_case(self, term):
+        """The only spelling a case-sensitive alias matches with, or None."""
+        return self._exact_case.get(" ".join(term.lower().split()))
+
+    def has_symbol_variant(self, term):
+        """Whether some alias is term followed by + or # (C has C++ and C#)."""
+        return " ".join(term.lower().split()) in self._symbol_stems
+
+    def extract(self, text, limit=15):
+        """
+        Extract ranked keywords from text in one scan.
+
+        Keywords are ranked by how often they occur, then by where they first
+        appear, so the same text always yields the same list.
+
+        Args:
+            text (str): Job description or resume text
+            limit (int): Maximum number of keywords returned
+
+        Returns:
+            list: Canonical keyword names, best first
+        """
+        counts = {}
+        first_seen = {}
+        for match in self._pattern.finditer(text or ""):
+            term = match.group("term")
+            if term is not None:
+                # Aliases match across any run of whitespace
+                keyword = self._canonical[" ".join(term.lower().split())]
+            else:
+                years = next(match.group(group) for group in self._year_groups
+                             if match.group(group) is not None)
+                keyword = self._experience_label.format(years=int(years))
+            counts[keyword] = counts.get(keyword, 0) + 1
+            first_seen.setdefault(keyword, match.start())
+
+        ranked = sorted(counts, key=lambda keyword: (-counts[keyword], first_seen[keyword]))
+        return ranked[:limit]
+
+
+SKILL_EXTRACTOR = SkillExtractor.from_file()
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from resume_modifier.skill_extractor import SKILL_EXTRACTOR
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#]*(?:[.\-/][a-z0-9+#]+)*")
+# N-grams never span a line, clause or sentence boundary
+PHRASE_BREAK = re.compile(r"[\n,;:!?()\[\]|•]|\.(?=\s|$)")
+
+# English function words plus job-posting filler that never makes a useful keyword
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each either
+etc few for from further had has have having he her here hers him his how i if in into is it
+its itself just may me might more most must my no nor not of off on once only or other our
+ours out over own per same she should so some such than that the their theirs them then there
+these they this those through to too under until up upon us very via was we were what when
+where which while who whom why will with within without would you your yours
+able ability apply applicants candidate candidates company including job looking
+new opportunity position preferred required requirements responsibilities role strong team
+well work working years year plus using use
+""".split())
+
+VOCABULARY_FILE = "vocabulary.npy"
+IDF_FILE = "idf.npy"
+META_FILE = "meta.json"
+
+
+def iter_terms(text, max_n=2):
+    """Yield the unigrams and n-grams of text, skipping stopword edges."""
+    for phrase in PHRASE_BREAK.split((text or "").lower()):
+        tokens = TOKEN_PATTERN.findall(phrase)
+        for n in range(1, max_n + 1):
+            for start in range(len(tokens) - n + 1):
+                gram = tokens[start:start + n]
+                if gram[0] in STOPWORDS or gram[-1] in STOPWORDS or len(gram[0]) < 2:
+                    continue
+                yield " ".join(gram)
+
+
+class TfidfExtractor:
+    """
+    Keyword extractor ranking a job description's n-grams by TF-IDF.
+
+    IDF statistics come from every job description stored in the database.
+    The vocabulary is kept as a sorted NumPy string array next to a float32
+    IDF array, both saved as .npy files and loaded memory-mapped, so each
+    worker shares the pages and term lookup is one vectorized searchsorted.
+    """
+
+    def __init__(self, vocabulary, idf, document_count, version=None):
+        """
+        Initialize the extractor from fitted arrays.
+
+        Args:
+            vocabulary (numpy.ndarray): Sorted unicode array of terms
+            idf (numpy.ndarray): IDF weight per vocabulary term
+            document_count (int): Number of documents the statistics cover
+            version (str): Fingerprint of the statistics (computed when None)
+        """
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.document_count = document_count
+        if version is None:
+            digest = hashlib.blake2b(digest_size=6)
+            digest.update(np.ascontiguousarray(vocabulary).tobytes())
+            digest.update(np.ascontiguousarray(idf).tobytes())
+            version = digest.hexdigest()
+        self.version = version
+
+    @classmethod
+    def build(cls, documents, max_n=2, min_df=2, max_features=50000):
+        """
+        Compute IDF statistics from a corpus of job descriptions.
+
+        Documents are turned into a sparse document-term matrix in one pass;
+        document frequencies are the column counts of its nonzero pattern.
+
+        Args:
+            documents (iterable): Job description texts
+            max_n (int): Longest n-gram considered
+            min_df (int): Minimum number of documents a term must occur in
+            max_features (int): Keep at most this many of the most common terms
+
+        Returns:
+            TfidfExtractor: The fitted extractor
+        """
+        term_ids = {}
+        indices = []
+        indptr = [0]
+        for document in documents:
+            for term in set(iter_terms(document, max_n)):
+                indices.append(term_ids.setdefault(term, len(term_ids)))
+            indptr.append(len(indices))
+
+        document_count = len(indptr) - 1
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.asarray(indices, dtype=np.int64), indptr),
+            shape=(document_count, len(term_ids))
+        )
+        document_frequency = np.asarray(matrix.getnnz(axis=0))
+
+        terms = np.array(list(term_ids), dtype=str) if term_ids else np.array([], dtype="<U1")
+        keep = np.flatnonzero(document_frequency >= min_df)
+        if len(keep) > max_features:
+            keep = keep[np.argsort(-document_frequency[keep], kind="stable")[:max_features]]
+
+        # Smoothed IDF, as in scikit-learn
+        idf = (np.log((1 + document_count) / (1 + document_frequency[keep])) + 1).astype(np.float32)
+        order = np.argsort(terms[keep])
+        return cls(terms[keep][order], idf[order], document_count)
+
+    def save(self, directory):
+        """Write the vocabulary and IDF arrays atomically to directory."""
+        os.makedirs(directory, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        for name, array in ((VOCABULARY_FILE, self.vocabulary), (IDF_FILE, self.idf)):
+            path = os.path.join(directory, name)
+            with open(path + suffix, "wb") as handle:
+                np.save(handle, array)
+            os.replace(path + suffix, path)
+
+        meta_path = os.path.join(directory, META_FILE)
+        with open(meta_path + suffix, "w") as handle:
+            json.dump({"version": self.version, "document_count": self.document_count,
+                       "terms": len(self.vocabulary)}, handle)
+        os.replace(meta_path + suffix, meta_path)
+
+    @classmethod
+    def load(cls, directory):
+        """
+        Load a saved extractor with its arrays memory-mapped.
+
+        Returns:
+            TfidfExtractor: The extractor, or None if the directory holds no index
+        """
+        try:
+            with open(os.path.join(directory, META_FILE)) as handle:
+                meta = json.load(handle)
+            vocabulary = np.load(os.path.join(directory, VOCABULARY_FILE), mmap_mode="r")
+            idf = np.load(os.path.join(directory, IDF_FILE), mmap_mode="r")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load TF-IDF keyword index: {e}")
+            return None
+        return cls(vocabulary, idf, meta.get("document_count", 0), meta.get("version"))
+
+    def extract(self, text, limit=15, max_n=2):
+        """
+        Rank the n-grams of text by TF-IDF.
+
+        Terms missing from the vocabulary are ignored, and a unigram is
+        dropped when a selected n-gram already contains it.
+
+        Returns:
+            list: Keywords, best first
+        """
+        counts = Counter(iter_terms(text, max_n))
+        if not counts or not len(self.vocabulary):
+            return []
+
+        terms = np.array(list(counts), dtype=str)
+        positions = np.searchsorted(self.vocabulary, terms)
+        positions = np.minimum(positions, len(self.vocabulary) - 1)
+        known = self.vocabulary[positions] == terms
+        if not known.any():
+            return []
+
+        term_frequency = 1 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        scores = term_frequency[known] * self.idf[positions[known]]
+        candidates = terms[known]
+        # Stable sort on negated scores keeps ties in first-occurrence order
+        ranked = candidates[np.argsort(-scores, kind="stable")]
+
+        # Over-select so unigrams absorbed by a selected n-gram can be dropped
+        selected = [str(term) for term in ranked[:2 * limit]]
+        covered = {word for term in selected if " " in term for word in term.split(" ")}
+        keywords = [SKILL_EXTRACTOR.canonical_name(term) or _display_name(term)
+                    for term in selected if " " in term or term not in covered]
+        return keywords[:limit]
+
+
+def _display_name(term):
+    return " ".join(word if any(ch in word for ch in "+#./") else word.title() for word in term.split(" "))
+
@@ -1,56 +1,220 @@
 import json
-import re
 from collections import Counter
+from dataclasses import asdict, dataclass
+import numpy as np
+from resume_modifier.bm25 import BM25Relevance
+from resume_modifier.keyword_matcher import keyword_matcher
 from resume_modifier.llm_model import LLMModel
+from resume_modifier.scoring_context import ScoringContext
+
+
+# Bump when the resume-side scoring changes so stored features are recomputed
+FEATURES_VERSION = 1
+
+
+@dataclass(slots=True)
+class ResumeFeatures:
+    """
+    The part of a score that depends only on the resume.
+    
+    Format, content and ATS scores and the strengths and improvements
+    notes never look at the job description, so they are computed once per
+    resume and reused whenever it is scored against another job.
+    """
+    format_score: float
+    content_score: float
+    ats_score: float
+    strengths: list
+    improvements: list
+    
+    def to_json(self):
+        return json.dumps(asdict(self))
+    
+    @classmethod
+    def from_json(cls, data):
+        return cls(**json.loads(data))
 
 
 class ResumeScorer:
     """AI-powered resume scoring system"""
     
-    def __init__(self):
-        self.llm_model = LLMModel()
-        
-    def calculate_comprehensive_score(self, resume_data, job_description, keywords_matched):
+    def __init__(self, llm_model=None, context_cache=None, relevance_model=None):
+        # Share the app's model (and through it the process's OpenAI client)
+        self.llm_model = llm_model or LLMModel()
+        # Optional ScoringContextCache, reused when a resume is scored for several jobs
+        self.context_cache = context_cache
+        # BM25 relevance; without corpus statistics every word weighs the same
+        self.relevance_model = relevance_model or BM25Relevance()
+    
+    def scoring_context(self, resume_data):
+        """Return the resume-side ScoringContext, from the cache when one is configured"""
+        if self.context_cache is not None:
+            return self.context_cache.get(resume_data)
+        return ScoringContext.build(resume_data)
+        
+    def resume_features(self, context):
+        """Return the resume-side ResumeFeatures of a context, computing them on first use"""
+        if context.features is None:
+            context.features = ResumeFeatures(
+                format_score=self._calculate_format_score(context),
+                content_score=self._calculate_content_score(context),
+                ats_score=self._calculate_ats_compatibility(context),
+                strengths=self._identify_strengths(context),
+                improvements=self._suggest_improvements(context)
+            )
+        return context.features
+    
+    def calculate_comprehensive_score(self, resume_data, job_description, keywords_matched, context=None):
         """Calculate comprehensive AI-powered resume score"""
         try:
-            # Individual scoring components
-            keyword_score = self._calculate_keyword_score(resume_data, keywords_matched)
-            format_score = self._calculate_format_score(resume_data)
-            content_score = self._calculate_content_score(resume_data)
-            relevance_score = self._calculate_relevance_score(resume_data, job_description)
-            ats_score = self._calculate_ats_compatibility(resume_data)
+            # Text, tokens and section stats are computed once and shared by
+            # every component
+            context = context or self.scoring_context(resume_data)
+            return self.score_for_job(context, self.resume_features(context), job_description, keywords_matched)
             
-            # Weighted final score
-            final_score = (
-                keyword_score * 0.25 +      # 25% - Keyword matching
-                content_score * 0.25 +      # 25% - Content quality
-                relevance_score * 0.20 +    # 20% - Job relevance
-                format_score * 0.15 +       # 15% - Format structure
-                ats_score * 0.15            # 15% - ATS compatibility
-            )
+        except Exception as e:
+            return self._failed_score(e)
+    
+    def score_for_job(self, context, features, job_description, keywords_matched):
+        """
+        Run only the job-dependent scoring: keyword match and relevance.
+        
+        Args:
+            context (ScoringContext): The resume's scoring context
+            features (ResumeFeatures): The resume's stored or computed features
+            job_description (str): The job description text
+            keywords_matched (list | str): Keywords (or their JSON) to look for
             
-            return {
-                'overall_score': round(final_score, 1),
-                'keyword_score': round(keyword_score, 1),
-                'format_score': round(format_score, 1),
-                'content_score': round(content_score, 1),
-                'relevance_score': round(relevance_score, 1),
-                'ats_score': round(ats_score, 1),
-                'recommendations': self._generate_recommendations(
-                    keyword_score, format_score, content_score, relevance_score, ats_score
-                ),
-                'strengths': self._identify_strengths(resume_data),
-                'improvements': self._suggest_improvements(resume_data, job_description)
-            }
+        Returns:
+            dict: Score breakdown, as calculate_comprehensive_score returns it
+        """
+        keyword_score = self._calculate_keyword_score(context, keywords_matched)
+        relevance_score = self._calculate_relevance_score(context, job_description)
+        return self._score_breakdown(features, keyword_score, relevance_score)
+    
+    def calculate_job_scores(self, resume_data, jobs, context=None, features=None):
+        """
+        Score one resume against many job descriptions.
+        
+        The resume-side features are computed (or taken from features) once;
+        each job only adds its keyword and relevance scores.
+        
+        Args:
+            resume_data (dict | ResumeData): Resume to score
+            jobs (list): (job_description, keywords_matched) pairs
+            context (ScoringContext): The resume's context, if already built
+            features (ResumeFeatures): Stored features of the resume, if any
             
+        Returns:
+            list: Score breakdowns, aligned with jobs
+        """
+        try:
+            context = context or self.scoring_context(resume_data)
+            if features is not None and context.features is None:
+                context.features = features
+            features = self.resume_features(context)
         except Exception as e:
-            return {
-                'overall_score': 0.0,
-                'error': f"Scoring failed: {str(e)}",
-                'recommendations': ["Please try uploading your resume again."]
-            }
+            return [self._failed_score(e) for _ in jobs]
+        
+        results = []
+        for job_description, keywords_matched in jobs:
+            try:
+                results.append(self.score_for_job(context, features, job_description, keywords_matched))
+            except Exception as e:
+                results.append(self._failed_score(e))
+        return results
     
-    def _calculate_keyword_score(self, resume_data, keywords_matched):
+    def calculate_batch_scores(self, resumes, job_description, keywords_matched):
+        """
+        Score many resumes against one job description with matrix operations.
+        
+        The resumes' token counts are stacked into a sparse term-document
+        matrix and every component is computed for all of them at once.
+        Each breakdown is identical to calculate_comprehensive_score's.
+        
+        Args:
+            resumes (list): Resume dicts or ResumeData objects
+            job_description (str): The job description text
+            keywords_matched (list | str): Keywords (or their JSON) to look for
+            
+        Returns:
+            list: Score breakdowns, aligned with resumes
+        """
+        results = [None] * len(resumes)
+        contexts = []
+        positions = []
+        for index, resume_data in enumerate(resumes):
+            try:
+                contexts.append(self.scoring_context(resume_data))
+                positions.append(index)
+            except Exception as e:
+                results[index] = self._failed_score(e)
+        
+        if not contexts:
+            return results
+        
+        try:
+            keyword_scores = self._batch_keyword_scores(contexts, keywords_matched)
+            format_scores, content_scores, ats_scores = self._batch_section_scores(contexts)
+            relevance_scores = self._batch_relevance_scores(contexts, job_description)
+            
+            for row, index in enumerate(positions):
+                context = contexts[row]
+                if context.features is None:
+                    context.features = ResumeFeatures(
+                        format_score=float(format_scores[row]),
+                        content_score=float(content_scores[row]),
+                        ats_score=float(ats_scores[row]),
+                        strengths=self._identify_strengths(context),
+                        improvements=self._suggest_improvements(context)
+                    )
+                results[index] = self._score_breakdown(
+                    context.features, float(keyword_scores[row]), float(relevance_scores[row])
+                )
+        except Exception as e:
+            for index in positions:
+                results[index] = self._failed_score(e)
+        
+        return results
+    
+    def _score_breakdown(self, features, keyword_score, relevance_score):
+        """Combine the resume features and job scores into the weighted result"""
+        format_score = features.format_score
+        content_score = features.content_score
+        ats_score = features.ats_score
+        
+        # Weighted final score
+        final_score = (
+            keyword_score * 0.25 +      # 25% - Keyword matching
+            content_score * 0.25 +      # 25% - Content quality
+            relevance_score * 0.20 +    # 20% - Job relevance
+            format_score * 0.15 +       # 15% - Format structure
+            ats_score * 0.15            # 15% - ATS compatibility
+        )
+        
+        return {
+            'overall_score': round(final_score, 1),
+            'keyword_score': round(keyword_score, 1),
+            'format_score': round(format_score, 1),
+            'content_score': round(content_score, 1),
+            'relevance_score': round(relevance_score, 1),
+            'ats_score': round(ats_score, 1),
+            'recommendations': self._generate_recommendations(
+                keyword_score, format_score, content_score, relevance_score, ats_score
+            ),
+            'strengths': list(features.strengths),
+            'improvements': list(features.improvements)
+        }
+    
+    @staticmethod
+    def _failed_score(error):
+        return {
+            'overall_score': 0.0,
+            'error': f"Scoring failed: {str(error)}",
+            'recommendations': ["Please try uploading your resume again."]
+        }
+    
+    def _calculate_keyword_score(self, context, keywords_matched):
         """Calculate score based on keyword matching"""
         if not keywords_matched:
             return 0.0
@@ -60,12 +224,8 @@ class ResumeScorer:
             if not keywords:
                 return 0.0
                 
-            resume_text = self._extract_resume_text(resume_data).lower()
-            matched_count = 0
-            
-            for keyword in keywords:
-                if keyword.lower() in resume_text:
-                    matched_count += 1
+            # Keywords match as whole words, mostly by lookups in the context's tokens
+            matched_count = keyword_matcher(keywords).count(context.text, context.text_lower, context.tokens)
             
             match_percentage = (matched_count / len(keywords)) * 100
             
@@ -84,51 +244,52 @@ class ResumeScorer:
         except Exception:
             return 0.0
     
-    def _calculate_format_score(self, resume_data):
+    def _calculate_format_score(self, context):
         """Calculate score based on resume format and structure"""
         score = 0.0
+        sections = context.sections
         
         # Check for essential sections
-        if resume_data.get('summary'):
+        if sections.summary_length:
             score += 20
-        if resume_data.get('skills') and len(resume_data['skills']) > 0:
+        if sections.skills:
             score += 25
-        if resume_data.get('experience') and len(resume_data['experience']) > 0:
+        if sections.experience:
             score += 25
-        if resume_data.get('education') and len(resume_data['education']) > 0:
+        if sections.education:
             score += 15
-        if resume_data.get('contact'):
+        if sections.has_contact:
             score += 15
             
         return min(score, 100.0)
     
-    def _calculate_content_score(self, resume_data):
+    def _calculate_content_score(self, context):
         """Calculate score based on content quality"""
         score = 0.0
+        sections = context.sections
         
         # Summary quality
-        summary = resume_data.get('summary', '')
-        if summary:
-            if len(summary) >= 100:
+        summary_length = sections.summary_length
+        if summary_length:
+            if summary_length >= 100:
                 score += 20
-            elif len(summary) >= 50:
+            elif summary_length >= 50:
                 score += 15
             else:
                 score += 5
         
         # Skills count and variety
-        skills = resume_data.get('skills', [])
-        if len(skills) >= 10:
+        skills = sections.skills
+        if skills >= 10:
             score += 25
-        elif len(skills) >= 5:
+        elif skills >= 5:
             score += 20
-        elif len(skills) >= 3:
+        elif skills >= 3:
             score += 15
         
         # Experience depth
-        experience = resume_data.get('experience', [])
-        if experience:
-            avg_description_length = sum(len(exp.get('description', '')) for exp in experience) / len(experience)
+        if sections.experience:
+            avg_description_length = sections.avg_experience_description_length
             if avg_description_length >= 200:
                 score += 30
             elif avg_description_length >= 100:
@@ -137,76 +298,115 @@ class ResumeScorer:
                 score += 15
         
         # Projects (bonus points)
-        projects = resume_data.get('projects', [])
-        if projects:
-            score += min(len(projects) * 5, 25)
+        if sections.projects:
+            score += min(sections.projects * 5, 25)
         
         return min(score, 100.0)
     
-    def _calculate_relevance_score(self, resume_data, job_description):
-        """Calculate relevance to job description using AI"""
+    def _calculate_relevance_score(self, context, job_description):
+        """Calculate relevance to job description as normalized BM25"""
         if not job_description:
             return 75.0  # Default score when no job description
             
         try:
-            # Use AI to analyze relevance
-            resume_text = self._extract_resume_text(resume_data)
-            
-            # Simple relevance calculation based on common terms
-            job_words = set(re.findall(r'\b\w+\b', job_description.lower()))
-            resume_words = set(re.findall(r'\b\w+\b', resume_text.lower()))
-            
-            common_words = job_words.intersection(resume_words)
-            relevance_ratio = len(common_words) / len(job_words) if job_words else 0
-            
-            return min(relevance_ratio * 100, 100.0)
+            return self.relevance_model.score(context, job_description)
             
         except Exception:
             return 50.0
     
-    def _calculate_ats_compatibility(self, resume_data):
+    def _calculate_ats_compatibility(self, context):
         """Calculate ATS (Applicant Tracking System) compatibility score"""
         score = 100.0
-        
-        # Check for common ATS issues
-        resume_text = self._extract_resume_text(resume_data)
+        sections = context.sections
         
         # Penalize for special characters in excess
-        special_char_count = len(re.findall(r'[^\w\s]', resume_text))
-        if special_char_count > 50:
+        if context.special_char_count > 50:
             score -= 10
         
         # Check for consistent formatting
-        if not resume_data.get('contact'):
+        if not sections.has_contact:
             score -= 15
         
         # Reward for standard section names
-        standard_sections = ['summary', 'skills', 'experience', 'education']
-        for section in standard_sections:
-            if resume_data.get(section):
+        for present in (sections.summary_length, sections.skills, sections.experience, sections.education):
+            if present:
                 score += 5
         
         return max(score, 0.0)
     
-    def _extract_resume_text(self, resume_data):
-        """Extract all text from resume data"""
-        text_parts = []
-        
-        if resume_data.get('summary'):
-            text_parts.append(resume_data['summary'])
-        
-        if resume_data.get('skills'):
-            text_parts.extend(resume_data['skills'])
-        
-        if resume_data.get('experience'):
-            for exp in resume_data['experience']:
-                text_parts.append(exp.get('description', ''))
-        
-        if resume_data.get('projects'):
-            for project in resume_data['projects']:
-                text_parts.append(project.get('description', ''))
-        
-        return ' '.join(text_parts)
+    def _batch_keyword_scores(self, contexts, keywords_matched):
+        """Vectorized _calculate_keyword_score for many resumes"""
+        count = len(contexts)
+        if not keywords_matched:
+            return np.zeros(count)
+            
+        try:
+            keywords = json.loads(keywords_matched) if isinstance(keywords_matched, str) else keywords_matched
+            if not keywords:
+                return np.zeros(count)
+            
+            # One compiled matcher for the whole batch, used like the scalar path
+            matcher = keyword_matcher(keywords)
+            matched_count = np.fromiter((matcher.count(context.text, context.text_lower, context.tokens)
+                                         for context in contexts),
+                                        dtype=np.int64, count=count)
+            
+            match_percentage = (matched_count / len(keywords)) * 100
+            return np.select(
+                [match_percentage >= 80, match_percentage >= 60, match_percentage >= 40, match_percentage >= 20],
+                [95.0, 85.0, 70.0, 55.0],
+                30.0
+            )
+            
+        except Exception:
+            return np.zeros(count)
+    
+    def _batch_relevance_scores(self, contexts, job_description):
+        """Vectorized _calculate_relevance_score: BM25 term-document matrix times the JD vector"""
+        count = len(contexts)
+        if not job_description:
+            return np.full(count, 75.0)
+            
+        try:
+            return self.relevance_model.score_many(contexts, job_description)
+            
+        except Exception:
+            return np.full(count, 50.0)
+    
+    def _batch_section_scores(self, contexts):
+        """Vectorized format, content and ATS scores from the section stats"""
+        sections = [context.sections for context in contexts]
+        summary_length = np.array([stats.summary_length for stats in sections])
+        skills = np.array([stats.skills for stats in sections])
+        experience = np.array([stats.experience for stats in sections])
+        projects = np.array([stats.projects for stats in sections])
+        education = np.array([stats.education for stats in sections])
+        has_contact = np.array([stats.has_contact for stats in sections], dtype=bool)
+        avg_description_length = np.array([stats.avg_experience_description_length for stats in sections])
+        special_char_count = np.array([context.special_char_count for context in contexts])
+        
+        format_scores = np.minimum(
+            20.0 * (summary_length > 0) + 25.0 * (skills > 0) + 25.0 * (experience > 0)
+            + 15.0 * (education > 0) + 15.0 * has_contact,
+            100.0
+        )
+        
+        content_scores = (
+            np.select([summary_length >= 100, summary_length >= 50, summary_length > 0], [20.0, 15.0, 5.0], 0.0)
+            + np.select([skills >= 10, skills >= 5, skills >= 3], [25.0, 20.0, 15.0], 0.0)
+            + np.where(experience > 0,
+                       np.select([avg_description_length >= 200, avg_description_length >= 100,
+                                  avg_description_length >= 50], [30.0, 25.0, 15.0], 0.0),
+                       0.0)
+            + np.where(projects > 0, np.minimum(projects * 5, 25), 0)
+        )
+        content_scores = np.minimum(content_scores, 100.0)
+        
+        standard_sections = (summary_length > 0).astype(int) + (skills > 0) + (experience > 0) + (education > 0)
+        ats_scores = 100.0 - 10.0 * (special_char_count > 50) - 15.0 * ~has_contact + 5.0 * standard_sections
+        ats_scores = np.maximum(ats_scores, 0.0)
+        
+        return format_scores, content_scores, ats_scores
     
     def _generate_recommendations(self, keyword_score, format_score, content_score, relevance_score, ats_score):
         """Generate improvement recommendations based on scores"""
@@ -232,41 +432,40 @@ class ResumeScorer:
         
         return recommendations
     
-    def _identify_strengths(self, resume_data):
+    def _identify_strengths(self, context):
         """Identify resume strengths"""
         strengths = []
+        sections = context.sections
         
-        if resume_data.get('summary') and len(resume_data['summary']) > 100:
+        if sections.summary_length > 100:
             strengths.append("Strong professional summary")
         
-        if len(resume_data.get('skills', [])) >= 8:
+        if sections.skills >= 8:
             strengths.append("Comprehensive skills section")
         
-        if len(resume_data.get('experience', [])) >= 3:
+        if sections.experience >= 3:
             strengths.append("Solid work experience")
         
-        if resume_data.get('projects'):
+        if sections.projects:
             strengths.append("Relevant project experience")
         
         return strengths or ["Resume shows potential for improvement"]
     
-    def _suggest_improvements(self, resume_data, job_description):
+    def _suggest_improvements(self, context):
         """Suggest specific improvements"""
         improvements = []
+        sections = context.sections
         
-        if not resume_data.get('summary'):
+        if not sections.summary_length:
             improvements.append("Add a professional summary at the top")
         
-        if len(resume_data.get('skills', [])) < 5:
+        if sections.skills < 5:
             improvements.append("Include more relevant technical and soft skills")
         
-        if not resume_data.get('projects'):
+        if not sections.projects:
             improvements.append("Add relevant projects to showcase your abilities")
         
-        experience = resume_data.get('experience', [])
-        if experience:
-            short_descriptions = [exp for exp in experience if len(exp.get('description', '')) < 100]
-            if short_descriptions:
-                improvements.append("Expand experience descriptions with specific achievements")
+        if sections.short_experience_descriptions:
+            improvements.append("Expand experience descriptions with specific achievements")
         
         return improvements or ["Consider tailoring content more specifically to this role"]
\ No newline at end of file
@@ -0,0 +1,59 @@
+import pytest
+
+from resume_modifier.keyword_matcher import KeywordMatcher, keyword_matcher
+from resume_modifier.resume_formatter import ResumeFormatter
+from resume_modifier.scoring_context import ScoringContext
+from resume_scoring import ResumeScorer
+
+
+@pytest.mark.parametrize("keywords, text, expected", [
+    (["Go"], "Delivered good results", set()),
+    (["Go"], "Built services in Go", {"go"}),
+    (["AI"], "Helped maintain the platform", set()),
+    (["AI"], "Shipped AI tooling", {"ai"}),
+    (["REST"], "Designed RESTful services", set()),
+    (["REST"], "Designed REST APIs", {"rest"}),
+    (["Machine Learning"], "Applied machine\n  learning to search", {"machine learning"}),
+    (["Machine Learning"], "machinelearning", set()),
+    (["C", "C++", "C#"], "Expert in C++ and C#", {"c++", "c#"}),
+    (["C"], "Expert in C++", set()),
+    (["C", "C++"], "Wrote C, later C++", {"c", "c++"}),
+])
+def test_word_boundary_matches(keywords, text, expected):
+    assert KeywordMatcher(keywords).find(text) == expected
+
+
+def test_case_sensitive_terms_need_their_capitalization():
+    assert KeywordMatcher(["Go", "AI"]).find("we go further, ai aside") == set()
+
+
+def test_matched_and_count_keep_keyword_order_and_duplicates():
+    matcher = KeywordMatcher(["python", "Java", "Python"])
+    assert matcher.matched("Python, Java") == ["python", "Java", "Python"]
+    assert matcher.count("Python only") == 2
+
+
+def test_scorer_keyword_score_agrees_with_matcher():
+    scorer = ResumeScorer()
+    keywords = ["Go", "AI", "C", "Machine Learning"]
+    false_hits = {"summary": "Good at maintaining C++ and C# systems", "skills": ["Communication"]}
+    true_hits = {"summary": "Go and AI engineer writing C", "skills": ["Machine Learning"]}
+
+    for resume, expected_count in ((false_hits, 0), (true_hits, 4)):
+        context = ScoringContext.build(resume)
+        assert keyword_matcher(keywords).count(context.text) == expected_count
+    scores = [scorer._calculate_keyword_score(ScoringContext.build(resume), keywords)
+              for resume in (false_hits, true_hits)]
+    assert scores == [30.0, 95.0]
+    batch = scorer._batch_keyword_scores([ScoringContext.build(false_hits), ScoringContext.build(true_hits)],
+                                         keywords)
+    assert batch.tolist() == scores
+
+
+def test_formatter_skills_agree_with_matcher():
+    formatter = ResumeFormatter()
+    skills = formatter._enhance_skills(["Good communication", "C++", "Maintainability"], ["Go", "AI", "C", "C++"])
+    # None of the requirements but C++ is named by a skill, so the rest are added
+    assert set(skills) == {"Good communication", "C++", "Maintainability", "Go", "AI", "C"}
+    assert skills.index("Good communication") > skills.index("C++")
+    assert formatter._enhance_skills(["Go", "AI"], ["Go", "AI"]) == ["Go", "AI"]